@@ -0,0 +1,199 @@
+import numpy as np
+from .model_trainer import iterate
+
+SIDES = ('dry', 'wet')
+
+# Cells per side of the square tiles whose convergence is tracked
+DEFAULT_TILE_SIZE = 16
+
+# Sweeps between two evaluations of the tile changes, which decide the frozen tiles
+DEFAULT_PLAN_INTERVAL = 25
+
+# Partial sweeps between two sweeps over the whole domain, which re-verify the frozen tiles
+DEFAULT_VERIFY_INTERVAL = 500
+
+# Fraction of the convergence threshold below which the change of a tile freezes it
+DEFAULT_FREEZE_FACTOR = 0.1
+
+# Cells updated in the time of the fixed overhead of one `model_trainer.iterate` call
+# (about 140 us against 70 ns per cell), used to weigh splitting the active cells
+ITERATE_OVERHEAD_CELLS = 2000
+
+
+class ActiveSet:
+    """
+    Restricts the solver iterations to the regions of the domain that still change.
+
+    The dry stream flows along the columns and the wet stream along the rows, so a
+    cell only depends on the cell before it in either direction and the domain
+    converges from the inlet corner outwards. The change of every tile of
+    `tile_size` cells is evaluated every `plan_interval` sweeps, and tiles that
+    changed less than `freeze_factor` times the convergence threshold are frozen
+    once every tile upstream of them is frozen too. Sweeps then only update the
+    remaining cells, with the frozen row above and column left of them as
+    boundary, exactly like the full iteration.
+
+    Every `verify_interval` partial sweeps, and whenever the partial sweep has
+    reached the convergence threshold, the whole domain is swept again, which
+    unfreezes tiles that changed and makes the final convergence error cover the
+    whole domain.
+    """
+
+    def __init__(self, tile_size: int = DEFAULT_TILE_SIZE,
+                 plan_interval: int = DEFAULT_PLAN_INTERVAL,
+                 verify_interval: int = DEFAULT_VERIFY_INTERVAL,
+                 freeze_factor: float = DEFAULT_FREEZE_FACTOR):
+        """
+        Initializes the active set.
+
+        Args:
+            tile_size (int): Cells per side of the tracked tiles.
+            plan_interval (int): Sweeps between two evaluations of the tile changes.
+            verify_interval (int): Partial sweeps between two sweeps over the whole domain.
+            freeze_factor (float): Fraction of the convergence threshold below which tiles freeze.
+
+        Raises:
+            ValueError: If a setting is not positive.
+        """
+        if min(tile_size, plan_interval, verify_interval) < 1 or freeze_factor <= 0:
+            raise ValueError("Active set settings must be positive")
+        self.tile_size = tile_size
+        self.plan_interval = plan_interval
+        self.verify_interval = verify_interval
+        self.freeze_factor = freeze_factor
+        self.reset()
+
+    def reset(self):
+        """Unfreezes the whole domain, before a new solve."""
+        self.cell_changes = None
+        self.slabs = None
+        self._plans = {}
+        self.partial_sweeps = 0
+        self.verify = False
+        self.sweeps = 0
+        self.cell_updates = 0
+
+    @property
+    def active_fraction(self) -> float:
+        """Mean fraction of the cells updated per sweep so far."""
+        if not self.sweeps:
+            return 1.0
+        return self.cell_updates / (self.sweeps * self.cell_changes.size)
+
+    def _plan(self, convergence_threshold: float) -> list:
+        """
+        Splits the active cells into the slabs updated by one iteration call each.
+
+        Consecutive tile rows are grouped so that the cells updated, counting every
+        call as `ITERATE_OVERHEAD_CELLS`, are fewest. A group starts at the first
+        active column of its last row, as the active columns only grow downwards.
+
+        Returns:
+        - The (first row, end row, first column) of each slab, or None if no tile is frozen.
+        """
+        size = self.cell_changes.shape[0]
+        starts = np.arange(0, size, self.tile_size)
+        tile_changes = np.maximum.reduceat(
+            np.maximum.reduceat(self.cell_changes, starts, axis=0), starts, axis=1)
+        frozen = tile_changes < self.freeze_factor * convergence_threshold
+        # A tile stays active while a tile upstream of it is active
+        frozen = np.logical_and.accumulate(frozen, axis=0)
+        frozen = np.logical_and.accumulate(frozen, axis=1)
+        start_columns = tuple(np.minimum(np.sum(frozen, axis=1) * self.tile_size, size).tolist())
+        if not any(start_columns):
+            return None
+        if start_columns in self._plans:
+            return self._plans[start_columns]
+
+        rows = [(tile_row * self.tile_size, column)
+                for tile_row, column in enumerate(start_columns) if column < size]
+        ends = [row for row, _ in rows[1:]] + [size]
+        # costs[last]: fewest cells for the tile rows before last, and where their last group starts
+        costs = [(0, None)]
+        for last in range(len(rows)):
+            costs.append(min(
+                (costs[first][0] + ITERATE_OVERHEAD_CELLS +
+                 (ends[last] - rows[first][0]) * (size - rows[last][1]), first)
+                for first in range(last + 1)
+            ))
+        slabs = []
+        last = len(rows)
+        while last:
+            first = costs[last][1]
+            slabs.append((rows[first][0], ends[last - 1], rows[last - 1][1]))
+            last = first
+        self._plans[start_columns] = slabs[::-1]
+        return self._plans[start_columns]
+
+    def sweep(
+            self, humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+            specific_volume_matrix, channel_flow, mesh,
+            heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor, convergence_threshold):
+        """
+        Performs one solver iteration over the active cells, see `model_trainer.iterate`.
+
+        Returns:
+        - The updated humidity ratio, enthalpy and temperature matrices, the convergence
+          error of the updated cells and whether the sweep covered the whole domain.
+        """
+        size = enthalpy_matrix['dry'].shape[0]
+        if self.cell_changes is None:
+            self.cell_changes = np.full((size, size), np.inf)
+        self.sweeps += 1
+        track = self.verify or self.sweeps % self.plan_interval == 0
+
+        if self.slabs is None or self.verify or self.partial_sweeps >= self.verify_interval:
+            humidity_ratio_matrix, enthalpy_matrix, temperature_matrix, absolute_changes = iterate(
+                humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+                specific_volume_matrix, channel_flow, mesh,
+                heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor
+            )
+            self.cell_updates += size * size
+            self.partial_sweeps = 0
+            self.verify = False
+            if track:
+                self.cell_changes = np.maximum.reduce(list(absolute_changes.values()))
+                self.slabs = self._plan(convergence_threshold)
+            return (
+                humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+                np.max(list(absolute_changes.values())), True
+            )
+
+        # The slabs of the fields updated in place are copied before any slab is
+        # updated, so all of them see the fields of the last sweep
+        fields = (humidity_ratio_matrix, enthalpy_matrix, temperature_matrix)
+        slabs = [
+            (row, end, column, [
+                {side: matrix[side][max(row - 1, 0):end, max(column - 1, 0):] for side in SIDES}
+                for matrix in fields
+            ])
+            for row, end, column in self.slabs
+        ]
+        for _, _, _, slab_fields in slabs:
+            for matrix in slab_fields[:2]:
+                for side in SIDES:
+                    matrix[side] = matrix[side].copy()
+
+        convergence_error = 0.0
+        for row, end, column, slab_fields in slabs:
+            (*slab_fields, absolute_changes) = iterate(
+                *slab_fields, specific_volume_matrix, channel_flow, mesh,
+                heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor
+            )
+            # Write back all but the boundary row and column
+            halo_row, halo_column = int(row > 0), int(column > 0)
+            for matrix, slab_matrix in zip(fields, slab_fields):
+                for side in SIDES:
+                    matrix[side][row:end, column:] = slab_matrix[side][halo_row:, halo_column:]
+            changes = [change[halo_row:, halo_column:] for change in absolute_changes.values()]
+            convergence_error = max(convergence_error, max(np.max(change) for change in changes))
+            if track:
+                self.cell_changes[row:end, column:] = np.maximum.reduce(changes)
+            self.cell_updates += (end - row) * (size - column)
+
+        self.partial_sweeps += 1
+        if track:
+            self.slabs = self._plan(convergence_threshold)
+        # Verify the frozen tiles as soon as the rest has converged
+        self.verify = convergence_error <= convergence_threshold
+        return humidity_ratio_matrix, enthalpy_matrix, temperature_matrix, convergence_error, False
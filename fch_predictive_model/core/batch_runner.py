@@ -0,0 +1,124 @@
+import copy
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .model import DEFAULT_CONFIG_PATH, FCHPerformanceModel, normalize_product_model
+
+# Keys describing one operating point, matching the FCHPerformanceModel arguments
+OPERATING_POINT_KEYS = (
+    'product_model', 'layer_count', 'life_cycle', 'mass_flow_rates',
+    'temperatures', 'relative_humidities', 'pressures'
+)
+
+# Optional operating point key holding a configuration overlay (see `load_config`)
+CONFIG_OVERRIDES_KEY = 'config_overrides'
+
+
+def copy_operating_point(point: dict) -> dict:
+    """
+    Copies an operating point, including its nested dictionaries.
+
+    Parameters:
+        point (dict): Operating point with the keys in `OPERATING_POINT_KEYS`.
+
+    Returns:
+        dict: Independent copy of the operating point.
+    """
+    return copy.deepcopy(point)
+
+
+def operating_point_key(point: dict) -> str:
+    """
+    Canonical key of an operating point, equal for points that solve identically.
+
+    The product model name is normalized, numbers are compared as floats and
+    dictionary order is ignored.
+
+    Parameters:
+        point (dict): Operating point with the keys in `OPERATING_POINT_KEYS` and an
+                      optional `CONFIG_OVERRIDES_KEY` entry.
+
+    Returns:
+        str: The key.
+    """
+    def canonical(value):
+        if isinstance(value, dict):
+            return {str(key): canonical(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [canonical(item) for item in value]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return value
+
+    point = dict(point, product_model=normalize_product_model(point['product_model']))
+    keys = OPERATING_POINT_KEYS + (CONFIG_OVERRIDES_KEY,)
+    return json.dumps({key: canonical(point.get(key)) for key in keys}, sort_keys=True)
+
+
+def build_model(point: dict, config_path: str = DEFAULT_CONFIG_PATH) -> FCHPerformanceModel:
+    """
+    Instantiates a model for an operating point.
+
+    Parameters:
+        point (dict): Operating point with the keys in `OPERATING_POINT_KEYS` and an
+                      optional `CONFIG_OVERRIDES_KEY` entry.
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        FCHPerformanceModel: Model ready to be solved.
+    """
+    return FCHPerformanceModel(
+        *(point[key] for key in OPERATING_POINT_KEYS), config_path=config_path,
+        config_overrides=point.get(CONFIG_OVERRIDES_KEY)
+    )
+
+
+def run_operating_point(point: dict, config_path: str = DEFAULT_CONFIG_PATH,
+                        initial_fields: dict = None) -> tuple:
+    """
+    Solves a single operating point, optionally warm-started.
+
+    Parameters:
+        point (dict): Operating point with the keys in `OPERATING_POINT_KEYS`.
+        config_path (str): Path to the configuration file.
+        initial_fields (dict): Fields of a previous solution of the same product to start from.
+
+    Returns:
+        tuple: The CompiledResult and the converged fields (see `FCHPerformanceModel.get_fields`).
+    """
+    model = build_model(point, config_path)
+    if initial_fields is not None:
+        model.warm_start(initial_fields)
+    results = model.compile_results()
+    return results, model.get_fields()
+
+
+def _run_operating_point_task(task: tuple) -> tuple:
+    return run_operating_point(*task)
+
+
+def run_operating_points(points: list, config_path: str = DEFAULT_CONFIG_PATH,
+                         initial_fields: list = None, max_workers: int = None) -> list:
+    """
+    Solves several operating points concurrently in a process pool.
+
+    Parameters:
+        points (list): Operating points with the keys in `OPERATING_POINT_KEYS`.
+        config_path (str): Path to the configuration file.
+        initial_fields (list): Optional warm-start fields per point (entries may be None).
+        max_workers (int): Number of worker processes; defaults to the CPU count.
+                           With a single worker the points are solved in-process.
+
+    Returns:
+        list: (CompiledResult, fields) tuples in the order of `points`.
+    """
+    if initial_fields is None:
+        initial_fields = [None] * len(points)
+    tasks = [(point, config_path, fields) for point, fields in zip(points, initial_fields)]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) <= 1:
+        return [_run_operating_point_task(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        return list(executor.map(_run_operating_point_task, tasks))
@@ -0,0 +1,155 @@
+import numpy as np
+from .model_trainer import iterate, update_relative_humidity
+
+SIDES = ('dry', 'wet')
+
+# Convergence error above which a point is considered diverged, as in `model_trainer.solve`
+DIVERGENCE_ERROR = 10 ** 6
+
+
+def batch_signature(model) -> tuple:
+    """
+    Identity of the models that can be solved together in one batch.
+
+    Models of a batch share the mesh, the field precision and the solver settings;
+    operating conditions and solver coefficients may differ.
+
+    Args:
+        model (FCHPerformanceModel): Model to be solved.
+
+    Returns:
+        tuple: Hashable signature.
+    """
+    return (
+        tuple(sorted(model.mesh.items())),
+        model.field_precision,
+        model.model_properties['relaxation_factor'],
+        model.model_properties['convergence_threshold'],
+        model.model_properties['max_iterations'],
+    )
+
+
+def solve_models(models: list) -> list:
+    """
+    Solves several models in lockstep on stacked (batch, n, n) fields.
+
+    Every iteration updates all unfinished models in one `model_trainer.iterate`
+    call, which amortizes the per-iteration overhead over
+    the batch. A model leaves the batch once it has converged (or diverged, or
+    reached the iteration limit), and its fields, solver information and results
+    are written back. Each model follows the same iterations as `model_trainer.solve`.
+
+    Args:
+        models (list): FCHPerformanceModel instances with equal `batch_signature`,
+                       possibly warm-started or resumed.
+
+    Returns:
+        list: The CompiledResult of each model, or None for models that did not converge
+              (see their `solver_info['stop_reason']`).
+
+    Raises:
+        ValueError: If the models cannot be solved in one batch.
+    """
+    if not models:
+        return []
+    first = models[0]
+    if any(batch_signature(model) != batch_signature(first) for model in models):
+        raise ValueError("Models of a batch must share the mesh, field precision and solver settings")
+
+    dtype = first.field_dtype
+    mesh = first.mesh
+    relax_factor = first.model_properties['relaxation_factor']
+    max_iterations = first.model_properties['max_iterations']
+
+    def stack(attribute: str) -> dict:
+        return {side: np.stack([getattr(model, attribute)[side] for model in models]) for side in SIDES}
+
+    def column(values) -> np.ndarray:
+        return np.array(values, dtype=dtype).reshape(-1, 1, 1)
+
+    humidity_ratio = stack('humidity_ratio_matrix')
+    enthalpy = stack('enthalpy_matrix')
+    temperature = stack('temperature_matrix')
+    coefficients = {
+        'specific_volume': {side: column([model.specific_volume_matrix[side] for model in models]) for side in SIDES},
+        'cell_flow': {side: column([model.cell_flow[side] for model in models]) for side in SIDES},
+        'heat_res_tot': column([model.heat_res_tot for model in models]),
+        'mas_res_tot': column([model.mas_res_tot for model in models]),
+        'life_cycle_factor': column([model.life_cycle_factor for model in models]),
+    }
+
+    # Convergence threshold of each model, raised to the resolution of the field type
+    # unless it is 0, see `model_trainer.solve`
+    threshold = first.model_properties['convergence_threshold']
+    largest_enthalpy = np.max(np.abs(np.concatenate([enthalpy[side] for side in SIDES], axis=1)), axis=(1, 2))
+    thresholds = np.full(len(models), float(threshold)) if threshold <= 0 else np.maximum(
+        threshold, float(np.finfo(dtype).eps) * largest_enthalpy / relax_factor)
+
+    active = np.arange(len(models))
+    iterations = np.array([model.start_iteration for model in models])
+    for model in models:
+        model.solver_info.setdefault('residual_history', [])
+    results = [None] * len(models)
+    first_iteration = True
+
+    while len(active):
+        humidity_ratio, enthalpy, temperature, absolute_changes = iterate(
+            humidity_ratio, enthalpy, temperature,
+            coefficients['specific_volume'], coefficients['cell_flow'], mesh,
+            coefficients['heat_res_tot'], coefficients['mas_res_tot'], coefficients['life_cycle_factor'],
+            relax_factor
+        )
+        errors = np.max([np.max(change, axis=(1, 2)) for change in absolute_changes.values()], axis=0)
+        iterations[active] += 1
+        if first_iteration:
+            for index, error in zip(active, errors):
+                models[index].solver_info['initial_error'] = float(error)
+            first_iteration = False
+
+        for position, index in enumerate(active):
+            if iterations[index] % 1000 == 0:
+                models[index].solver_info['residual_history'].append(
+                    (int(iterations[index]), float(errors[position])))
+
+        converged = errors <= thresholds[active]
+        finished = converged | (errors > DIVERGENCE_ERROR) | (iterations[active] >= max_iterations)
+        if not finished.any():
+            continue
+
+        for position in np.flatnonzero(finished):
+            index = active[position]
+            model = models[index]
+            fields = {
+                'humidity_ratio': {side: humidity_ratio[side][position].copy() for side in SIDES},
+                'enthalpy': {side: enthalpy[side][position].copy() for side in SIDES},
+                'temperature': {side: temperature[side][position].copy() for side in SIDES},
+            }
+            fields['relative_humidity'] = update_relative_humidity(
+                model.relative_humidity_matrix, fields['temperature'], fields['humidity_ratio'],
+                model.pressures)
+            model.set_solution(fields, bool(converged[position]))
+            model.solver_info.update({
+                'engine': 'batched',
+                'iterations': int(iterations[index]),
+                'convergence_error': float(errors[position]),
+                'convergence_threshold': float(thresholds[index]),
+                'converged': bool(converged[position]),
+                'stop_reason': 'converged' if converged[position] else (
+                    'diverged' if errors[position] > DIVERGENCE_ERROR else 'max_iterations'),
+            })
+            if converged[position]:
+                model.calculate_pressure_drop()
+                results[index] = model.compile_solution()
+
+        # Drop the finished models from the batch
+        keep = ~finished
+        active = active[keep]
+        humidity_ratio, enthalpy, temperature = (
+            {side: fields[side][keep] for side in SIDES}
+            for fields in (humidity_ratio, enthalpy, temperature)
+        )
+        for name, value in coefficients.items():
+            coefficients[name] = (
+                {side: value[side][keep] for side in SIDES} if isinstance(value, dict) else value[keep])
+
+    return results
@@ -0,0 +1,308 @@
+import csv
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, run_operating_points
+from .drive_cycle import CYCLE_COLUMNS
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import RESULT_COLUMNS, ResultTable
+from .sensitivity import get_input, set_input
+from ..utils.config_loader import load_config, merge_config
+
+# Columns of a measured dataset that identify the product of each row
+PRODUCT_COLUMNS = ('product_model', 'layer_count', 'life_cycle')
+
+# Parameters calibrated by default
+CALIBRATION_PARAMETERS = (
+    'membrane_properties.mass_transfer_resistance',
+    'membrane_properties.thermal_conductivity',
+    'life_cycle_factor',
+)
+
+# Calibrated factor of one life cycle stage, e.g. 'life_cycle_factor.EOL'
+LIFE_CYCLE_PARAMETER = 'life_cycle_factor'
+
+
+def point_from_row(row: dict) -> dict:
+    """
+    Builds an operating point from a flat row with the drive-cycle and product columns.
+
+    Parameters:
+        row (dict): Values of the `CYCLE_COLUMNS` and `PRODUCT_COLUMNS`, as strings or numbers.
+
+    Returns:
+        dict: Operating point with the keys in `batch_runner.OPERATING_POINT_KEYS`.
+
+    Raises:
+        ValueError: If a column is missing or not a number.
+    """
+    missing = (set(CYCLE_COLUMNS) | set(PRODUCT_COLUMNS)) - set(row)
+    if missing:
+        raise ValueError(f"Operating point is missing the columns: {sorted(missing)}")
+    life_cycle = row['life_cycle']
+    try:
+        # Continuous performance factors are given as numbers
+        life_cycle = float(life_cycle)
+    except ValueError:
+        pass
+    point = {
+        'product_model': row['product_model'],
+        'layer_count': int(row['layer_count']),
+        'life_cycle': life_cycle,
+    }
+    for column, (key, side) in CYCLE_COLUMNS.items():
+        point.setdefault(key, {})[side] = float(row[column])
+    return point
+
+
+def read_measurements(data_path: str, defaults: dict = None) -> tuple:
+    """
+    Reads measured bench operating points and outlet conditions.
+
+    Parameters:
+        data_path (str): CSV file with the `CYCLE_COLUMNS` operating conditions, optionally
+                         the `PRODUCT_COLUMNS`, and measured outputs named like
+                         ResultTable columns (e.g. 'dew_point_dry_outlet').
+        defaults (dict): Values of missing `PRODUCT_COLUMNS`.
+
+    Returns:
+        tuple: The operating points, see `point_from_row`, and the measured outputs
+               as {column: np.ndarray}.
+    """
+    defaults = defaults or {}
+    points = []
+    measured = {}
+    with open(data_path, 'r', newline='') as data_file:
+        reader = csv.DictReader(data_file)
+        columns = set(reader.fieldnames or ())
+        missing = (set(CYCLE_COLUMNS) | (set(PRODUCT_COLUMNS) - set(defaults))) - columns
+        if missing:
+            raise ValueError(f"Measured data is missing the columns: {sorted(missing)}")
+        targets = [name for name in RESULT_COLUMNS
+                   if name in columns and name not in CYCLE_COLUMNS]
+
+        for row in reader:
+            points.append(point_from_row(
+                {**row, **{column: row.get(column) or defaults.get(column) for column in PRODUCT_COLUMNS}}))
+            for name in targets:
+                measured.setdefault(name, []).append(
+                    float(row[name]) if row[name] not in ('', None) else np.nan)
+
+    return points, {name: np.array(values) for name, values in measured.items()}
+
+
+def expand_parameters(parameters: tuple, points: list) -> tuple:
+    """
+    Replaces 'life_cycle_factor' by the factor of every life cycle stage in the dataset.
+
+    Each stage is fitted separately, e.g. 'life_cycle_factor.BOL' and
+    'life_cycle_factor.EOL', so a dataset mixing stages does not share one factor.
+    Rows with a numeric life cycle keep their factor.
+
+    Parameters:
+        parameters (tuple): Parameter names.
+        points (list): Operating points of the dataset.
+
+    Returns:
+        tuple: The parameter names with the life cycle factor split by stage.
+
+    Raises:
+        ValueError: If the life cycle factor is fitted but no row has a life cycle stage.
+    """
+    stages = sorted({point['life_cycle'] for point in points
+                     if not isinstance(point['life_cycle'], (int, float))})
+    expanded = []
+    for name in parameters:
+        if name != LIFE_CYCLE_PARAMETER:
+            expanded.append(name)
+        elif not stages:
+            raise ValueError("No row has a life cycle stage to calibrate the life cycle factor of")
+        else:
+            expanded.extend(f'{LIFE_CYCLE_PARAMETER}.{stage}' for stage in stages)
+    return tuple(dict.fromkeys(expanded))
+
+
+def calibration_overlay(parameters: dict) -> dict:
+    """
+    Builds the configuration overlay holding calibrated parameters.
+
+    Parameters:
+        parameters (dict): Calibrated parameter values, with the life cycle factors
+                           per stage, see `expand_parameters`.
+
+    Returns:
+        dict: Overlay with the structure of the configuration file.
+    """
+    overlay = {}
+    for name, value in parameters.items():
+        section, key = name.split('.')
+        overlay = merge_config(overlay, {section: {key: value}})
+    return overlay
+
+
+def _setting(settings: dict, name: str):
+    """Setting of a parameter; those of 'life_cycle_factor' apply to every stage."""
+    settings = settings or {}
+    if name in settings:
+        return settings[name]
+    if name.startswith(LIFE_CYCLE_PARAMETER + '.'):
+        return settings.get(LIFE_CYCLE_PARAMETER)
+    return None
+
+
+def _initial_value(point: dict, config: dict, name: str) -> float:
+    section, _, key = name.partition('.')
+    if section == LIFE_CYCLE_PARAMETER:
+        return config[LIFE_CYCLE_PARAMETER][key]
+    return get_input(point, config, name)
+
+
+def _with_parameters(point: dict, names: tuple, values: np.ndarray) -> dict:
+    for name, value in zip(names, values):
+        section, _, key = name.partition('.')
+        if section != LIFE_CYCLE_PARAMETER:
+            point = set_input(point, name, float(value))
+        elif point['life_cycle'] == key:
+            # Only the rows of the stage; the stage is replaced by its factor
+            point = set_input(point, LIFE_CYCLE_PARAMETER, float(value))
+    return point
+
+
+def calibrate(points: list, measured: dict, parameters: tuple = CALIBRATION_PARAMETERS,
+              bounds: dict = None, initial: dict = None, weights: dict = None,
+              max_iterations: int = 20, tolerance: float = 1e-6, relative_step: float = 0.01,
+              config_path: str = DEFAULT_CONFIG_PATH, max_workers: int = None) -> dict:
+    """
+    Fits configuration parameters to measured data by bounded least squares.
+
+    Uses Levenberg-Marquardt on the residuals (model - measured) * weight of every
+    measured output and data row. In each iteration, all forward finite-difference
+    columns of the Jacobian are solved as one parallel batch over every data row,
+    each solve warm-started from the row's latest solution. Steps are clipped to
+    the bounds.
+
+    Parameters:
+        points (list): Operating points of the dataset.
+        measured (dict): Measured ResultTable columns; NaN entries are ignored.
+        parameters (tuple): Parameters to fit, see `sensitivity.SENSITIVITY_INPUTS`
+                            ('membrane_properties.*', 'air_properties.*', 'life_cycle_factor').
+                            The life cycle factor is fitted per stage, see `expand_parameters`.
+        bounds (dict): Optional parameter name to (lower, upper); bounds of 'life_cycle_factor'
+                       apply to every stage without bounds of its own.
+        initial (dict): Optional starting values; defaults to the configuration values.
+        weights (dict): Optional measured column to residual weight (e.g. 1 / uncertainty).
+        max_iterations (int): Maximum Levenberg-Marquardt iterations.
+        tolerance (float): Relative cost reduction below which the fit stops.
+        relative_step (float): Finite-difference step relative to the parameter value.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        dict: Calibrated 'parameters' (life cycle factors per stage), the configuration
+              'overlay' and fit 'diagnostics' (cost history, RMSE per output, residuals,
+              standard errors, solves).
+    """
+    parameters = expand_parameters(tuple(parameters), points)
+    weights = weights or {}
+    targets = tuple(measured)
+    bounds = [_setting(bounds, name) or (-np.inf, np.inf) for name in parameters]
+    lower = np.array([lower for lower, _ in bounds], dtype=float)
+    upper = np.array([upper for _, upper in bounds], dtype=float)
+
+    config = load_config(config_path, points[0].get(CONFIG_OVERRIDES_KEY))
+    values = np.array([
+        _setting(initial, name) if _setting(initial, name) is not None
+        else _initial_value(points[0], config, name)
+        for name in parameters
+    ], dtype=float)
+
+    observed = np.concatenate([measured[name] for name in targets])
+    weight = np.concatenate([np.full(len(points), weights.get(name, 1.0)) for name in targets])
+    valid = np.isfinite(observed)
+    fields = [None] * len(points)
+    solves = 0
+
+    def evaluate(parameter_sets: list) -> list:
+        """Solves every row for each parameter set; returns the residual vectors."""
+        nonlocal fields, solves
+        batch = [_with_parameters(point, parameters, parameter_set)
+                 for parameter_set in parameter_sets for point in points]
+        outcomes = run_operating_points(batch, config_path, fields * len(parameter_sets),
+                                        max_workers)
+        solves += len(batch)
+        if len(parameter_sets) == 1:
+            fields = [row_fields for _, row_fields in outcomes]
+
+        residuals = []
+        for index in range(len(parameter_sets)):
+            chunk = outcomes[index * len(points):(index + 1) * len(points)]
+            table = ResultTable.from_results([results for results, _ in chunk], rounded=False)
+            predicted = np.concatenate([table[name] for name in targets])
+            residuals.append(((predicted - observed) * weight)[valid])
+        return residuals
+
+    def jacobian_at(values: np.ndarray, residual: np.ndarray) -> np.ndarray:
+        """Forward finite-difference Jacobian, all columns solved in one batch."""
+        perturbed = [values + step * np.eye(len(parameters))[i] for i, step in enumerate(steps)]
+        columns = evaluate(perturbed)
+        return np.column_stack([(column - residual) / step for column, step in zip(columns, steps)])
+
+    steps = relative_step * np.where(values != 0, np.abs(values), 1.0)
+    damping = 1e-3
+    residual = evaluate([values])[0]
+    cost = float(residual @ residual)
+    history = [cost]
+    jacobian = None
+
+    for _ in range(max_iterations):
+        jacobian = jacobian_at(values, residual)
+
+        gradient = jacobian.T @ residual
+        normal = jacobian.T @ jacobian
+        improved = False
+        while damping < 1e10:
+            scaled = normal + damping * np.diag(np.diag(normal) + 1e-12)
+            candidate = np.clip(values - np.linalg.solve(scaled, gradient), lower, upper)
+            candidate_residual = evaluate([candidate])[0]
+            candidate_cost = float(candidate_residual @ candidate_residual)
+            if candidate_cost < cost:
+                improved = True
+                break
+            damping *= 10
+
+        if not improved:
+            break
+        reduction = (cost - candidate_cost) / max(cost, 1e-300)
+        values, residual, cost = candidate, candidate_residual, candidate_cost
+        jacobian = None
+        history.append(cost)
+        damping = max(damping / 10, 1e-7)
+        if reduction < tolerance:
+            break
+
+    # The standard errors linearize the model at the calibrated values
+    if jacobian is None:
+        jacobian = jacobian_at(values, residual)
+    degrees_of_freedom = max(residual.size - len(parameters), 1)
+    try:
+        covariance = np.linalg.inv(jacobian.T @ jacobian) * cost / degrees_of_freedom
+        standard_errors = np.sqrt(np.abs(np.diag(covariance)))
+    except np.linalg.LinAlgError:
+        standard_errors = np.full(len(parameters), np.nan)
+
+    full_residual = np.full(observed.size, np.nan)
+    full_residual[valid] = residual
+    row_residuals = {name: full_residual[i * len(points):(i + 1) * len(points)] / weights.get(name, 1.0)
+                     for i, name in enumerate(targets)}
+    calibrated = dict(zip(parameters, values.tolist()))
+
+    return {
+        'parameters': calibrated,
+        'overlay': calibration_overlay(calibrated),
+        'diagnostics': {
+            'cost_history': history,
+            'iterations': len(history) - 1,
+            'solves': solves,
+            'rmse': {name: float(np.sqrt(np.nanmean(r ** 2))) for name, r in row_residuals.items()},
+            'residuals': {name: r.tolist() for name, r in row_residuals.items()},
+            'standard_errors': dict(zip(parameters, standard_errors.tolist())),
+        },
+    }
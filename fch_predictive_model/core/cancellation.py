@@ -0,0 +1,21 @@
+import threading
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between a running solve and its caller.
+
+    The solver checks the flag once per iteration and stops with a partial,
+    unconverged result after it has been set. The token may be set from any thread.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Requests the solve to stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
@@ -0,0 +1,198 @@
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from .batch_runner import build_model
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import CompiledResult
+
+# Files of a sweep checkpoint directory
+MANIFEST_FILE = 'points.json'
+RESULTS_FILE = 'results.jsonl'
+SOLVER_STATE_FILE = 'point_{index}.npz'
+
+
+def pack_solver_state(state: dict) -> bytes:
+    """
+    Serializes a solver state to compressed .npz bytes.
+
+    Parameters:
+        state (dict): Solver state as passed to the `model_trainer.solve` checkpoint.
+
+    Returns:
+        bytes: The compressed state.
+    """
+    arrays = {
+        f'{quantity}_{side}': matrix
+        for quantity, matrices in state['fields'].items() for side, matrix in matrices.items()
+    }
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer, iteration=state['iteration'],
+        convergence_error=state['convergence_error'],
+        residual_history=np.array(state['residual_history'], dtype=float).reshape(-1, 2),
+        **arrays)
+    return buffer.getvalue()
+
+
+def unpack_solver_state(data: bytes) -> dict:
+    """
+    Reads a solver state serialized by `pack_solver_state`.
+
+    Parameters:
+        data (bytes): The compressed state.
+
+    Returns:
+        dict: Solver state suitable for `FCHPerformanceModel.resume`.
+    """
+    with np.load(io.BytesIO(data)) as arrays:
+        fields = {}
+        for name in arrays.files:
+            if name.startswith(('humidity_ratio_', 'enthalpy_')):
+                quantity, side = name.rsplit('_', 1)
+                fields.setdefault(quantity, {})[side] = arrays[name]
+        return {
+            'iteration': int(arrays['iteration']),
+            'convergence_error': float(arrays['convergence_error']),
+            'residual_history': [(int(i), e) for i, e in arrays['residual_history'].tolist()],
+            'fields': fields,
+        }
+
+
+def save_solver_state(path: str, state: dict):
+    """
+    Writes a solver state to a compressed .npz file.
+
+    The file is written next to its destination and then moved in place, so an
+    interrupted write never leaves a corrupt checkpoint behind.
+
+    Parameters:
+        path (str): Destination .npz file.
+        state (dict): Solver state as passed to the `model_trainer.solve` checkpoint.
+    """
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as state_file:
+        state_file.write(pack_solver_state(state))
+    os.replace(temporary_path, path)
+
+
+def load_solver_state(path: str) -> dict:
+    """
+    Reads a solver state written by `save_solver_state`.
+
+    Parameters:
+        path (str): The .npz file.
+
+    Returns:
+        dict: Solver state suitable for `FCHPerformanceModel.resume`, or None if there is none.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as state_file:
+        return unpack_solver_state(state_file.read())
+
+
+def _solve_checkpointed(index: int, point: dict, config_path: str, checkpoint_dir: str,
+                        checkpoint_interval: float) -> tuple:
+    """Solves one sweep point, resuming from and periodically saving its solver state."""
+    state_path = os.path.join(checkpoint_dir, SOLVER_STATE_FILE.format(index=index))
+    try:
+        model = build_model(point, config_path)
+        state = load_solver_state(state_path)
+        if state is not None:
+            model.resume(state)
+        model.enable_checkpoints(lambda state: save_solver_state(state_path, state),
+                                 checkpoint_interval)
+        return index, model.compile_results(), None
+    except ValueError as error:
+        return index, None, str(error)
+
+
+def _solve_checkpointed_task(task: tuple) -> tuple:
+    return _solve_checkpointed(*task)
+
+
+def run_sweep(points: list, checkpoint_dir: str, config_path: str = DEFAULT_CONFIG_PATH,
+              resume: bool = False, checkpoint_interval: float = 60.0,
+              max_workers: int = None) -> list:
+    """
+    Solves a sweep of operating points with checkpointing, so it can be resumed.
+
+    The directory holds the sweep's points, one line per finished point with its
+    compiled result (or error), and the in-flight solver state of every unfinished
+    point, saved at most every `checkpoint_interval` seconds. On resume, finished
+    points are skipped and partially converged points continue from their last
+    saved iteration.
+
+    Parameters:
+        points (list): Operating points with the keys in `batch_runner.OPERATING_POINT_KEYS`.
+        checkpoint_dir (str): Directory of the checkpoint files.
+        config_path (str): Path to the configuration file.
+        resume (bool): Continue the sweep saved in `checkpoint_dir` instead of starting over.
+        checkpoint_interval (float): Minimum wall-clock time between solver checkpoints in seconds.
+        max_workers (int): Number of worker processes; defaults to the CPU count.
+
+    Returns:
+        list: The CompiledResult of each point, or None for points that failed to converge.
+
+    Raises:
+        ValueError: If the checkpoint to resume belongs to different points.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    manifest_path = os.path.join(checkpoint_dir, MANIFEST_FILE)
+    results_path = os.path.join(checkpoint_dir, RESULTS_FILE)
+
+    results = [None] * len(points)
+    done = set()
+    if resume and os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as manifest_file:
+            if json.load(manifest_file) != json.loads(json.dumps(points)):
+                raise ValueError(f"Checkpoint in {checkpoint_dir} belongs to a different sweep")
+        if os.path.exists(results_path):
+            complete = 0  # Size of the complete lines
+            with open(results_path, 'rb') as results_file:
+                for line in results_file:
+                    if not line.endswith(b'\n'):
+                        break  # Incomplete last line of an interrupted write
+                    record = json.loads(line)
+                    if 'error' not in record:
+                        results[record['index']] = CompiledResult.from_record(record)
+                    done.add(record['index'])
+                    complete += len(line)
+            # Drop the incomplete line, so the records appended below start on a line of their own
+            os.truncate(results_path, complete)
+    else:
+        for name in os.listdir(checkpoint_dir):
+            if name in (MANIFEST_FILE, RESULTS_FILE) or name.startswith('point_'):
+                os.remove(os.path.join(checkpoint_dir, name))
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump(points, manifest_file)
+
+    tasks = [
+        (index, point, config_path, checkpoint_dir, checkpoint_interval)
+        for index, point in enumerate(points) if index not in done
+    ]
+
+    with open(results_path, 'a') as results_file:
+        def record(outcome: tuple):
+            index, result, error = outcome
+            results[index] = result
+            line = {'index': index, 'error': error} if result is None else {'index': index, **result.to_record()}
+            results_file.write(json.dumps(line) + '\n')
+            results_file.flush()
+            state_path = os.path.join(checkpoint_dir, SOLVER_STATE_FILE.format(index=index))
+            if os.path.exists(state_path):
+                os.remove(state_path)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                record(_solve_checkpointed_task(task))
+        else:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                futures = [executor.submit(_solve_checkpointed_task, task) for task in tasks]
+                for future in as_completed(futures):
+                    record(future.result())
+
+    return results
@@ -0,0 +1,184 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, build_model
+from .batch_solver import solve_models
+from .domain_initializer import field_dtype
+from .model import DEFAULT_CONFIG_PATH, normalize_product_model
+from .parameter_calculator import calculate_model_parameter
+from ..utils.config_loader import load_config
+
+# n x n buffers held per point while a chunk is solved (measured with tracemalloc):
+# the fields of the model and the stacked fields, updates and temporaries of the
+# batch solver in the field type, and the residuals in float64
+FIELD_BUFFERS = 26
+RESIDUAL_BUFFERS = 8
+
+# Per-worker working set of a chunk that keeps the batch solver in cache; larger
+# batches solved measurably fewer points per second
+DEFAULT_CACHE_BYTES = 16 * 2 ** 20
+
+# Smallest chunk worth batching when the cache holds fewer points
+MIN_CHUNK_SIZE = 4
+
+
+def working_set(mesh_size: int, precision: str = 'float64') -> int:
+    """
+    Estimates the memory needed per point while a chunk is solved.
+
+    Parameters:
+        mesh_size (int): Number of cells per side of the domain.
+        precision (str): Field precision, see `domain_initializer.field_dtype`.
+
+    Returns:
+        int: Working set in bytes.
+    """
+    itemsize = np.dtype(field_dtype(precision)).itemsize
+    return mesh_size ** 2 * (FIELD_BUFFERS * itemsize + RESIDUAL_BUFFERS * 8)
+
+
+def batch_key(point: dict, config_path: str = DEFAULT_CONFIG_PATH) -> tuple:
+    """
+    Finds the batch an operating point can be solved in, without building its model.
+
+    Parameters:
+        point (dict): Operating point with an optional `CONFIG_OVERRIDES_KEY` entry.
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        tuple: The batch key (points with equal keys share a `batch_solver.batch_signature`)
+               and the working set of the point in bytes.
+    """
+    config = load_config(config_path, point.get(CONFIG_OVERRIDES_KEY))
+    product_model = normalize_product_model(point['product_model'])
+    model_properties = config['model_properties']
+    resolution = (model_properties.get('mesh_resolution') or {}).get(product_model)
+    mesh, _ = calculate_model_parameter(config['channel_properties'][product_model], resolution)
+    precision = model_properties.get('field_precision', 'float64')
+
+    key = (product_model, mesh['model'], precision, model_properties['relaxation_factor'],
+           model_properties['convergence_threshold'], model_properties['max_iterations'])
+    return key, working_set(mesh['model'], precision)
+
+
+def plan_chunks(points: list, memory_budget: int, cache_bytes: int = DEFAULT_CACHE_BYTES,
+                config_path: str = DEFAULT_CONFIG_PATH) -> list:
+    """
+    Splits operating points into chunks solved as one batch each.
+
+    Points are grouped by batch key in order of appearance. A chunk holds as many
+    points as fit the memory budget, and no more than fit `cache_bytes`, unless
+    fewer than `MIN_CHUNK_SIZE` points fit the cache.
+
+    Parameters:
+        points (list): Operating points.
+        memory_budget (int): Memory available to one chunk in bytes.
+        cache_bytes (int): Cache-friendly working set of a chunk in bytes, or None
+                           to fill the memory budget.
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        list: Chunks as (indices, working set in bytes) tuples.
+
+    Raises:
+        ValueError: If a single point exceeds the memory budget.
+    """
+    groups = {}
+    for index, point in enumerate(points):
+        key, point_working_set = batch_key(point, config_path)
+        groups.setdefault(key, (point_working_set, []))[1].append(index)
+
+    chunks = []
+    for point_working_set, indices in groups.values():
+        size = memory_budget // point_working_set
+        if size < 1:
+            raise ValueError(
+                f"A point needs {point_working_set} bytes, more than the memory budget of "
+                f"{memory_budget} bytes")
+        if cache_bytes:
+            size = min(size, max(cache_bytes // point_working_set, MIN_CHUNK_SIZE))
+        for start in range(0, len(indices), size):
+            chunk = indices[start:start + size]
+            chunks.append((chunk, len(chunk) * point_working_set))
+    return chunks
+
+
+def _solve_chunk(points: list, config_path: str) -> tuple:
+    """Solves one chunk as a batch, returning the results, solver information and duration."""
+    start = time.perf_counter()
+    models = [build_model(point, config_path) for point in points]
+    results = solve_models(models)
+    return results, [model.solver_info for model in models], time.perf_counter() - start
+
+
+def _solve_chunk_task(task: tuple) -> tuple:
+    return _solve_chunk(*task)
+
+
+def run_chunked(points: list, memory_budget: int, cache_bytes: int = DEFAULT_CACHE_BYTES,
+                config_path: str = DEFAULT_CONFIG_PATH, max_workers: int = None) -> tuple:
+    """
+    Solves operating points in batches sized to a memory budget.
+
+    The budget is shared by the worker processes, each solving one chunk at a time
+    with `batch_solver.solve_models`.
+
+    Parameters:
+        points (list): Operating points with the keys in `batch_runner.OPERATING_POINT_KEYS`.
+        memory_budget (int): Memory available to the solvers of all workers in bytes.
+        cache_bytes (int): Cache-friendly working set of a chunk in bytes, see `plan_chunks`.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes; defaults to the CPU count.
+                           With a single worker the chunks are solved in-process.
+
+    Returns:
+        tuple: The CompiledResult of each point (None if it did not converge), the solver
+               information of each point and a report with the number of 'points', the
+               wall-clock 'seconds', the achieved 'points_per_second', the 'workers', the
+               per-worker 'memory_budget', the largest chunk 'working_set' and the
+               'chunks' with their 'size', 'working_set', 'seconds' and 'points_per_second'.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_budget = memory_budget // max_workers
+    chunks = plan_chunks(points, worker_budget, cache_bytes, config_path)
+    workers = max(1, min(max_workers, len(chunks)))
+
+    results = [None] * len(points)
+    solver_info = [None] * len(points)
+    chunk_reports = [None] * len(chunks)
+
+    def record(position: int, outcome: tuple):
+        indices, chunk_working_set = chunks[position]
+        chunk_results, chunk_info, seconds = outcome
+        for index, result, info in zip(indices, chunk_results, chunk_info):
+            results[index] = result
+            solver_info[index] = info
+        chunk_reports[position] = {
+            'size': len(indices), 'working_set': chunk_working_set, 'seconds': seconds,
+            'points_per_second': len(indices) / seconds if seconds else 0.0,
+        }
+
+    start = time.perf_counter()
+    tasks = [([points[index] for index in indices], config_path) for indices, _ in chunks]
+    if workers == 1:
+        for position, task in enumerate(tasks):
+            record(position, _solve_chunk_task(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_solve_chunk_task, task): position
+                       for position, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+    seconds = time.perf_counter() - start
+
+    report = {
+        'points': len(points),
+        'chunks': chunk_reports,
+        'seconds': seconds,
+        'points_per_second': len(points) / seconds if seconds else 0.0,
+        'workers': workers,
+        'memory_budget': worker_budget,
+        'working_set': max((chunk_working_set for _, chunk_working_set in chunks), default=0),
+    }
+    return results, solver_info, report
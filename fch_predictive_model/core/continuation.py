@@ -0,0 +1,112 @@
+from .batch_runner import build_model
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import ResultTable
+from .sensitivity import set_input
+
+
+def _extrapolate_fields(previous: dict, last: dict, ratio: float) -> dict:
+    """Linear extrapolation of the fields: last + ratio * (last - previous)."""
+    return {
+        quantity: {
+            side: last[quantity][side] + ratio * (last[quantity][side] - previous[quantity][side])
+            for side in last[quantity]
+        }
+        for quantity in last
+    }
+
+
+def _solve(point: dict, config_path: str, initial_fields: dict = None):
+    model = build_model(point, config_path)
+    if initial_fields is not None:
+        model.warm_start(initial_fields)
+    results = model.compile_results()
+    return results, model.get_fields(), model.solver_info
+
+
+def continuation(point: dict, parameter: str, start: float, stop: float, step: float,
+                 min_step: float = None, max_step: float = None,
+                 grow_below: float = 0.05, shrink_above: float = 0.2,
+                 config_path: str = DEFAULT_CONFIG_PATH) -> dict:
+    """
+    Natural-parameter continuation of the model along one input.
+
+    Walks `parameter` from `start` to `stop`. After the first two solutions, the
+    fields of the next point are predicted by linear extrapolation of the last two
+    converged solutions and then corrected by the solver. The step size adapts to
+    the difficulty of the correction, measured by the first-iteration residual
+    relative to the residual of the initial cold solve: below `grow_below` the step
+    grows by 50%, above `shrink_above` it is halved. A correction that fails to
+    converge is retried with half the step.
+
+    Parameters:
+        point (dict): Base operating point.
+        parameter (str): Input to vary, see `sensitivity.SENSITIVITY_INPUTS`,
+                         e.g. 'mass_flow_rates.dry' or 'life_cycle_factor'.
+        start (float): First value of the parameter.
+        stop (float): Last value of the parameter.
+        step (float): Initial step size (its sign is taken from the direction of the path).
+        min_step (float): Smallest step size; defaults to step / 64.
+        max_step (float): Largest step size; defaults to 8 * step.
+        grow_below (float): Relative residual below which the step grows.
+        shrink_above (float): Relative residual above which the step shrinks.
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        dict: Parameter 'values', the CompiledResult 'results' and 'solver_info' of each
+              point, the 'table' of all points and the number of 'rejected' steps.
+
+    Raises:
+        ValueError: If a step smaller than `min_step` still fails to converge.
+    """
+    direction = 1 if stop >= start else -1
+    step = abs(step)
+    min_step = abs(min_step) if min_step else step / 64
+    max_step = abs(max_step) if max_step else step * 8
+
+    results, fields, info = _solve(set_input(point, parameter, start), config_path)
+    reference_error = info['initial_error'] or 1.0
+
+    values, all_results, all_info = [start], [results], [info]
+    history = [(start, fields)]
+    rejected = 0
+
+    while direction * (stop - values[-1]) > 1e-12 * max(abs(stop), 1.0):
+        value = values[-1] + direction * min(step, abs(stop - values[-1]))
+
+        last_value, last_fields = history[-1]
+        if len(history) > 1:
+            previous_value, previous_fields = history[-2]
+            ratio = (value - last_value) / (last_value - previous_value)
+            predicted = _extrapolate_fields(previous_fields, last_fields, ratio)
+        else:
+            predicted = last_fields
+
+        try:
+            results, fields, info = _solve(
+                set_input(point, parameter, value), config_path, predicted)
+        except ValueError:
+            rejected += 1
+            step /= 2
+            if step < min_step:
+                raise ValueError(
+                    f"Continuation of {parameter} failed at {value}, step below {min_step}")
+            continue
+
+        values.append(value)
+        all_results.append(results)
+        all_info.append(info)
+        history = [history[-1], (value, fields)]
+
+        relative_error = info['initial_error'] / reference_error
+        if relative_error < grow_below:
+            step = min(step * 1.5, max_step)
+        elif relative_error > shrink_above:
+            step = max(step / 2, min_step)
+
+    return {
+        'values': values,
+        'results': all_results,
+        'solver_info': all_info,
+        'table': ResultTable.from_results(all_results),
+        'rejected': rejected,
+    }
@@ -1,18 +1,46 @@
 import numpy as np
 from ..utils.psychrometric_functions import (
     calculate_humidity_ratio, calculate_enthalpy,
-    calculate_specific_volume
+    calculate_specific_volume, calculate_temperature,
+    calculate_relative_humidity
 )
 
 # Constants
 DRY = 'dry'
 WET = 'wet'
 
+# Floating-point types of the solver fields by precision policy name
+FIELD_PRECISIONS = {
+    'float64': np.float64,
+    'float32': np.float32,
+}
+
+
+def field_dtype(precision: str) -> type:
+    """
+    Floating-point type of the solver fields for a precision policy.
+
+    Parameters:
+        precision (str): 'float64', or 'float32' to halve the memory of the fields.
+
+    Returns:
+        type: The numpy floating-point type.
+
+    Raises:
+        ValueError: If the precision is unknown.
+    """
+    if precision not in FIELD_PRECISIONS:
+        raise ValueError(
+            f"Unknown field precision {precision!r}, expected one of {sorted(FIELD_PRECISIONS)}")
+    return FIELD_PRECISIONS[precision]
+
+
 def initialize_domain_properties(
     mesh: dict, 
     temperatures: dict, 
     relative_humidities: dict, 
-    pressures: dict
+    pressures: dict,
+    dtype: type = np.float64
 ) -> tuple:
     """
     Initialize the domain properties such as humidity ratio, temperature,
@@ -23,6 +51,7 @@ def initialize_domain_properties(
         temperatures (dict): Dictionary containing temperature values for 'dry' and 'wet' conditions.
         relative_humidities (dict): Dictionary containing relative humidity values for 'dry' and 'wet' conditions.
         pressures (dict): Dictionary containing pressure values for 'dry' and 'wet' conditions.
+        dtype (type): Floating-point type of the field matrices, see `field_dtype`.
 
     Returns:
         tuple: Containing matrices for humidity ratio, temperature, relative humidity, 
@@ -42,17 +71,17 @@ def initialize_domain_properties(
         )
         inlet_humidity[condition] = inlet_humidity_temp
 
-        humidity_ratio_matrix[condition] = np.ones(
-            (mesh['model'], mesh['model'])
-        ) * inlet_humidity[condition]
+        humidity_ratio_matrix[condition] = np.full(
+            (mesh['model'], mesh['model']), inlet_humidity[condition], dtype=dtype
+        )
 
-        temperature_matrix[condition] = np.ones(
-            (mesh['model'], mesh['model'])
-        ) * temperatures[condition]
+        temperature_matrix[condition] = np.full(
+            (mesh['model'], mesh['model']), temperatures[condition], dtype=dtype
+        )
 
-        relative_humidity_matrix[condition] = np.ones(
-            (mesh['model'], mesh['model'])
-        ) * relative_humidities[condition]
+        relative_humidity_matrix[condition] = np.full(
+            (mesh['model'], mesh['model']), relative_humidities[condition], dtype=dtype
+        )
 
         enthalpy_matrix[condition] = calculate_enthalpy(
             temperature_matrix[condition], humidity_ratio_matrix[condition]
@@ -66,3 +95,68 @@ def initialize_domain_properties(
         humidity_ratio_matrix, temperature_matrix,
         relative_humidity_matrix, enthalpy_matrix, specific_volume_matrix
     )
+
+
+def warm_start_domain_properties(
+    mesh: dict,
+    temperatures: dict,
+    relative_humidities: dict,
+    pressures: dict,
+    fields: dict,
+    dtype: type = np.float64
+) -> tuple:
+    """
+    Initialize the domain properties from a previously converged solution.
+
+    The interior of the domain is taken from `fields`, while the inlet boundaries
+    (first column of the dry side and first row of the wet side) are reset to the
+    new inlet conditions, so the solver starts close to the new solution.
+
+    Parameters:
+        mesh (dict): The mesh configuration for the model.
+        temperatures (dict): Dictionary containing temperature values for 'dry' and 'wet' conditions.
+        relative_humidities (dict): Dictionary containing relative humidity values for 'dry' and 'wet' conditions.
+        pressures (dict): Dictionary containing pressure values for 'dry' and 'wet' conditions.
+        fields (dict): Previous solution with 'humidity_ratio' and 'enthalpy' matrices
+                       for 'dry' and 'wet' conditions.
+        dtype (type): Floating-point type of the field matrices; `fields` of another
+                      precision are converted.
+
+    Returns:
+        tuple: Containing matrices for humidity ratio, temperature, relative humidity,
+               enthalpy, and specific volume for 'dry' and 'wet' conditions.
+    """
+    (
+        humidity_ratio_matrix, temperature_matrix,
+        relative_humidity_matrix, enthalpy_matrix, specific_volume_matrix
+    ) = initialize_domain_properties(mesh, temperatures, relative_humidities, pressures, dtype)
+
+    for condition in [DRY, WET]:
+        if np.shape(fields['humidity_ratio'][condition]) != humidity_ratio_matrix[condition].shape:
+            raise ValueError(
+                "Warm-start fields do not match the model mesh, "
+                "they must come from the same product model and mesh resolution")
+
+        inlet = (slice(None), 0) if condition == DRY else (0, slice(None))
+
+        humidity_ratio = np.array(fields['humidity_ratio'][condition], dtype=dtype)
+        humidity_ratio[inlet] = humidity_ratio_matrix[condition][inlet]
+        humidity_ratio_matrix[condition] = humidity_ratio
+
+        enthalpy = np.array(fields['enthalpy'][condition], dtype=dtype)
+        enthalpy[inlet] = enthalpy_matrix[condition][inlet]
+        enthalpy_matrix[condition] = enthalpy
+
+        temperature_matrix[condition] = calculate_temperature(
+            enthalpy_matrix[condition], humidity_ratio_matrix[condition]
+        )
+
+        relative_humidity_matrix[condition] = calculate_relative_humidity(
+            temperature_matrix[condition], w=humidity_ratio_matrix[condition],
+            P=pressures[condition]
+        )
+
+    return (
+        humidity_ratio_matrix, temperature_matrix,
+        relative_humidity_matrix, enthalpy_matrix, specific_volume_matrix
+    )
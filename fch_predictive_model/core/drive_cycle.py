@@ -0,0 +1,118 @@
+import csv
+from .batch_runner import build_model
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import RESULT_COLUMNS, flatten_result
+
+# Drive-cycle file columns (named like the web form fields) and the operating
+# point entry each one sets
+CYCLE_COLUMNS = {
+    'mass_flow_dry': ('mass_flow_rates', 'dry'),
+    'mass_flow_wet': ('mass_flow_rates', 'wet'),
+    'temp_dry': ('temperatures', 'dry'),
+    'temp_wet': ('temperatures', 'wet'),
+    'humidity_dry': ('relative_humidities', 'dry'),
+    'humidity_wet': ('relative_humidities', 'wet'),
+    'pressure_dry': ('pressures', 'dry'),
+    'pressure_wet': ('pressures', 'wet'),
+}
+
+# Optional column with the timestamp of each step
+TIME_COLUMN = 'time'
+
+
+def read_drive_cycle(cycle_path: str):
+    """
+    Reads a drive-cycle CSV file one timestep at a time.
+
+    Parameters:
+        cycle_path (str): CSV file with a header containing the `CYCLE_COLUMNS`
+                          and optionally a `TIME_COLUMN`.
+
+    Yields:
+        tuple: The step time (or None) and the operating conditions of the step as
+               {'mass_flow_rates': {...}, 'temperatures': {...}, ...}.
+    """
+    with open(cycle_path, 'r', newline='') as cycle_file:
+        reader = csv.DictReader(cycle_file)
+        missing = set(CYCLE_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Drive cycle is missing the columns: {sorted(missing)}")
+
+        for row in reader:
+            conditions = {}
+            for column, (key, side) in CYCLE_COLUMNS.items():
+                conditions.setdefault(key, {})[side] = float(row[column])
+            time = row.get(TIME_COLUMN)
+            yield (float(time) if time not in (None, '') else None), conditions
+
+
+def simulate_drive_cycle(steps, product_model: str, layer_count: int, life_cycle,
+                         config_path: str = DEFAULT_CONFIG_PATH, config_overrides: dict = None):
+    """
+    Solves a sequence of timesteps as quasi-steady operating points.
+
+    Every step is warm-started from the converged fields of the previous step, and
+    a step whose conditions equal the previous ones reuses its result without solving.
+
+    Parameters:
+        steps (iterable): (time, conditions) tuples as yielded by `read_drive_cycle`.
+        product_model (str): Model of the product.
+        layer_count (int): Number of layers.
+        life_cycle (str): Life cycle stage.
+        config_path (str): Path to the configuration file.
+        config_overrides (dict): Optional configuration overlay.
+
+    Yields:
+        tuple: The step time and the CompiledResult of the step.
+    """
+    fields = None
+    previous_conditions = None
+    results = None
+
+    for time, conditions in steps:
+        if conditions != previous_conditions:
+            point = {
+                'product_model': product_model, 'layer_count': layer_count,
+                'life_cycle': life_cycle, 'config_overrides': config_overrides, **conditions
+            }
+            model = build_model(point, config_path)
+            if fields is not None:
+                model.warm_start(fields)
+            results = model.compile_results()
+            fields = model.get_fields()
+            previous_conditions = conditions
+        yield time, results
+
+
+def run_drive_cycle(cycle_path: str, output_file, product_model: str, layer_count: int,
+                    life_cycle, config_path: str = DEFAULT_CONFIG_PATH,
+                    config_overrides: dict = None) -> int:
+    """
+    Simulates a drive-cycle file and streams one CSV row per step to `output_file`.
+
+    Rows are written and flushed as soon as each step is solved, so long cycles
+    run in constant memory and partial output is available while the cycle runs.
+
+    Parameters:
+        cycle_path (str): Drive-cycle CSV file, see `read_drive_cycle`.
+        output_file: Writable text file object.
+        product_model (str): Model of the product.
+        layer_count (int): Number of layers.
+        life_cycle (str): Life cycle stage.
+        config_path (str): Path to the configuration file.
+        config_overrides (dict): Optional configuration overlay.
+
+    Returns:
+        int: Number of steps written.
+    """
+    writer = csv.DictWriter(output_file, fieldnames=(TIME_COLUMN,) + RESULT_COLUMNS)
+    writer.writeheader()
+
+    count = 0
+    for time, results in simulate_drive_cycle(
+            read_drive_cycle(cycle_path), product_model, layer_count, life_cycle,
+            config_path, config_overrides):
+        writer.writerow({TIME_COLUMN: time, **flatten_result(results)})
+        output_file.flush()
+        count += 1
+    return count
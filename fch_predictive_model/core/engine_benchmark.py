@@ -0,0 +1,52 @@
+from .batch_runner import build_model
+from .model import DEFAULT_CONFIG_PATH
+from .solver_engines import SOLVER_ENGINES, engine_features, shared_cost_model
+from ..utils.config_loader import load_config
+
+
+def benchmark_engines(points: list, engines: list = None, config_path: str = DEFAULT_CONFIG_PATH,
+                      cost_model=None) -> dict:
+    """
+    Solves operating points with every solver engine and records their cost.
+
+    The points are solved one after the other in this process, so the measured
+    times are not distorted by other solves sharing the CPU. Every solve is
+    recorded in the cost model used by the 'auto' engine.
+
+    Parameters:
+        points (list): Operating points with the keys in `batch_runner.OPERATING_POINT_KEYS`.
+        engines (list): Engines to benchmark; defaults to all registered ones.
+        config_path (str): Path to the configuration file.
+        cost_model (EngineCostModel): Cost model to record in; defaults to the shared
+                                      cost model of the 'engine_history' in the configuration.
+
+    Returns:
+        dict: The solve 'seconds' and 'iterations' per engine and point, and the
+              'fastest' engine per point.
+    """
+    engines = list(engines or SOLVER_ENGINES)
+    if cost_model is None:
+        cost_model = shared_cost_model(load_config(config_path)['model_properties'].get('engine_history'))
+
+    seconds = {engine: [] for engine in engines}
+    iterations = {engine: [] for engine in engines}
+    for point in points:
+        for engine in engines:
+            model = build_model(point, config_path)
+            model.train(engine=engine)
+            info = model.solver_info
+            cost_model.record(
+                engine,
+                engine_features(model.mesh['model'], model.mass_flow_rates,
+                                model.relative_humidities, model.life_cycle_factor),
+                info['solve_seconds'], info['iterations'], info['converged'],
+            )
+            seconds[engine].append(info['solve_seconds'])
+            iterations[engine].append(info['iterations'])
+
+    return {
+        'seconds': seconds,
+        'iterations': iterations,
+        'fastest': [min(engines, key=lambda engine: seconds[engine][index])
+                    for index in range(len(points))],
+    }
@@ -0,0 +1,205 @@
+import math
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, copy_operating_point, run_operating_points
+from .model import DEFAULT_CONFIG_PATH, normalize_product_model
+from .parameter_calculator import calculate_model_parameter
+from .results_compiler import ResultTable
+from ..utils.config_loader import load_config, merge_config
+
+# Allowed discretization error of each output, as ResultTable column names
+GRID_TOLERANCES = {
+    'DPAT': 0.25,
+    'relative_humidity_dry_outlet': 0.5,
+}
+
+
+def default_resolutions(channel_model: int, count: int = 5, ratio: float = 1.5,
+                        minimum: int = 8) -> list:
+    """
+    Mesh resolutions of a grid study, from the channel-based mesh downwards.
+
+    Parameters:
+        channel_model (int): Channel-based discretization of the product.
+        count (int): Maximum number of resolutions.
+        ratio (float): Approximate refinement ratio between successive resolutions.
+        minimum (int): Coarsest resolution.
+
+    Returns:
+        list: Distinct resolutions, finest first.
+    """
+    resolutions = []
+    for level in range(count):
+        resolution = max(round(channel_model / ratio ** level), minimum)
+        if resolution not in resolutions:
+            resolutions.append(resolution)
+    return resolutions
+
+
+def richardson_extrapolation(values: tuple, resolutions: tuple) -> tuple:
+    """
+    Richardson extrapolation of a quantity solved on three meshes.
+
+    The observed order of convergence is found by fixed-point iteration, which
+    allows non-constant refinement ratios (Celik et al., 2008).
+
+    Parameters:
+        values (tuple): Solutions on the three meshes, finest first.
+        resolutions (tuple): The three mesh resolutions, finest first.
+
+    Returns:
+        tuple: The extrapolated value and the observed order (NaN when undefined).
+    """
+    f1, f2, f3 = values
+    r21 = resolutions[0] / resolutions[1]
+    r32 = resolutions[1] / resolutions[2]
+    e21, e32 = f2 - f1, f3 - f2
+    if e21 == 0 or e32 == 0:
+        return f1, math.nan
+
+    sign = math.copysign(1.0, e32 / e21)
+    order, q = 1.0, 0.0
+    for _ in range(100):
+        previous = order
+        order = abs(math.log(abs(e32 / e21)) + q) / math.log(r21)
+        q = math.log((r21 ** order - sign) / (r32 ** order - sign))
+        if abs(order - previous) < 1e-10:
+            break
+
+    return (r21 ** order * f1 - f2) / (r21 ** order - 1), order
+
+
+def with_mesh_resolution(point: dict, resolution: int) -> dict:
+    """
+    Returns a copy of an operating point solved at the given mesh resolution.
+
+    Parameters:
+        point (dict): Operating point.
+        resolution (int): Number of cells per side of the domain.
+
+    Returns:
+        dict: The modified copy of the operating point.
+    """
+    point = copy_operating_point(point)
+    product_model = normalize_product_model(point['product_model'])
+    overlay = {'model_properties': {'mesh_resolution': {product_model: resolution}}}
+    point[CONFIG_OVERRIDES_KEY] = merge_config(point.get(CONFIG_OVERRIDES_KEY) or {}, overlay)
+    return point
+
+
+def mesh_overlay(study: dict) -> dict:
+    """
+    Builds the configuration overlay applying the recommended mesh resolutions.
+
+    Parameters:
+        study (dict): Result of `grid_convergence_study`.
+
+    Returns:
+        dict: Overlay with the structure of the configuration file.
+    """
+    return {'model_properties': {'mesh_resolution': {
+        product_model: product_study['recommended'] for product_model, product_study in study.items()
+    }}}
+
+
+def grid_convergence_study(points: list, tolerances: dict = GRID_TOLERANCES,
+                           resolutions: dict = None, config_path: str = DEFAULT_CONFIG_PATH,
+                           max_workers: int = None) -> dict:
+    """
+    Finds the coarsest mesh resolution of each product model that stays accurate.
+
+    Every operating point is solved at every resolution of its product model in one
+    parallel batch. The mesh-independent value of each output is estimated by
+    Richardson extrapolation of the three finest resolutions, and the recommended
+    resolution is the coarsest one whose outputs are within the tolerances of the
+    extrapolated values at all operating points of the product.
+
+    Parameters:
+        points (list): Operating points covering the range of interest; they may mix
+                       product models.
+        tolerances (dict): Output name (unrounded ResultTable column) to the allowed
+                           absolute discretization error; the keys define the outputs.
+        resolutions (dict): Optional product model to the resolutions to solve (at least
+                            three). Defaults to `default_resolutions` of the channel-based mesh.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        dict: Per product model the solved 'resolutions' (finest first), the output
+              'values' per resolution and point, the 'extrapolated' values and observed
+              'order' per point, the largest 'errors' per resolution, the 'recommended'
+              resolution and whether it is 'within_tolerance'.
+
+    Raises:
+        ValueError: If fewer than three resolutions are given for a product model.
+    """
+    config = load_config(config_path)
+    outputs = tuple(tolerances)
+    resolutions = resolutions or {}
+
+    product_points = {}
+    for point in points:
+        product_points.setdefault(normalize_product_model(point['product_model']), []).append(point)
+
+    product_resolutions = {}
+    for product_model in product_points:
+        if product_model in resolutions:
+            product_resolutions[product_model] = sorted(resolutions[product_model], reverse=True)
+        else:
+            mesh, _ = calculate_model_parameter(config['channel_properties'][product_model])
+            product_resolutions[product_model] = default_resolutions(mesh['channel_model'])
+        if len(product_resolutions[product_model]) < 3:
+            raise ValueError(
+                f"A grid study needs at least three resolutions, got "
+                f"{product_resolutions[product_model]} for {product_model}")
+
+    batch = [
+        with_mesh_resolution(point, resolution)
+        for product_model, group in product_points.items()
+        for resolution in product_resolutions[product_model]
+        for point in group
+    ]
+    outcomes = run_operating_points(batch, config_path, max_workers=max_workers)
+    table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+
+    study = {}
+    offset = 0
+    for product_model, group in product_points.items():
+        product_resolution = product_resolutions[product_model]
+        size = len(product_resolution) * len(group)
+        values = {
+            output: table[output][offset:offset + size].reshape(
+                len(product_resolution), len(group))
+            for output in outputs
+        }
+        offset += size
+
+        extrapolated, order = {}, {}
+        for output in outputs:
+            estimates = [
+                richardson_extrapolation(tuple(values[output][:3, index].tolist()),
+                                         product_resolution[:3])
+                for index in range(len(group))
+            ]
+            extrapolated[output] = np.array([estimate[0] for estimate in estimates])
+            order[output] = np.array([estimate[1] for estimate in estimates])
+
+        errors = {
+            output: np.max(np.abs(values[output] - extrapolated[output]), axis=1)
+            for output in outputs
+        }
+        accurate = [
+            resolution for index, resolution in enumerate(product_resolution)
+            if all(errors[output][index] <= tolerances[output] for output in outputs)
+        ]
+
+        study[product_model] = {
+            'resolutions': product_resolution,
+            'values': values,
+            'extrapolated': extrapolated,
+            'order': order,
+            'errors': errors,
+            'recommended': min(accurate) if accurate else product_resolution[0],
+            'within_tolerance': bool(accurate),
+        }
+
+    return study
@@ -0,0 +1,209 @@
+import os
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, copy_operating_point, run_operating_points
+from .model import DEFAULT_CONFIG_PATH, normalize_product_model
+from .pressure_drop_calculator import calculate_pressure_drop
+from ..utils.config_loader import load_config
+
+# Constants
+DRY = 'dry'
+WET = 'wet'
+
+# Whether a target on a result is a lower (+1) or an upper (-1) limit
+TARGET_DIRECTIONS = {
+    'DPAT': -1,
+    'water_recovery_ratio': 1,
+    'vapor_transport': 1,
+}
+
+
+def _meets_target(results, metric: str, target: float) -> bool:
+    if TARGET_DIRECTIONS[metric] > 0:
+        return results[metric] >= target
+    return results[metric] <= target
+
+
+def _pressure_drop_limits(max_pressure_drop) -> dict:
+    if max_pressure_drop is None or isinstance(max_pressure_drop, dict):
+        return max_pressure_drop
+    return {DRY: max_pressure_drop, WET: max_pressure_drop}
+
+
+def _within_pressure_drop(point: dict, press_drop_coeff: dict, limits: dict) -> tuple:
+    """
+    Checks the pressure drop of an operating point without solving it.
+
+    Returns:
+        tuple: Whether the limits are met, and the pressure drop for 'dry' and 'wet' conditions.
+    """
+    pressure_drop = {
+        side: calculate_pressure_drop(
+            point['mass_flow_rates'][side], point['layer_count'], press_drop_coeff[side])
+        for side in (DRY, WET)
+    }
+    if limits is None:
+        return True, pressure_drop
+    return all(pressure_drop[side] <= limits[side] for side in limits), pressure_drop
+
+
+def _candidates(feasible_end, infeasible_end, count: int, integer: bool) -> list:
+    values = np.linspace(infeasible_end, feasible_end, count + 2)[1:-1]
+    if integer:
+        values = np.unique(np.round(values).astype(int))
+        values = [int(v) for v in values if v not in (feasible_end, infeasible_end)]
+    return [v.item() if isinstance(v, np.generic) else v for v in values]
+
+
+def _section_search(apply, base_point: dict, metric: str, target: float, max_pressure_drop,
+                    feasible_end, infeasible_end, integer: bool, tolerance: float,
+                    config_path: str, max_workers: int) -> dict:
+    """
+    Parallel k-section search for the boundary between feasible and infeasible designs.
+
+    The feasibility of a design is assumed monotone in the design variable. In every
+    round one candidate per worker is placed inside the bracket and solved concurrently,
+    each warm-started from the closest design solved so far; the bracket is then narrowed
+    to the neighbouring pair of infeasible and feasible candidates.
+    """
+    config = load_config(config_path, base_point.get(CONFIG_OVERRIDES_KEY))
+    product_model = normalize_product_model(base_point['product_model'])
+    press_drop_coeff = config['pressure_drop_model'][product_model]
+    limits = _pressure_drop_limits(max_pressure_drop)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    trajectory = []
+    solved = {}
+
+    def evaluate(values):
+        """Evaluates a batch of design values; returns their feasibility."""
+        points = [apply(copy_operating_point(base_point), value) for value in values]
+        to_solve = []
+        for value, point in zip(values, points):
+            within_limits, pressure_drop = _within_pressure_drop(point, press_drop_coeff, limits)
+            if within_limits:
+                to_solve.append((value, point))
+            else:
+                trajectory.append({'value': value, 'feasible': False, 'solved': False,
+                                   'pressure_drop': pressure_drop, metric: None})
+
+        initial_fields = []
+        for value, _ in to_solve:
+            nearest = min(solved, key=lambda known: abs(known - value), default=None)
+            initial_fields.append(None if nearest is None else solved[nearest][1])
+
+        outcomes = run_operating_points(
+            [point for _, point in to_solve], config_path, initial_fields, max_workers)
+        for (value, _), (results, fields) in zip(to_solve, outcomes):
+            solved[value] = (results, fields)
+            trajectory.append({'value': value, 'feasible': _meets_target(results, metric, target),
+                               'solved': True, 'pressure_drop': results['pressure_drop'],
+                               metric: results[metric]})
+
+        feasibility = {entry['value']: entry['feasible'] for entry in trajectory}
+        return [feasibility[value] for value in values]
+
+    if not evaluate([feasible_end])[0]:
+        raise ValueError(
+            f"The {metric} target of {target} cannot be met within the search bounds")
+
+    while abs(feasible_end - infeasible_end) > tolerance:
+        values = _candidates(feasible_end, infeasible_end, max_workers, integer)
+        if not values:
+            break
+        # Candidates are ordered from the infeasible towards the feasible end
+        for value, feasible in zip(values, evaluate(values)):
+            if feasible:
+                feasible_end = value
+                break
+            infeasible_end = value
+
+    return {
+        'optimum': feasible_end,
+        'results': solved[feasible_end][0],
+        'trajectory': trajectory,
+        'solves': len(solved),
+    }
+
+
+def find_minimum_layer_count(point: dict, target: float, metric: str = 'DPAT',
+                             max_pressure_drop=None, bounds: tuple = (1, 1000),
+                             config_path: str = DEFAULT_CONFIG_PATH,
+                             max_workers: int = None) -> dict:
+    """
+    Finds the smallest stack meeting a performance target and a pressure-drop limit.
+
+    More layers lower both the DPAT and the pressure drop, so the search solves only
+    layer counts whose (cheap) pressure drop is already within the limit.
+
+    Parameters:
+        point (dict): Operating point; its 'layer_count' is ignored.
+        target (float): Target value of `metric`.
+        metric (str): Result to constrain, one of `TARGET_DIRECTIONS`.
+        max_pressure_drop (float or dict): Allowed pressure drop in kPa, either for both
+                                           sides or per side ('dry'/'wet').
+        bounds (tuple): Smallest and largest layer count considered.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of candidates solved concurrently per round.
+
+    Returns:
+        dict: 'optimum' layer count, its 'results', the evaluated 'trajectory' and
+              the number of 'solves'.
+
+    Raises:
+        ValueError: If the target cannot be met with the largest layer count.
+    """
+    def apply(candidate, layer_count):
+        candidate['layer_count'] = layer_count
+        return candidate
+
+    return _section_search(
+        apply, point, metric, target, max_pressure_drop,
+        feasible_end=bounds[1], infeasible_end=bounds[0] - 1, integer=True, tolerance=1,
+        config_path=config_path, max_workers=max_workers
+    )
+
+
+def find_maximum_flow(point: dict, target: float, metric: str = 'DPAT',
+                      max_pressure_drop=None, side: str = DRY, bounds: tuple = None,
+                      tolerance: float = 1e-3, config_path: str = DEFAULT_CONFIG_PATH,
+                      max_workers: int = None) -> dict:
+    """
+    Finds the largest mass flow a fixed stack can take while meeting a target.
+
+    Parameters:
+        point (dict): Operating point; the flow of `side` is the design variable.
+        target (float): Target value of `metric`.
+        metric (str): Result to constrain, one of `TARGET_DIRECTIONS`.
+        max_pressure_drop (float or dict): Allowed pressure drop in kPa, either for both
+                                           sides or per side ('dry'/'wet').
+        side (str): 'dry', 'wet', or 'both' to scale both flows together.
+        bounds (tuple): Smallest and largest flow in kg/s (for 'both', of the dry side).
+                        Defaults to 10% and 10 times the current flow.
+        tolerance (float): Width of the final bracket in kg/s.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of candidates solved concurrently per round.
+
+    Returns:
+        dict: 'optimum' flow in kg/s, its 'results', the evaluated 'trajectory' and
+              the number of 'solves'.
+
+    Raises:
+        ValueError: If the target cannot be met even with the smallest flow.
+    """
+    reference = point['mass_flow_rates'][DRY if side == 'both' else side]
+    if bounds is None:
+        bounds = (reference / 10, reference * 10)
+
+    def apply(candidate, flow):
+        if side == 'both':
+            for condition in (DRY, WET):
+                candidate['mass_flow_rates'][condition] *= flow / reference
+        else:
+            candidate['mass_flow_rates'][side] = flow
+        return candidate
+
+    return _section_search(
+        apply, point, metric, target, max_pressure_drop,
+        feasible_end=bounds[0], infeasible_end=bounds[1], integer=False, tolerance=tolerance,
+        config_path=config_path, max_workers=max_workers
+    )
@@ -1,14 +1,83 @@
-import yaml
-from .domain_initializer import initialize_domain_properties
-from .model_trainer import solve
+import os
+import time
+from .domain_initializer import (
+    field_dtype, initialize_domain_properties, warm_start_domain_properties
+)
 from .pressure_drop_calculator import calculate_pressure_drop
 from .parameter_calculator import (
-    calculate_channel_parameter, calculate_model_parameter,
+    calculate_cell_flow, calculate_channel_parameter, calculate_model_parameter,
     calculate_solver_parameters,
 )
-from .results_compiler import result_compiler
+from .results_compiler import CompiledResult, result_compiler
+from .solver_engines import (
+    AUTO_ENGINE, SOLVER_ENGINES, engine_features, shared_cost_model, validate_engine
+)
+from .stage_graph import StageGraph
+from ..utils.config_loader import load_config
 from ..utils.model_output import write_to_excel
 
+# Configuration shipped with the package
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.yaml')
+
+
+def normalize_product_model(product_model: str) -> str:
+    """
+    Normalizes the product model name to a standard format.
+
+    Args:
+        product_model (str): The raw product model name.
+
+    Returns:
+        str: The normalized product model name.
+    """
+    normalized_models = {
+        "ax150": "AX_150", "ax-150": "AX_150", "ax 150": "AX_150", "ax_150": "AX_150",
+        "ax100": "AX_100", "ax-100": "AX_100", "ax 100": "AX_100", "ax_100": "AX_100"
+    }
+    return normalized_models.get(product_model.lower(), product_model)
+
+
+def _input_property(name: str, stage: str = None) -> property:
+    """Attribute set as an input of the stage graph, and read from it or from the stage resolving it."""
+    return property(lambda self: self._graph.get(stage or name),
+                    lambda self, value: self._graph.set(name, value))
+
+
+def _stage_property(name: str, index: int = None) -> property:
+    """Read-only attribute holding a stage of the stage graph, or one element of it."""
+    if index is None:
+        return property(lambda self: self._graph.get(name))
+    return property(lambda self: self._graph.get(name)[index])
+
+
+def _field_property(name: str) -> property:
+    """Solver field of the solution stage; assigning it replaces the field in the solution."""
+    def set_field(self, value):
+        self._graph.provide('solution', {**self._graph.get('solution'), name: value})
+    return property(lambda self: self._graph.get('solution')[name], set_field)
+
+
+def _life_cycle_factor(config: dict, life_cycle) -> float:
+    if isinstance(life_cycle, (int, float)):
+        return life_cycle
+    return config['life_cycle_factor'][life_cycle]
+
+
+def _initial_solution(model_parameters: tuple, temperatures: dict, relative_humidities: dict,
+                      pressures: dict, dtype: type, *solver_inputs) -> dict:
+    """
+    Unsolved fields of the domain; the solver inputs only reset the solution when they change.
+
+    The solution also records whether its fields were warm started and the iteration a
+    resumed solve continues from, which a reset discards with the fields.
+    """
+    humidity_ratio, temperature, relative_humidity, enthalpy, _ = initialize_domain_properties(
+        model_parameters[0], temperatures, relative_humidities, pressures, dtype)
+    return {'humidity_ratio': humidity_ratio, 'temperature': temperature,
+            'relative_humidity': relative_humidity, 'enthalpy': enthalpy, 'solved': False,
+            'warm_started': False, 'start_iteration': 0}
+
 
 class FCHPerformanceModel:
     """
@@ -17,72 +86,210 @@ class FCHPerformanceModel:
     Attributes:
         product_model (str): The model of the product (AX_150, AX_100).
         layer_count (int): Number of layers in the model.
-        life_cycle (str): The lifecycle stage of the product.
+        life_cycle (str or float): The lifecycle stage of the product, or a performance factor.
         mass_flow_rates (dict): Mass flow rates for 'dry' and 'wet' conditions.
         temperatures (dict): Temperatures for 'dry' and 'wet' conditions.
         relative_humidities (dict): Relative humidities for 'dry' and 'wet' conditions.
         pressures (dict): Pressures for 'dry' and 'wet' conditions.
         config_path (str): Path to the configuration YAML file.
+        config_overrides (dict): Overlay applied on top of the configuration file.
+        mesh_resolution (int): Number of cells per side of the domain, or None for one
+            cell per wet channel.
+        field_precision (str): Precision policy of the solver fields, 'float64' or 'float32'.
+        solver_engine (str): Solver engine, see `solver_engines.SOLVER_ENGINES`, or 'auto'.
+
+    The model is a graph of cached stages (see `stage_graph.StageGraph`), from the
+    configuration through the model, channel and solver parameters and the solution
+    to the pressure drop and compiled results. Assigning one of the inputs above
+    only recomputes the stages that depend on it: a new pressure drop coefficient in
+    the `config_overrides` recompiles the results without solving again, while new
+    inlet conditions reset the solution, which `compile_results` then solves. Inputs
+    must be replaced, e.g. `model.pressures = {...}`, not modified in place.
     """
 
+    # Inputs, see `__init__`
+    layer_count = _input_property('layer_count')
+    life_cycle = _input_property('life_cycle')
+    mass_flow_rates = _input_property('mass_flow_rates')
+    temperatures = _input_property('temperatures')
+    relative_humidities = _input_property('relative_humidities')
+    pressures = _input_property('pressures')
+    config_path = _input_property('config_path')
+    config_overrides = _input_property('config_overrides')
+    mesh_resolution = _input_property('requested_mesh_resolution', 'mesh_resolution')
+    field_precision = _input_property('requested_field_precision', 'field_precision')
+
+    # Stages computed from the inputs
+    channel_properties = _stage_property('channel_properties')
+    air_properties = _stage_property('air_properties')
+    membrane_properties = _stage_property('membrane_properties')
+    model_properties = _stage_property('model_properties')
+    press_drop_coeff = _stage_property('press_drop_coeff')
+    life_cycle_factor = _stage_property('life_cycle_factor')
+    field_dtype = _stage_property('field_dtype')
+    mesh = _stage_property('model_parameters', 0)
+    transfer_area = _stage_property('model_parameters', 1)
+    hyd_dia = _stage_property('channel_parameters', 0)
+    area = _stage_property('channel_parameters', 1)
+    channel_flow = _stage_property('channel_parameters', 2)
+    cell_flow = _stage_property('cell_flow')
+    specific_volume_matrix = _stage_property('specific_volume')
+    heat_res_tot = _stage_property('solver_parameters', 0)
+    mas_res_tot = _stage_property('solver_parameters', 1)
+    pressure_drop = _stage_property('pressure_drop')
+
+    # Solver fields of the solution
+    humidity_ratio_matrix = _field_property('humidity_ratio')
+    temperature_matrix = _field_property('temperature')
+    relative_humidity_matrix = _field_property('relative_humidity')
+    enthalpy_matrix = _field_property('enthalpy')
+
     def __init__(self, product_model: str, layer_count: int, life_cycle: str, mass_flow_rates: dict,
                  temperatures: dict, relative_humidities: dict, pressures: dict,
-                 config_path: str = 'app/config/config.yaml'):
+                 config_path: str = DEFAULT_CONFIG_PATH, config_overrides: dict = None,
+                 mesh_resolution: int = None, field_precision: str = None, active_set: bool = None,
+                 solver_engine: str = None):
         """
         Initializes the FCHPerformanceModel with the given parameters.
 
         Args:
             product_model (str): Model of the product.
             layer_count (int): Number of layers.
-            life_cycle (str): Life cycle stage.
+            life_cycle (str or float): Life cycle stage ('BOL', 'EOL', ...) or a continuous
+                performance factor, e.g. 0.965 between BOL (1.0) and EOL (0.93).
             mass_flow_rates (dict): Mass flow rates.
             temperatures (dict): Temperatures for dry and wet conditions.
             relative_humidities (dict): Relative humidities for dry and wet conditions.
             pressures (dict): Pressures for dry and wet conditions.
-            config_path (str): Path to the configuration file.
+            config_path (str): Path to the configuration file. Defaults to the
+                configuration shipped with the package.
+            config_overrides (dict): Partial configuration merged over the file, e.g.
+                {'membrane_properties': {'mass_transfer_resistance': 60}}.
+            mesh_resolution (int): Number of cells per side of the domain. Defaults to the
+                'mesh_resolution' of the product model in the 'model_properties' of the
+                configuration, or one cell per wet channel if none is configured.
+            field_precision (str): 'float64' or 'float32' solver fields. Defaults to the
+                'field_precision' in the 'model_properties' of the configuration, or float64.
+            active_set (bool): Shorthand for the 'active_set' (True) or 'standard' (False)
+                solver engine.
+            solver_engine (str): Name of the solver engine in `solver_engines.SOLVER_ENGINES`,
+                or 'auto' to pick the engine expected to be fastest from past solves.
+                Defaults to the 'solver_engine' in the 'model_properties' of the
+                configuration, or 'standard'.
         """
 
-        self.product_model = self._normalize_product_model(product_model)
-        self.layer_count = layer_count
-        self.life_cycle = life_cycle
-        self.mass_flow_rates = mass_flow_rates
-        self.temperatures = temperatures
-        self.relative_humidities = relative_humidities
-        self.pressures = pressures
-
-        # Load the configuration file
-        with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
+        self._graph = graph = StageGraph()
+        for name, value in (
+                ('product_model', self._normalize_product_model(product_model)),
+                ('layer_count', layer_count), ('life_cycle', life_cycle),
+                ('mass_flow_rates', mass_flow_rates), ('temperatures', temperatures),
+                ('relative_humidities', relative_humidities), ('pressures', pressures),
+                ('config_path', config_path), ('config_overrides', config_overrides),
+                ('requested_mesh_resolution', mesh_resolution),
+                ('requested_field_precision', field_precision)):
+            graph.add_input(name, value)
 
         self._compiled_results = None
+        self.solver_info = {}
+        self._checkpoint = None
+        self._checkpoint_interval = 60.0
 
         # Section 1 - Importing variables from the configuration
-        self.channel_properties = config['channel_properties'][self.product_model]
-        self.air_properties = config['air_properties']
-        self.membrane_properties = config['membrane_properties']
-        self.model_properties = config['model_properties']
-        self.press_drop_coeff = config['pressure_drop_model'][self.product_model]
-        self.life_cycle_factor = config['life_cycle_factor'][life_cycle]
+        graph.add_stage('config', load_config, ('config_path', 'config_overrides'))
+        graph.add_stage('channel_properties', lambda config, product: config['channel_properties'][product],
+                        ('config', 'product_model'))
+        graph.add_stage('air_properties', lambda config: config['air_properties'], ('config',))
+        graph.add_stage('membrane_properties', lambda config: config['membrane_properties'], ('config',))
+        graph.add_stage('model_properties', lambda config: config['model_properties'], ('config',))
+        graph.add_stage('press_drop_coeff', lambda config, product: config['pressure_drop_model'][product],
+                        ('config', 'product_model'))
+        graph.add_stage('life_cycle_factor', _life_cycle_factor, ('config', 'life_cycle'))
+        graph.add_stage(
+            'mesh_resolution',
+            lambda requested, properties, product: requested if requested is not None else (
+                (properties.get('mesh_resolution') or {}).get(product)),
+            ('requested_mesh_resolution', 'model_properties', 'product_model'))
+        graph.add_stage(
+            'field_precision',
+            lambda requested, properties: requested or properties.get('field_precision', 'float64'),
+            ('requested_field_precision', 'model_properties'))
+        graph.add_stage('field_dtype', field_dtype, ('field_precision',))
+
+        if solver_engine is None and active_set is not None:
+            solver_engine = 'active_set' if active_set else 'standard'
+        if solver_engine is None:
+            # Configurations written before the engine registry only had the active set switch
+            solver_engine = self.model_properties.get('solver_engine') or (
+                'active_set' if self.model_properties.get('active_set') else 'standard')
+        self.solver_engine = validate_engine(solver_engine)
 
         # Section 2 - Calculate model parameters
-        self.mesh, self.transfer_area = calculate_model_parameter(
-            self.channel_properties)
-        self.hyd_dia, self.area, self.channel_flow = calculate_channel_parameter(
-            self.channel_properties, self.mass_flow_rates, self.layer_count, self.mesh
-        )
+        graph.add_stage('model_parameters', calculate_model_parameter,
+                        ('channel_properties', 'mesh_resolution'))
+        graph.add_stage(
+            'channel_parameters',
+            lambda properties, flow_rates, layer_count, model_parameters: calculate_channel_parameter(
+                properties, flow_rates, layer_count, model_parameters[0]),
+            ('channel_properties', 'mass_flow_rates', 'layer_count', 'model_parameters'))
+        graph.add_stage(
+            'cell_flow',
+            lambda channel_parameters, model_parameters: calculate_cell_flow(
+                channel_parameters[2], model_parameters[0]),
+            ('channel_parameters', 'model_parameters'))
 
         # Section 3 - Initialize domain properties
-        (self.humidity_ratio_matrix, self.temperature_matrix, self.relative_humidity_matrix,
-         self.enthalpy_matrix, self.specific_volume_matrix) = initialize_domain_properties(
-            self.mesh, self.temperatures, self.relative_humidities, self.pressures
-        )
+        graph.add_stage(
+            'specific_volume',
+            lambda model_parameters, *conditions: initialize_domain_properties(
+                model_parameters[0], *conditions)[4],
+            ('model_parameters', 'temperatures', 'relative_humidities', 'pressures', 'field_dtype'))
 
         # Section 5 - Calculate solver parameters
-        self.heat_res_tot, self.mas_res_tot = calculate_solver_parameters(
-            self.temperatures, self.hyd_dia, self.area, self.channel_flow, self.channel_properties,
-            self.air_properties, self.membrane_properties, self.transfer_area,
-            self.specific_volume_matrix
-        )
+        graph.add_stage(
+            'solver_parameters',
+            lambda temperatures, channel_parameters, channel_properties, air_properties,
+            membrane_properties, model_parameters, specific_volume: calculate_solver_parameters(
+                temperatures, *channel_parameters, channel_properties, air_properties,
+                membrane_properties, model_parameters[1], specific_volume),
+            ('temperatures', 'channel_parameters', 'channel_properties', 'air_properties',
+             'membrane_properties', 'model_parameters', 'specific_volume'))
+
+        # Section 6 - Solution, replaced by the solver (see `train`)
+        graph.add_stage(
+            'solution', _initial_solution,
+            ('model_parameters', 'temperatures', 'relative_humidities', 'pressures', 'field_dtype',
+             'cell_flow', 'solver_parameters', 'life_cycle_factor', 'model_properties'))
+
+        # Section 7 - Pressure drop and results
+        graph.add_stage(
+            'pressure_drop',
+            lambda coefficients, flow_rates, layer_count: {
+                condition: calculate_pressure_drop(flow_rates[condition], layer_count, coefficients[condition])
+                for condition in ['dry', 'wet']
+            },
+            ('press_drop_coeff', 'mass_flow_rates', 'layer_count'))
+        graph.add_stage(
+            'results',
+            lambda pressures, pressure_drop, solution, flow_rates: result_compiler(
+                pressures, pressure_drop, solution['enthalpy'], solution['humidity_ratio'], flow_rates),
+            ('pressures', 'pressure_drop', 'solution', 'mass_flow_rates'))
+
+        # Evaluate up to the unsolved domain, so invalid inputs fail here
+        graph.get('solver_parameters')
+        graph.get('solution')
+
+    @property
+    def start_iteration(self) -> int:
+        """Iteration count the next solve continues from, set by `resume`."""
+        return self._graph.get('solution')['start_iteration']
+
+    @property
+    def product_model(self) -> str:
+        return self._graph.get('product_model')
+
+    @product_model.setter
+    def product_model(self, product_model: str):
+        self._graph.set('product_model', self._normalize_product_model(product_model))
 
     def _normalize_product_model(self, product_model: str) -> str:
         """
@@ -94,16 +301,101 @@ class FCHPerformanceModel:
         Returns:
             str: The normalized product model name.
         """
-        normalized_models = {
-            "ax150": "AX_150", "ax-150": "AX_150", "ax 150": "AX_150", "ax_150": "AX_150",
-            "ax100": "AX_100", "ax-100": "AX_100", "ax 100": "AX_100", "ax_100": "AX_100"
+        return normalize_product_model(product_model)
+
+    def get_fields(self) -> dict:
+        """
+        Returns a copy of the current humidity ratio and enthalpy fields.
+
+        Returns:
+            dict: 'humidity_ratio' and 'enthalpy' matrices for 'dry' and 'wet' conditions,
+                  suitable for `warm_start` of another model of the same product.
+        """
+        return {
+            'humidity_ratio': {side: matrix.copy() for side, matrix in self.humidity_ratio_matrix.items()},
+            'enthalpy': {side: matrix.copy() for side, matrix in self.enthalpy_matrix.items()},
         }
-        return normalized_models.get(product_model.lower(), product_model)
 
-    def train(self):
+    def warm_start(self, fields: dict):
+        """
+        Initializes the domain from a previously converged solution.
+
+        Args:
+            fields (dict): Fields as returned by `get_fields` of a model of the same product.
+
+        Returns:
+            None
+        """
+        humidity_ratio, temperature, relative_humidity, enthalpy, _ = warm_start_domain_properties(
+            self.mesh, self.temperatures, self.relative_humidities, self.pressures, fields,
+            self.field_dtype
+        )
+        self._graph.provide('solution', {
+            'humidity_ratio': humidity_ratio, 'temperature': temperature,
+            'relative_humidity': relative_humidity, 'enthalpy': enthalpy, 'solved': False,
+            'warm_started': True, 'start_iteration': 0,
+        })
+
+    def set_solution(self, fields: dict, solved: bool):
+        """
+        Replaces the solution by fields solved outside `train`, e.g. by `batch_solver.solve_models`.
+
+        Args:
+            fields (dict): 'humidity_ratio', 'temperature', 'relative_humidity' and 'enthalpy'
+                matrices for 'dry' and 'wet' conditions.
+            solved (bool): Whether the fields are converged, so `compile_results` does not solve again.
+
+        Returns:
+            None
+        """
+        self._graph.provide('solution', {**self._graph.get('solution'), **fields, 'solved': solved})
+
+    def enable_checkpoints(self, callback, interval: float = 60.0):
+        """
+        Periodically hands the in-flight solver state to a callback while training.
+
+        Args:
+            callback (callable): Receives the solver state, see `model_trainer.solve`.
+            interval (float): Minimum wall-clock time between checkpoints in seconds.
+
+        Returns:
+            None
+        """
+        self._checkpoint = callback
+        self._checkpoint_interval = interval
+
+    def resume(self, state: dict):
+        """
+        Continues a partially converged solve from a checkpointed solver state.
+
+        Args:
+            state (dict): Solver state with 'fields', 'iteration' and 'residual_history'.
+
+        Returns:
+            None
+        """
+        self.warm_start(state['fields'])
+        self._graph.provide('solution', {**self._graph.get('solution'),
+                                         'start_iteration': int(state['iteration'])})
+        self.solver_info['residual_history'] = [tuple(entry) for entry in state['residual_history']]
+
+    def train(self, time_budget: float = None, cancel_token=None, engine: str = None):
         """
         train the FCH performance model using numerical methods.
 
+        When the budget expires or the token is cancelled, training stops with the
+        current fields and `solver_info['converged']` is False.
+
+        The engine that solved is recorded as `solver_info['engine']` with the wall-clock
+        'solve_seconds'. With the 'auto' engine, the 'predicted_seconds' of every engine
+        are recorded too, and solves from the initial domain are added to the cost model
+        of the 'engine_history' in the 'model_properties' of the configuration.
+
+        Args:
+            time_budget (float): Optional wall-clock budget of the solve in seconds.
+            cancel_token (CancellationToken): Optional token to stop the solve early.
+            engine (str): Solver engine for this solve; defaults to the engine of the model.
+
         Returns:
             None
         """
@@ -111,14 +403,39 @@ class FCHPerformanceModel:
         convergence_threshold = self.model_properties['convergence_threshold']
         relax_factor = self.model_properties['relaxation_factor']
 
-        (self.humidity_ratio_matrix, self.enthalpy_matrix, self.temperature_matrix,
-         self.relative_humidity_matrix) = solve(
-            self.humidity_ratio_matrix, self.enthalpy_matrix, self.temperature_matrix,
-            self.relative_humidity_matrix, self.specific_volume_matrix,
-            self.channel_flow, self.mesh, self.temperatures, self.pressures,
+        selection = validate_engine(engine or self.solver_engine)
+        engine = selection
+        self.solver_info.pop('predicted_seconds', None)
+        if selection == AUTO_ENGINE:
+            features = engine_features(self.mesh['model'], self.mass_flow_rates,
+                                       self.relative_humidities, self.life_cycle_factor)
+            cost_model = shared_cost_model(self.model_properties.get('engine_history'))
+            engine, self.solver_info['predicted_seconds'] = cost_model.choose(features)
+        self.solver_info['engine'] = engine
+
+        solution = self._graph.get('solution')
+        start = time.perf_counter()
+        humidity_ratio, enthalpy, temperature, relative_humidity = SOLVER_ENGINES[engine](
+            solution['humidity_ratio'], solution['enthalpy'], solution['temperature'],
+            solution['relative_humidity'], self.specific_volume_matrix,
+            self.cell_flow, self.mesh, self.temperatures, self.pressures,
             self.heat_res_tot, self.mas_res_tot, self.life_cycle_factor,
-            max_iterations, convergence_threshold, relax_factor
+            max_iterations, convergence_threshold, relax_factor, self.solver_info,
+            self._checkpoint, self._checkpoint_interval, solution['start_iteration'],
+            time_budget, cancel_token
         )
+        self.solver_info['solve_seconds'] = time.perf_counter() - start
+        self._graph.provide('solution', {
+            **solution,
+            'humidity_ratio': humidity_ratio, 'temperature': temperature,
+            'relative_humidity': relative_humidity, 'enthalpy': enthalpy,
+            'solved': self.solver_info['converged'],
+        })
+
+        # Warm started and resumed solves would understate the cost of a point
+        if selection == AUTO_ENGINE and not solution['warm_started']:
+            cost_model.record(engine, features, self.solver_info['solve_seconds'],
+                              self.solver_info['iterations'], self.solver_info['converged'])
         self.calculate_pressure_drop()
 
     def calculate_pressure_drop(self) -> dict:
@@ -128,25 +445,41 @@ class FCHPerformanceModel:
         Returns:
             dict: Pressure drop values for dry and wet conditions.
         """
-        self.pressure_drop = {}
-        for condition in ['dry', 'wet']:
-            coefficients = self.press_drop_coeff[condition]
-            self.pressure_drop[condition] = calculate_pressure_drop(
-                self.mass_flow_rates[condition], self.layer_count, coefficients
-            )
         return self.pressure_drop
 
-    def compile_results(self) -> dict:
+    def compile_results(self, time_budget: float = None, cancel_token=None,
+                        engine: str = None) -> CompiledResult:
         """
         Compiles the results from the model solution.
 
+        The model is only solved if no converged solution of the current inputs exists,
+        otherwise the cached results are returned, recompiled if an input changed.
+
+        Args:
+            time_budget (float): Optional wall-clock budget of the solve in seconds.
+            cancel_token (CancellationToken): Optional token to stop the solve early.
+            engine (str): Solver engine for this solve; defaults to the engine of the model.
+
         Returns:
-            dict: Compiled results including pressures, pressure drops, and other relevant data.
+            CompiledResult: Compiled results including pressures, pressure drops, and other
+                            relevant data. Behaves like the nested result dictionary.
+                            Partial if `solver_info['converged']` is False.
         """
-        self.train()
-        self._compiled_results = result_compiler(
-            self.pressures, self.pressure_drop, self.enthalpy_matrix, self.humidity_ratio_matrix, self.mass_flow_rates
-        )
+        if not self._graph.get('solution')['solved']:
+            self.train(time_budget, cancel_token, engine)
+        return self.compile_solution()
+
+    def compile_solution(self) -> CompiledResult:
+        """
+        Compiles the results of the current fields without solving.
+
+        Used once the fields were solved outside `train`, e.g. by
+        `batch_solver.solve_models`, after `set_solution`.
+
+        Returns:
+            CompiledResult: Compiled results of the current fields.
+        """
+        self._compiled_results = self._graph.get('results')
 
         return self._compiled_results
 
@@ -160,10 +493,7 @@ class FCHPerformanceModel:
         Returns:
             None
         """
-        if self._compiled_results is None:
-            self.compile_results()
-
-        write_to_excel(self._compiled_results, filename)
+        write_to_excel(self.compile_results(), filename)
 
     def __repr__(self):
         return (f"FCHPerformanceModel(product_model={self.product_model}, "
@@ -1,5 +1,6 @@
 import numpy as np
 import copy
+import time
 from ..utils.psychrometric_functions import (
     calculate_vaporization_enthalpy, calculate_temperature,
     calculate_relative_humidity
@@ -11,7 +12,9 @@ def solve(
         relative_humidity_matrix, specific_volume_matrix,
         channel_flow, mesh, temperatures, pressures,
         heat_res_tot, mas_res_tot, life_cycle_factor,
-        max_iterations, convergence_threshold, relax_factor):
+        max_iterations, convergence_threshold, relax_factor, solver_info=None,
+        checkpoint=None, checkpoint_interval=60.0, start_iteration=0,
+        time_budget=None, cancel_token=None, active_set=None):
     """
     Performs the numerical solution for the FCH Performance Model.
 
@@ -31,63 +34,129 @@ def solve(
     - max_iterations: Maximum allowed iterations.
     - convergence_threshold: Convergence threshold.
     - relax_factor: Relaxation factor.
+    - solver_info: Optional dictionary filled with the number of 'iterations', the
+      'initial_error' of the first iteration, the final 'convergence_error', the
+      'residual_history' as (iteration, error) pairs every 1000 iterations, the
+      'convergence_threshold' applied, whether the solve 'converged' and its
+      'stop_reason' ('converged', 'time_budget' or 'cancelled'). With an active set,
+      the mean fraction of the cells updated per iteration is added as 'active_fraction'.
+    - checkpoint: Optional callable receiving the solver state ('iteration',
+      'convergence_error', 'residual_history' and the 'fields' as returned by
+      `FCHPerformanceModel.get_fields`, not copied) at most every `checkpoint_interval`.
+    - checkpoint_interval: Minimum wall-clock time between checkpoints in seconds.
+    - start_iteration: Iteration count of a resumed solve.
+    - time_budget: Optional wall-clock budget of the solve in seconds.
+    - cancel_token: Optional `CancellationToken` checked once per iteration.
+    - active_set: Optional `active_set.ActiveSet` restricting the iterations to the
+      regions of the domain that have not converged yet.
+
+    The fields are updated in the floating-point type of the given matrices (see
+    `domain_initializer.field_dtype`), while the residuals are evaluated in float64.
+    A positive convergence threshold is raised to the resolution of the field type
+    when it is finer, which only affects float32 fields. A threshold of 0 never
+    converges, so the solve runs until the iteration limit, time budget or cancellation.
 
     Returns:
-    - Updated matrices and the final convergence error.
+    - Updated matrices and the final convergence error. When the time budget expires
+      or the solve is cancelled, the current, unconverged matrices are returned.
     """
+    # Keep the coefficients in the field type, so the updates do not promote the fields
+    dtype = enthalpy_matrix['dry'].dtype
+    heat_res_tot = np.asarray(heat_res_tot, dtype)
+    mas_res_tot = np.asarray(mas_res_tot, dtype)
+    specific_volume_matrix = {
+        condition: np.asarray(volume, dtype) for condition, volume in specific_volume_matrix.items()
+    }
+    # A relaxed update below half a unit in the last place rounds to no change, so the
+    # fields cannot resolve residuals below eps * |enthalpy| / relaxation factor
+    if convergence_threshold > 0:
+        largest_enthalpy = max(float(np.max(np.abs(matrix))) for matrix in enthalpy_matrix.values())
+        convergence_threshold = max(
+            convergence_threshold, float(np.finfo(dtype).eps) * largest_enthalpy / relax_factor)
 
-    iteration = 0
-    convergence_error = float('inf')
+    if active_set is not None:
+        active_set.reset()
 
-    while convergence_error > convergence_threshold and iteration < max_iterations:
+    iteration = start_iteration
+    convergence_error = float('inf')
+    residual_history = solver_info.setdefault('residual_history', []) if solver_info is not None else []
+    last_checkpoint = time.monotonic()
+    deadline = last_checkpoint + time_budget if time_budget is not None else None
+    stop_reason = 'converged'
+
+    # Whether the convergence error covers the whole domain, see `active_set.ActiveSet`
+    complete = True
+
+    while (convergence_error > convergence_threshold or not complete) and iteration < max_iterations:
+        if cancel_token is not None and cancel_token.cancelled:
+            stop_reason = 'cancelled'
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            stop_reason = 'time_budget'
+            break
         iteration += 1
 
-        # Calculate heat and mass transfer
-        heat_transfer, mass_transfer = update_heat_mass_transfer(
-            temperature_matrix, humidity_ratio_matrix, specific_volume_matrix,
-            heat_res_tot, mas_res_tot, life_cycle_factor
-        )
-
-        # Copy matrices for updating
-        humidity_ratio_update = copy.deepcopy(humidity_ratio_matrix)
-        enthalpy_update = copy.deepcopy(enthalpy_matrix)
-
-        # Dry side updates
-        humidity_ratio_update, enthalpy_update = update_dry_side(
-            humidity_ratio_update, humidity_ratio_matrix, enthalpy_update, enthalpy_matrix,
-            mass_transfer, temperature_matrix, heat_transfer, channel_flow, mesh
-        )
-
-        # Wet side updates
-        humidity_ratio_update, enthalpy_update = update_wet_side(
-            humidity_ratio_update, humidity_ratio_matrix, enthalpy_update, enthalpy_matrix,
-            mass_transfer, temperature_matrix, heat_transfer, channel_flow
-        )
+        if active_set is None:
+            humidity_ratio_matrix, enthalpy_matrix, temperature_matrix, absolute_changes = iterate(
+                humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+                specific_volume_matrix, channel_flow, mesh,
+                heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor
+            )
+            convergence_error = np.max(list(absolute_changes.values()))
+        else:
+            (
+                humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+                convergence_error, complete
+            ) = active_set.sweep(
+                humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+                specific_volume_matrix, channel_flow, mesh,
+                heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor, convergence_threshold
+            )
+        if iteration == start_iteration + 1 and solver_info is not None:
+            solver_info['initial_error'] = convergence_error
 
-        # Calculate absolute changes and convergence error
-        absolute_changes = calculate_absolute_changes(
-            humidity_ratio_update, enthalpy_update, humidity_ratio_matrix, enthalpy_matrix
-        )
-        convergence_error = np.max(list(absolute_changes.values()))
-
-        # Update domain property matrices
-        (
-            humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
-            relative_humidity_matrix
-        ) = update_condition_matrices(
-            humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
-            relative_humidity_matrix, humidity_ratio_update, enthalpy_update,
-            relax_factor, pressures
-        )
         if iteration%1000==0:
             print(f"Convergance error is {convergence_error} at iteration {iteration}")
+            residual_history.append((iteration, float(convergence_error)))
 
         # Check for divergence
         if convergence_error > 10**6:
             raise ValueError(
                 "Model diverged, check input parameter range or model parameters")
-        
-    if convergence_error > convergence_threshold:
+
+        if checkpoint is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+            checkpoint({
+                'iteration': iteration,
+                'convergence_error': float(convergence_error),
+                'residual_history': residual_history,
+                'fields': {'humidity_ratio': humidity_ratio_matrix, 'enthalpy': enthalpy_matrix},
+            })
+            last_checkpoint = time.monotonic()
+
+    # The iterations do not depend on the relative humidity, so it is only evaluated
+    # for the returned fields
+    if iteration > start_iteration:
+        relative_humidity_matrix = update_relative_humidity(
+            relative_humidity_matrix, temperature_matrix, humidity_ratio_matrix, pressures)
+
+    if solver_info is not None:
+        solver_info['iterations'] = iteration
+        solver_info['convergence_error'] = convergence_error
+        solver_info['convergence_threshold'] = convergence_threshold
+        solver_info['converged'] = bool(convergence_error <= convergence_threshold and complete)
+        solver_info['stop_reason'] = stop_reason
+        if active_set is not None:
+            solver_info['active_fraction'] = active_set.active_fraction
+
+    if stop_reason != 'converged':
+        print(f"\nModel stopped ({stop_reason}) at iteration {iteration} "
+              f"with convergence error {convergence_error}")
+        return (
+            humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+            relative_humidity_matrix
+        )
+
+    if convergence_error > convergence_threshold or not complete:
         raise ValueError(
             "Model diverged, check input parameter range or model parameters")
     
@@ -99,6 +168,56 @@ def solve(
     )
 
 
+def iterate(
+        humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+        specific_volume_matrix, channel_flow, mesh,
+        heat_res_tot, mas_res_tot, life_cycle_factor, relax_factor):
+    """
+    Performs one solver iteration over the given fields.
+
+    The fields may be the whole domain, a region of it with the upstream row and
+    column as boundary (see `active_set`), or stacked fields of several models
+    (see `batch_solver`).
+
+    Returns:
+    - The updated humidity ratio, enthalpy and temperature matrices and the absolute
+      changes of the iteration, see `calculate_absolute_changes`.
+    """
+    # Calculate heat and mass transfer
+    heat_transfer, mass_transfer = update_heat_mass_transfer(
+        temperature_matrix, humidity_ratio_matrix, specific_volume_matrix,
+        heat_res_tot, mas_res_tot, life_cycle_factor
+    )
+
+    # Copy matrices for updating
+    humidity_ratio_update = copy.deepcopy(humidity_ratio_matrix)
+    enthalpy_update = copy.deepcopy(enthalpy_matrix)
+
+    # Dry side updates
+    humidity_ratio_update, enthalpy_update = update_dry_side(
+        humidity_ratio_update, humidity_ratio_matrix, enthalpy_update, enthalpy_matrix,
+        mass_transfer, temperature_matrix, heat_transfer, channel_flow, mesh
+    )
+
+    # Wet side updates
+    humidity_ratio_update, enthalpy_update = update_wet_side(
+        humidity_ratio_update, humidity_ratio_matrix, enthalpy_update, enthalpy_matrix,
+        mass_transfer, temperature_matrix, heat_transfer, channel_flow
+    )
+
+    # Calculate absolute changes
+    absolute_changes = calculate_absolute_changes(
+        humidity_ratio_update, enthalpy_update, humidity_ratio_matrix, enthalpy_matrix
+    )
+
+    # Update domain property matrices
+    humidity_ratio_matrix, enthalpy_matrix, temperature_matrix = update_condition_matrices(
+        humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
+        humidity_ratio_update, enthalpy_update, relax_factor
+    )
+    return humidity_ratio_matrix, enthalpy_matrix, temperature_matrix, absolute_changes
+
+
 def update_heat_mass_transfer(
         temperature_matrix, humidity_ratio_matrix, specific_volume_matrix,
         heat_res_tot, mas_res_tot, life_cycle_factor):
@@ -117,22 +236,22 @@ def update_dry_side(
         enthalpy_matrix, mass_transfer, temperature_matrix, heat_transfer,
         channel_flow, mesh):
     # Update humidity ratio for the dry side
-    humidity_ratio_update['dry'][:, 1:] = (
-        2 * mass_transfer[:, :-1] /
+    humidity_ratio_update['dry'][..., 1:] = (
+        2 * mass_transfer[..., :-1] /
         (channel_flow['dry'] / (mesh['model'] / mesh['dry']))
-    ) + humidity_ratio_matrix['dry'][:, :-1]
+    ) + humidity_ratio_matrix['dry'][..., :-1]
 
     # Calculate vapor enthalpy for the dry side
     vapor_enthalpy_dry = calculate_vaporization_enthalpy(
-        (temperature_matrix['wet'][:, :-1] +
-         temperature_matrix['dry'][:, :-1]) / 2
+        (temperature_matrix['wet'][..., :-1] +
+         temperature_matrix['dry'][..., :-1]) / 2
     )
 
     # Update enthalpy for the dry side
-    enthalpy_update['dry'][:, 1:] = (
-        2 * (mass_transfer[:, :-1] * vapor_enthalpy_dry + heat_transfer[:, :-1]) /
+    enthalpy_update['dry'][..., 1:] = (
+        2 * (mass_transfer[..., :-1] * vapor_enthalpy_dry + heat_transfer[..., :-1]) /
         (channel_flow['dry'] / (mesh['model'] / mesh['dry']))
-    ) + enthalpy_matrix['dry'][:, :-1]
+    ) + enthalpy_matrix['dry'][..., :-1]
 
     return humidity_ratio_update, enthalpy_update
 
@@ -142,21 +261,21 @@ def update_wet_side(
         enthalpy_matrix, mass_transfer, temperature_matrix, heat_transfer,
         channel_flow):
     # Update humidity ratio for the wet side
-    humidity_ratio_update['wet'][1:, :] = (
-        -2 * mass_transfer[:-1, :] / channel_flow['wet']
-    ) + humidity_ratio_matrix['wet'][:-1, :]
+    humidity_ratio_update['wet'][..., 1:, :] = (
+        -2 * mass_transfer[..., :-1, :] / channel_flow['wet']
+    ) + humidity_ratio_matrix['wet'][..., :-1, :]
 
     # Calculate vapor enthalpy for the wet side
     vapor_enthalpy_wet = calculate_vaporization_enthalpy(
-        (temperature_matrix['wet'][:-1, :] +
-         temperature_matrix['dry'][:-1, :]) / 2
+        (temperature_matrix['wet'][..., :-1, :] +
+         temperature_matrix['dry'][..., :-1, :]) / 2
     )
 
     # Update enthalpy for the wet side
-    enthalpy_update['wet'][1:, :] = (
-        -2 * (mass_transfer[:-1, :] * vapor_enthalpy_wet + heat_transfer[:-1, :]) /
+    enthalpy_update['wet'][..., 1:, :] = (
+        -2 * (mass_transfer[..., :-1, :] * vapor_enthalpy_wet + heat_transfer[..., :-1, :]) /
         channel_flow['wet']
-    ) + enthalpy_matrix['wet'][:-1, :]
+    ) + enthalpy_matrix['wet'][..., :-1, :]
 
     return humidity_ratio_update, enthalpy_update
 
@@ -164,18 +283,22 @@ def update_wet_side(
 def calculate_absolute_changes(
         humidity_ratio_update, enthalpy_update,
         humidity_ratio_matrix, enthalpy_matrix):
+    # Differences of the fields are exact in float64, whatever the field precision
     return {
-        'dry_Humidity': abs(humidity_ratio_update['dry'] - humidity_ratio_matrix['dry']),
-        'wet_Humidity': abs(humidity_ratio_update['wet'] - humidity_ratio_matrix['wet']),
-        'dry_Enthalpy': abs(enthalpy_update['dry'] - enthalpy_matrix['dry']),
-        'wet_Enthalpy': abs(enthalpy_update['wet'] - enthalpy_matrix['wet']),
+        'dry_Humidity': abs(np.subtract(
+            humidity_ratio_update['dry'], humidity_ratio_matrix['dry'], dtype=np.float64)),
+        'wet_Humidity': abs(np.subtract(
+            humidity_ratio_update['wet'], humidity_ratio_matrix['wet'], dtype=np.float64)),
+        'dry_Enthalpy': abs(np.subtract(
+            enthalpy_update['dry'], enthalpy_matrix['dry'], dtype=np.float64)),
+        'wet_Enthalpy': abs(np.subtract(
+            enthalpy_update['wet'], enthalpy_matrix['wet'], dtype=np.float64)),
     }
 
 
 def update_condition_matrices(
         humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
-        relative_humidity_matrix, humidity_ratio_update, enthalpy_update,
-        relax_factor, pressures):
+        humidity_ratio_update, enthalpy_update, relax_factor):
     for condition in ['dry', 'wet']:
         # Update humidity ratio
         humidity_ratio_matrix[condition] += relax_factor * (
@@ -192,13 +315,14 @@ def update_condition_matrices(
             enthalpy_matrix[condition], humidity_ratio_matrix[condition]
         )
 
-        # Recalculate relative humidity
+    return humidity_ratio_matrix, enthalpy_matrix, temperature_matrix
+
+
+def update_relative_humidity(
+        relative_humidity_matrix, temperature_matrix, humidity_ratio_matrix, pressures):
+    for condition in ['dry', 'wet']:
         relative_humidity_matrix[condition] = calculate_relative_humidity(
             temperature_matrix[condition], w=humidity_ratio_matrix[condition],
             P=pressures[condition]
         )
-
-    return (
-        humidity_ratio_matrix, enthalpy_matrix, temperature_matrix,
-        relative_humidity_matrix
-    )
+    return relative_humidity_matrix
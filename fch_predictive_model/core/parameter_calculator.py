@@ -47,15 +47,23 @@ def calculate_channel_parameter(
     return hyd_dia, area, channel_flow
 
 
-def calculate_model_parameter(channel_properties: dict) -> tuple:
+def calculate_model_parameter(channel_properties: dict, mesh_resolution: int = None) -> tuple:
     """
     Calculate the model discretization parameter.
 
+    By default the domain is discretized with one cell per wet channel. A mesh
+    resolution decouples the discretization from the channel counts: the domain is
+    then split into mesh_resolution x mesh_resolution cells, each covering a
+    proportionally larger (or smaller) part of the transfer area.
+
     Parameters:
         channel_properties (dict): Dictionary containing channel properties.
+        mesh_resolution (int): Optional number of cells per side of the domain.
 
     Returns:
         tuple: Containing the discretization parameters for the model and the transfer area.
+               'model' is the number of cells per side and 'channel_model' the channel-based
+               discretization it replaces.
     """
     dry_channel = channel_properties[DRY]
     wet_channel = channel_properties[WET]
@@ -85,13 +93,46 @@ def calculate_model_parameter(channel_properties: dict) -> tuple:
 
     transfer_area = wet_channel['width'] ** 2
 
+    model_param = discretization_param
+    if mesh_resolution is not None:
+        if int(mesh_resolution) != mesh_resolution or mesh_resolution < 2:
+            raise ValueError(f"Mesh resolution must be an integer of at least 2, got {mesh_resolution}")
+        model_param = int(mesh_resolution)
+        # Same total transfer area, spread over the resized cells
+        transfer_area *= (discretization_param / model_param) ** 2
+
     return {
         DRY: dry_channel_count,
         WET: wet_channel_count,
-        'model': discretization_param
+        'model': model_param,
+        'channel_model': discretization_param
     }, transfer_area
 
 
+def calculate_cell_flow(channel_flow: dict, mesh: dict) -> dict:
+    """
+    Calculate the flow rates used by the solver for each side.
+
+    The dry side flow is split over the cell rows by the solver itself, while the
+    wet side flow of a channel is assigned to one cell column. When the mesh
+    resolution differs from the channel-based discretization, the wet side flow is
+    rescaled to the resized cell columns.
+
+    Parameters:
+        channel_flow (dict): Flow rate per channel for 'dry' and 'wet' conditions.
+        mesh (dict): Mesh discretization as returned by `calculate_model_parameter`.
+
+    Returns:
+        dict: Flow rates for 'dry' and 'wet' conditions as used by the solver.
+    """
+    if mesh['model'] == mesh['channel_model']:
+        return dict(channel_flow)
+    return {
+        DRY: channel_flow[DRY],
+        WET: channel_flow[WET] * mesh['channel_model'] / mesh['model'],
+    }
+
+
 def calculate_solver_parameters(
     temperatures: dict, 
     hyd_dia: dict, 
@@ -0,0 +1,224 @@
+import itertools
+import numpy as np
+from .batch_runner import run_operating_points
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import ResultTable
+from .sensitivity import set_input
+
+# Outputs mapped by default, as ResultTable column names
+MAP_OUTPUTS = ('DPAT', 'water_recovery_ratio')
+
+
+class PerformanceMap:
+    """
+    Adaptively refined performance map over a box of operating inputs.
+
+    The box is split into a tree of hyper-rectangular cells. Every leaf cell
+    interpolates the outputs multilinearly from its corner solutions. Sample
+    points live on a dyadic lattice of resolution 2**max_level per input.
+
+    Attributes:
+        inputs (tuple): Names of the mapped inputs (see `sensitivity.SENSITIVITY_INPUTS`).
+        lower (np.ndarray): Lower bound of each input.
+        upper (np.ndarray): Upper bound of each input.
+        outputs (tuple): Names of the mapped outputs.
+        max_level (int): Deepest refinement level.
+        samples (dict): Lattice coordinates to an array of output values.
+        children (dict): Cell (level, lattice origin) to its child cells, or None for leaves.
+    """
+
+    def __init__(self, bounds: dict, outputs: tuple = MAP_OUTPUTS, max_level: int = 4):
+        """
+        Initializes an empty map consisting of a single root cell.
+
+        Args:
+            bounds (dict): Input name to its (lower, upper) bounds.
+            outputs (tuple): ResultTable column names to map.
+            max_level (int): Deepest refinement level.
+        """
+        self.inputs = tuple(bounds)
+        self.lower = np.array([bounds[name][0] for name in self.inputs], dtype=float)
+        self.upper = np.array([bounds[name][1] for name in self.inputs], dtype=float)
+        self.outputs = tuple(outputs)
+        self.max_level = max_level
+        self.samples = {}
+        self.children = {(0, (0,) * len(self.inputs)): None}
+
+    @property
+    def resolution(self) -> int:
+        return 2 ** self.max_level
+
+    @property
+    def solves(self) -> int:
+        """Number of solved sample points."""
+        return len(self.samples)
+
+    @property
+    def uniform_solves(self) -> int:
+        """Number of solves of a uniform grid as fine as the finest sampled cell."""
+        deepest = max(level for level, _ in self.children)
+        return (2 ** (deepest + 1) + 1) ** len(self.inputs)
+
+    def to_values(self, coordinates: tuple) -> np.ndarray:
+        """Converts lattice coordinates to input values."""
+        return self.lower + (self.upper - self.lower) * np.asarray(coordinates) / self.resolution
+
+    def cell_size(self, cell: tuple) -> int:
+        return self.resolution // 2 ** cell[0]
+
+    def corners(self, cell: tuple) -> list:
+        size = self.cell_size(cell)
+        return [
+            tuple(origin + size * bit for origin, bit in zip(cell[1], bits))
+            for bits in itertools.product((0, 1), repeat=len(self.inputs))
+        ]
+
+    def center(self, cell: tuple) -> tuple:
+        half = self.cell_size(cell) // 2
+        return tuple(origin + half for origin in cell[1])
+
+    def child_cells(self, cell: tuple) -> list:
+        half = self.cell_size(cell) // 2
+        return [
+            (cell[0] + 1, tuple(origin + half * bit for origin, bit in zip(cell[1], bits)))
+            for bits in itertools.product((0, 1), repeat=len(self.inputs))
+        ]
+
+    def split(self, cell: tuple) -> list:
+        """Splits a cell into its 2**d children and returns them."""
+        children = self.child_cells(cell)
+        self.children[cell] = children
+        for child in children:
+            self.children[child] = None
+        return children
+
+    def _interpolate_in_cell(self, cell: tuple, coordinates: np.ndarray) -> np.ndarray:
+        local = (coordinates - np.asarray(cell[1])) / self.cell_size(cell)
+        value = np.zeros(len(self.outputs))
+        for corner in self.corners(cell):
+            bits = (np.asarray(corner) - np.asarray(cell[1])) > 0
+            weight = np.prod(np.where(bits, local, 1 - local))
+            value += weight * self.samples[corner]
+        return value
+
+    def _leaf(self, coordinates: np.ndarray) -> tuple:
+        cell = (0, (0,) * len(self.inputs))
+        while self.children[cell] is not None:
+            half = self.cell_size(cell) // 2
+            upper_half = coordinates >= np.asarray(cell[1]) + half
+            origin = tuple(o + half * int(bit) for o, bit in zip(cell[1], upper_half))
+            cell = (cell[0] + 1, origin)
+        return cell
+
+    def interpolate(self, values) -> dict:
+        """
+        Interpolates the outputs at an operating point inside the map.
+
+        Args:
+            values (dict or sequence): Input values, keyed by name or in the order of `inputs`.
+
+        Returns:
+            dict: Interpolated value of each output.
+        """
+        if isinstance(values, dict):
+            values = [values[name] for name in self.inputs]
+        values = np.clip(np.asarray(values, dtype=float), self.lower, self.upper)
+        coordinates = (values - self.lower) / (self.upper - self.lower) * self.resolution
+        cell = self._leaf(coordinates)
+        interpolated = self._interpolate_in_cell(cell, coordinates)
+        return dict(zip(self.outputs, interpolated.tolist()))
+
+    def to_table(self) -> dict:
+        """
+        Returns the solved samples as columns.
+
+        Returns:
+            dict: One array per input and output name, one entry per sample.
+        """
+        coordinates = list(self.samples)
+        values = np.array([self.to_values(c) for c in coordinates]).reshape(-1, len(self.inputs))
+        outputs = np.array([self.samples[c] for c in coordinates]).reshape(-1, len(self.outputs))
+        table = {name: values[:, i] for i, name in enumerate(self.inputs)}
+        table.update({name: outputs[:, i] for i, name in enumerate(self.outputs)})
+        return table
+
+
+def _solve_samples(performance_map: PerformanceMap, point: dict, coordinates: list,
+                   config_path: str, max_workers: int):
+    points = []
+    for sample in coordinates:
+        candidate = point
+        for name, value in zip(performance_map.inputs, performance_map.to_values(sample)):
+            candidate = set_input(candidate, name, value.item())
+        points.append(candidate)
+
+    outcomes = run_operating_points(points, config_path, max_workers=max_workers)
+    table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+    for index, sample in enumerate(coordinates):
+        performance_map.samples[sample] = np.array(
+            [table[name][index] for name in performance_map.outputs])
+
+
+def generate_performance_map(point: dict, bounds: dict, tolerances: dict, max_level: int = 4,
+                             max_solves: int = None, config_path: str = DEFAULT_CONFIG_PATH,
+                             max_workers: int = None) -> PerformanceMap:
+    """
+    Builds a performance map, refining only where interpolation is inaccurate.
+
+    Every cell is checked by solving its center and comparing it with the
+    multilinear interpolation of the cell corners. Starting from the whole input
+    box, cells whose error exceeds the tolerance of any output are split in 2**d
+    children, worst first, and all new corners and centers of the children are
+    solved as one parallel batch per round. Refinement stops when every cell meets
+    the tolerances, the deepest level is reached or the solve budget is spent.
+
+    Parameters:
+        point (dict): Base operating point; the mapped inputs are overwritten.
+        bounds (dict): Input name (see `sensitivity.SENSITIVITY_INPUTS`) to (lower, upper).
+        tolerances (dict): Output name (ResultTable column) to the allowed absolute
+                           interpolation error; the keys define the mapped outputs.
+        max_level (int): Deepest refinement level.
+        max_solves (int): Optional budget of model solves.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        PerformanceMap: The refined map.
+    """
+    performance_map = PerformanceMap(bounds, tuple(tolerances), max_level)
+    tolerance = np.array([tolerances[name] for name in performance_map.outputs])
+    budget = max_solves if max_solves is not None else float('inf')
+
+    root = next(iter(performance_map.children))
+    _solve_samples(performance_map, point,
+                   performance_map.corners(root) + [performance_map.center(root)],
+                   config_path, max_workers)
+    pending = [root]
+
+    while pending:
+        candidates = []
+        for cell in pending:
+            center = performance_map.center(cell)
+            error = np.abs(performance_map._interpolate_in_cell(cell, np.asarray(center)) -
+                           performance_map.samples[center])
+            if np.any(error > tolerance) and cell[0] + 1 < max_level:
+                candidates.append((np.max(error / tolerance), cell))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        # Split the worst cells first, as long as their new samples fit in the budget
+        pending, needed = [], set()
+        for _, cell in candidates:
+            cell_points = {
+                sample for child in performance_map.child_cells(cell)
+                for sample in performance_map.corners(child) + [performance_map.center(child)]
+                if sample not in performance_map.samples
+            } - needed
+            if performance_map.solves + len(needed) + len(cell_points) > budget:
+                continue
+            needed |= cell_points
+            pending.extend(performance_map.split(cell))
+
+        if needed:
+            _solve_samples(performance_map, point, sorted(needed), config_path, max_workers)
+
+    return performance_map
@@ -0,0 +1,75 @@
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, copy_operating_point, run_operating_points
+from .domain_initializer import field_dtype
+from .grid_study import GRID_TOLERANCES
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import ResultTable
+from ..utils.config_loader import merge_config
+
+# Precision of the reference solutions
+REFERENCE_PRECISION = 'float64'
+
+
+def with_field_precision(point: dict, precision: str) -> dict:
+    """
+    Returns a copy of an operating point solved with the given field precision.
+
+    Parameters:
+        point (dict): Operating point.
+        precision (str): Precision policy of the solver fields, see `domain_initializer.field_dtype`.
+
+    Returns:
+        dict: The modified copy of the operating point.
+    """
+    field_dtype(precision)
+    point = copy_operating_point(point)
+    overlay = {'model_properties': {'field_precision': precision}}
+    point[CONFIG_OVERRIDES_KEY] = merge_config(point.get(CONFIG_OVERRIDES_KEY) or {}, overlay)
+    return point
+
+
+def precision_study(points: list, precision: str = 'float32', tolerances: dict = GRID_TOLERANCES,
+                    config_path: str = DEFAULT_CONFIG_PATH, max_workers: int = None) -> dict:
+    """
+    Validates a reduced field precision against the float64 reference.
+
+    Every operating point is solved with float64 and with the given precision in
+    one parallel batch, and the outputs of both are compared.
+
+    Parameters:
+        points (list): Operating points covering the range of interest.
+        precision (str): Precision policy to validate.
+        tolerances (dict): Output name (unrounded ResultTable column) to the allowed
+                           absolute deviation; the keys define the outputs. Defaults to
+                           the discretization tolerances of the grid study.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        dict: The 'reference' and 'values' of each output per point, their absolute
+              'errors', the largest error per output in 'max_errors', whether all
+              errors are 'within_tolerance' and the 'field_bytes' of one field
+              element in both precisions.
+    """
+    batch = ([with_field_precision(point, REFERENCE_PRECISION) for point in points] +
+             [with_field_precision(point, precision) for point in points])
+    outcomes = run_operating_points(batch, config_path, max_workers=max_workers)
+    table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+
+    count = len(points)
+    reference = {output: table[output][:count] for output in tolerances}
+    values = {output: table[output][count:] for output in tolerances}
+    errors = {output: np.abs(values[output] - reference[output]) for output in tolerances}
+    max_errors = {output: float(np.max(errors[output])) for output in tolerances}
+
+    return {
+        'reference': reference,
+        'values': values,
+        'errors': errors,
+        'max_errors': max_errors,
+        'within_tolerance': all(max_errors[output] <= tolerances[output] for output in tolerances),
+        'field_bytes': {
+            REFERENCE_PRECISION: np.dtype(field_dtype(REFERENCE_PRECISION)).itemsize,
+            precision: np.dtype(field_dtype(precision)).itemsize,
+        },
+    }
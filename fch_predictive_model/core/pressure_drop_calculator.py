@@ -1,10 +1,39 @@
+import numpy as np
+
+SIDES = ('dry', 'wet')
+
+# Decimals of pressure drops presented to users, in kPa
+PRESSURE_DROP_DIGITS = 1
+
+
+def pressure_drop(flow_rate, layers, poly_coefficient, line_coefficient):
+    """
+    Calculate the unrounded pressure drop in kPa.
+
+    All arguments may be NumPy arrays and are broadcast against each other.
+
+    Parameters:
+        flow_rate: Flow rate in m³/s.
+        layers: Number of layers.
+        poly_coefficient: Coefficient of the quadratic term.
+        line_coefficient: Coefficient of the linear term.
+
+    Returns:
+        Pressure drop in kPa, a float or an array of the broadcast shape.
+    """
+    flow_per_layer = np.divide(flow_rate, layers)
+    flow_SLPM = flow_per_layer / 1.29 * 60000  # Convert to SLPM
+
+    return poly_coefficient * (flow_SLPM) ** 2 + line_coefficient * flow_SLPM
+
+
 def calculate_pressure_drop(
     flow_rate: float, 
     layers: int, 
     coefficients: dict
 ) -> float:
     """
-    Calculate pressure drop in kPa.
+    Calculate pressure drop in kPa, rounded for presentation.
 
     Parameters:
         flow_rate (float): Flow rate in m³/s.
@@ -14,12 +43,75 @@ def calculate_pressure_drop(
     Returns:
         float: Pressure drop in kPa.
     """
-    poly_coefficient = coefficients['poly_coefficient']
-    line_coefficient = coefficients['line_coefficient']
+    return round(float(pressure_drop(
+        flow_rate, layers, coefficients['poly_coefficient'], coefficients['line_coefficient']
+    )), PRESSURE_DROP_DIGITS)
 
-    flow_per_layer = flow_rate / layers
-    flow_SLPM = flow_per_layer / 1.29 * 60000  # Convert to SLPM
 
-    pressure_drop = poly_coefficient * (flow_SLPM) ** 2 + line_coefficient * flow_SLPM
-    
-    return round(pressure_drop, 1)
+def pressure_drop_surface(flow_rates, layer_counts, pressure_drop_model: dict,
+                          product_models: list = None, rounded: bool = False) -> dict:
+    """
+    Evaluates the pressure drop over every flow rate, layer count and product at once.
+
+    Parameters:
+        flow_rates: Flow rates in m³/s, applied to both sides.
+        layer_counts: Numbers of layers.
+        pressure_drop_model (dict): The 'pressure_drop_model' section of the configuration.
+        product_models (list): Product models to evaluate; defaults to all configured ones.
+        rounded (bool): Round like the model results; by default the values are exact.
+
+    Returns:
+        dict: The 'product_models', 'sides', 'flow_rates' and 'layer_counts' spanning
+              the surface, and the 'pressure_drop' array in kPa of shape
+              (products, sides, flow rates, layer counts).
+
+    Raises:
+        ValueError: If a product model has no pressure drop coefficients.
+    """
+    product_models = list(product_models or pressure_drop_model)
+    unknown = [product for product in product_models if product not in pressure_drop_model]
+    if unknown:
+        raise ValueError(f"No pressure drop model for the products: {unknown}")
+
+    flow_rates = np.asarray(flow_rates, dtype=float).ravel()
+    layer_counts = np.asarray(layer_counts).ravel()
+    coefficients = {
+        name: np.array([[pressure_drop_model[product][side][name] for side in SIDES]
+                        for product in product_models])[:, :, np.newaxis, np.newaxis]
+        for name in ('poly_coefficient', 'line_coefficient')
+    }
+    values = pressure_drop(flow_rates[:, np.newaxis], layer_counts,
+                           coefficients['poly_coefficient'], coefficients['line_coefficient'])
+
+    return {
+        'product_models': product_models,
+        'sides': SIDES,
+        'flow_rates': flow_rates,
+        'layer_counts': layer_counts,
+        'pressure_drop': np.round(values, PRESSURE_DROP_DIGITS) if rounded else values,
+    }
+
+
+def pressure_drop_records(surface: dict) -> list:
+    """
+    Flattens a pressure drop surface into one row per product, flow rate and layer count.
+
+    Parameters:
+        surface (dict): Surface as returned by `pressure_drop_surface`.
+
+    Returns:
+        list: Rows with the 'product_model', 'flow_rate', 'layer_count' and the
+              'pressure_drop_dry' and 'pressure_drop_wet' in kPa.
+    """
+    values = surface['pressure_drop']
+    return [
+        {
+            'product_model': product,
+            'flow_rate': flow_rate.item(),
+            'layer_count': layer_count.item(),
+            **{f'pressure_drop_{side}': values[p, s, f, l].item() for s, side in enumerate(surface['sides'])},
+        }
+        for p, product in enumerate(surface['product_models'])
+        for f, flow_rate in enumerate(surface['flow_rates'])
+        for l, layer_count in enumerate(surface['layer_counts'])
+    ]
@@ -1,139 +1,498 @@
+from collections.abc import Mapping
 import numpy as np
 from ..utils.psychrometric_functions import (calculate_temperature,
                                              calculate_relative_humidity, calculate_dew_point
                                              )
 
+# Constants
+DRY = 'dry'
+WET = 'wet'
+INLET = 'inlet'
+OUTLET = 'outlet'
+SIDE_INDEX = {DRY: 0, WET: 1}
+PORT_INDEX = {INLET: 0, OUTLET: 1}
 
-def result_compiler(pressures, pressure_drop, enthalpy_matrix, humidity_ratio_matrix, flow_rate):
-    # Pressure results
-    pressure_results = {
-        'dry': {
-            'inlet': round(pressures['dry'], 1),
-            'outlet': round(pressures['dry'] - pressure_drop['dry'], 1)
-        },
-        'wet': {
-            'inlet': round(pressures['wet'], 1),
-            'outlet': round(pressures['wet'] - pressure_drop['wet'], 1)
-        }
-    }
+# Keys of the compiled result, in the order they are presented
+RESULT_KEYS = (
+    'flow_rate', 'pressure', 'enthalpy', 'humidity_ratio', 'temperature',
+    'relative_humidity', 'dew_point', 'pressure_drop', 'DPAT',
+    'vapor_transport', 'water_recovery_ratio', 'max__pressure_differential'
+)
 
-    # Enthalpy results
-    enthalpy_results = {
-        'dry': {
-            'inlet': round(np.mean(enthalpy_matrix['dry'][:, 0]), 0),
-            'outlet': round(np.mean(enthalpy_matrix['dry'][:, -1]), 0)
-        },
-        'wet': {
-            'inlet': round(np.mean(enthalpy_matrix['wet'][0, :]), 1),
-            'outlet': round(np.mean(enthalpy_matrix['wet'][-1, :]), 1)
-        }
-    }
 
-    # Humidity ratio results
-    humidity_ratio_results = {
-        'dry': {
-            'inlet': round(np.mean(humidity_ratio_matrix['dry'][:, 0]), 3),
-            'outlet': round(np.mean(humidity_ratio_matrix['dry'][:, -1]), 3)
-        },
-        'wet': {
-            'inlet': round(np.mean(humidity_ratio_matrix['wet'][0, :]), 3),
-            'outlet': round(np.mean(humidity_ratio_matrix['wet'][-1, :]), 3)
-        }
+def boundary_means(enthalpy_matrix, humidity_ratio_matrix) -> np.ndarray:
+    """
+    Average the converged fields over the inlet and outlet boundaries.
+
+    The dry side flows along the columns (inlet at column 0) and the wet side
+    along the rows (inlet at row 0).
+
+    Parameters:
+        enthalpy_matrix (dict): Enthalpy matrices for 'dry' and 'wet' conditions.
+        humidity_ratio_matrix (dict): Humidity ratio matrices for 'dry' and 'wet' conditions.
+
+    Returns:
+        np.ndarray: Array of shape (2, 2, 2) indexed as
+                    [quantity (enthalpy, humidity ratio), side (dry, wet), port (inlet, outlet)].
+    """
+    means = np.empty((2, 2, 2))
+    for quantity, matrix in enumerate((enthalpy_matrix, humidity_ratio_matrix)):
+        # Accumulated in float64 also for float32 fields
+        means[quantity, 0, 0] = np.mean(matrix[DRY][:, 0], dtype=np.float64)
+        means[quantity, 0, 1] = np.mean(matrix[DRY][:, -1], dtype=np.float64)
+        means[quantity, 1, 0] = np.mean(matrix[WET][0, :], dtype=np.float64)
+        means[quantity, 1, 1] = np.mean(matrix[WET][-1, :], dtype=np.float64)
+    return means
+
+
+def _by_side_and_port(func) -> dict:
+    return {
+        side: {port: func(side, port) for port in (INLET, OUTLET)}
+        for side in (DRY, WET)
     }
 
-    # Temperature results
-    temperature_results = {
-        'dry': {
-            'inlet': round(calculate_temperature(
-                enthalpy_results['dry']['inlet'], humidity_ratio_results['dry']['inlet']), 1
-            ),
-            'outlet': round(calculate_temperature(
-                enthalpy_results['dry']['outlet'], humidity_ratio_results['dry']['outlet']), 1
-            )
-        },
-        'wet': {
-            'inlet': round(calculate_temperature(
-                enthalpy_results['wet']['inlet'], humidity_ratio_results['wet']['inlet']), 1
-            ),
-            'outlet': round(calculate_temperature(
-                enthalpy_results['wet']['outlet'], humidity_ratio_results['wet']['outlet']), 1
+
+class CompiledResult(Mapping):
+    """
+    Compact, read-only view of a model solution.
+
+    Only the boundary means of the converged fields and references to the input
+    dictionaries are stored. Every derived quantity (temperatures, relative
+    humidities, dew points, DPAT, vapor transport, ...) is computed on first
+    access and cached. The object behaves like the nested result dictionary
+    previously returned by `result_compiler`, so it can be rendered by the web
+    template and passed to `write_to_excel` unchanged.
+
+    Attributes:
+        flow_rate (dict): Mass flow rates for 'dry' and 'wet' conditions.
+        pressure_drop (dict): Pressure drops for 'dry' and 'wet' conditions.
+    """
+
+    __slots__ = (
+        'flow_rate', 'pressure_drop', '_pressures', '_means', '_pressure',
+        '_enthalpy', '_humidity_ratio', '_temperature', '_relative_humidity',
+        '_dew_point', '_vapor_transport'
+    )
+
+    def __init__(self, pressures: dict, pressure_drop: dict, means: np.ndarray, flow_rate: dict):
+        """
+        Initializes the result from the boundary means of a solution.
+
+        Args:
+            pressures (dict): Inlet pressures for 'dry' and 'wet' conditions.
+            pressure_drop (dict): Pressure drops for 'dry' and 'wet' conditions.
+            means (np.ndarray): Boundary means as returned by `boundary_means`.
+            flow_rate (dict): Mass flow rates for 'dry' and 'wet' conditions.
+        """
+        self.flow_rate = flow_rate
+        self.pressure_drop = pressure_drop
+        self._pressures = pressures
+        self._means = means
+        self._pressure = None
+        self._enthalpy = None
+        self._humidity_ratio = None
+        self._temperature = None
+        self._relative_humidity = None
+        self._dew_point = None
+        self._vapor_transport = None
+
+    @property
+    def pressure(self) -> dict:
+        if self._pressure is None:
+            self._pressure = {
+                side: {
+                    INLET: round(self._pressures[side], 1),
+                    OUTLET: round(self._pressures[side] - self.pressure_drop[side], 1)
+                }
+                for side in (DRY, WET)
+            }
+        return self._pressure
+
+    @property
+    def enthalpy(self) -> dict:
+        if self._enthalpy is None:
+            digits = {DRY: 0, WET: 1}
+            self._enthalpy = _by_side_and_port(
+                lambda side, port: round(self._mean(0, side, port), digits[side])
             )
-        }
-    }
+        return self._enthalpy
 
-    # Relative humidity results
-    relative_humidity_results = {
-        'dry': {
-            'inlet': round(calculate_relative_humidity(
-                temperature_results['dry']['inlet'], w=humidity_ratio_results['dry']['inlet'],
-                P=pressure_results['dry']['inlet']), 1
-            ),
-            'outlet': round(calculate_relative_humidity(
-                temperature_results['dry']['outlet'], w=humidity_ratio_results['dry']['outlet'],
-                P=pressure_results['dry']['outlet']), 1
+    @property
+    def humidity_ratio(self) -> dict:
+        if self._humidity_ratio is None:
+            self._humidity_ratio = _by_side_and_port(
+                lambda side, port: round(self._mean(1, side, port), 3)
             )
-        },
-        'wet': {
-            'inlet': round(calculate_relative_humidity(
-                temperature_results['wet']['inlet'], w=humidity_ratio_results['wet']['inlet'],
-                P=pressure_results['wet']['inlet']), 1
-            ),
-            'outlet': round(calculate_relative_humidity(
-                temperature_results['wet']['outlet'], w=humidity_ratio_results['wet']['outlet'],
-                P=pressure_results['wet']['outlet']), 1
+        return self._humidity_ratio
+
+    @property
+    def temperature(self) -> dict:
+        if self._temperature is None:
+            enthalpy = self.enthalpy
+            humidity_ratio = self.humidity_ratio
+            self._temperature = _by_side_and_port(
+                lambda side, port: round(calculate_temperature(
+                    enthalpy[side][port], humidity_ratio[side][port]), 1)
             )
-        }
-    }
+        return self._temperature
 
-    # Dew point results
-    dew_point_results = {
-        'dry': {
-            'inlet': round(calculate_dew_point(
-                temperature_results['dry']['inlet'], relative_humidity_results['dry']['inlet']), 1
-            ),
-            'outlet': round(calculate_dew_point(
-                temperature_results['dry']['outlet'], relative_humidity_results['dry']['outlet']), 1
+    @property
+    def relative_humidity(self) -> dict:
+        if self._relative_humidity is None:
+            temperature = self.temperature
+            humidity_ratio = self.humidity_ratio
+            pressure = self.pressure
+            self._relative_humidity = _by_side_and_port(
+                lambda side, port: round(calculate_relative_humidity(
+                    temperature[side][port], w=humidity_ratio[side][port],
+                    P=pressure[side][port]), 1)
             )
-        },
-        'wet': {
-            'inlet': round(calculate_dew_point(
-                temperature_results['wet']['inlet'], relative_humidity_results['wet']['inlet']), 1
-            ),
-            'outlet': round(calculate_dew_point(
-                temperature_results['wet']['outlet'], relative_humidity_results['wet']['outlet']), 1
+        return self._relative_humidity
+
+    @property
+    def dew_point(self) -> dict:
+        if self._dew_point is None:
+            temperature = self.temperature
+            relative_humidity = self.relative_humidity
+            self._dew_point = _by_side_and_port(
+                lambda side, port: round(calculate_dew_point(
+                    temperature[side][port], relative_humidity[side][port]), 1)
             )
+        return self._dew_point
+
+    @property
+    def DPAT(self) -> float:
+        dew_point = self.dew_point
+        return round(dew_point[WET][INLET] - dew_point[DRY][OUTLET], 1)
+
+    @property
+    def vapor_transport(self) -> float:
+        if self._vapor_transport is None:
+            humidity_ratio = self.humidity_ratio
+            self._vapor_transport = round(self.flow_rate[DRY] * (
+                humidity_ratio[DRY][OUTLET] - humidity_ratio[DRY][INLET]), 1)
+        return self._vapor_transport
+
+    @property
+    def water_recovery_ratio(self) -> float:
+        return round(
+            self.vapor_transport /
+            (self.flow_rate[WET] * self.humidity_ratio[WET][INLET]) * 100, 1)
+
+    @property
+    def max__pressure_differential(self) -> float:
+        pressure = self.pressure
+        return round(max(
+            max(pressure[DRY].values()), max(pressure[WET].values())
+        ) - min(
+            min(pressure[DRY].values()), min(pressure[WET].values())
+        ), 1)
+
+    def _mean(self, quantity: int, side: str, port: str) -> float:
+        return self._means[quantity, SIDE_INDEX[side], PORT_INDEX[port]]
+
+    def __getitem__(self, key):
+        if key not in RESULT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(RESULT_KEYS)
+
+    def to_dict(self) -> dict:
+        """
+        Builds the full nested result dictionary.
+
+        Returns:
+            dict: Plain nested dictionary, suitable for JSON serialisation.
+        """
+        return {key: self[key] for key in RESULT_KEYS}
+
+    def to_record(self) -> dict:
+        """
+        Returns the compact inputs of the result, from which `from_record` rebuilds it.
+
+        Returns:
+            dict: 'pressures', 'pressure_drop', 'means' (flattened) and 'flow_rate' as
+                  plain floats, suitable for JSON serialisation.
+        """
+        def to_float(values: dict) -> dict:
+            return {side: float(value) for side, value in values.items()}
+
+        return {
+            'pressures': to_float(self._pressures),
+            'pressure_drop': to_float(self.pressure_drop),
+            'means': np.ravel(self._means).tolist(),
+            'flow_rate': to_float(self.flow_rate),
         }
-    }
 
-    dewpoint_temperature_approach = round(dew_point_results['wet']['inlet'] -
-                                          dew_point_results['dry']['outlet'], 1)
+    @classmethod
+    def from_record(cls, record: dict) -> 'CompiledResult':
+        """
+        Rebuilds a result from the output of `to_record`.
 
-    vapor_transport = round(flow_rate['dry']*(humidity_ratio_results['dry']
-                                              ['outlet']-humidity_ratio_results['dry']['inlet']), 1)
+        Args:
+            record (dict): Compact inputs of the result.
 
-    water_recovery_ratio = round(
-        (vapor_transport) /
-        (flow_rate['wet']*(humidity_ratio_results['wet']['inlet']))*100, 1)
+        Returns:
+            CompiledResult: The result.
+        """
+        return cls(record['pressures'], record['pressure_drop'],
+                   np.array(record['means']).reshape(2, 2, 2), record['flow_rate'])
 
-    max_differential = round(max(
-        max(pressure_results['dry'].values()), max(
-            pressure_results['wet'].values())
-    ) - min(
-        min(pressure_results['dry'].values()), min(
-            pressure_results['wet'].values())
-    ), 1)
+    def __repr__(self):
+        return (f"CompiledResult(DPAT={self.DPAT}, "
+                f"vapor_transport={self.vapor_transport}, "
+                f"water_recovery_ratio={self.water_recovery_ratio})")
 
-    return {
-        'flow_rate': flow_rate,
-        'pressure': pressure_results,
-        'enthalpy': enthalpy_results,
-        'humidity_ratio': humidity_ratio_results,
-        'temperature': temperature_results,
-        'relative_humidity': relative_humidity_results,
-        'dew_point': dew_point_results,
-        'pressure_drop': pressure_drop,
-        'DPAT': dewpoint_temperature_approach,
-        'vapor_transport': vapor_transport,
-        'water_recovery_ratio': water_recovery_ratio,
-        'max__pressure_differential': max_differential
-    }
+
+def result_compiler(pressures, pressure_drop, enthalpy_matrix, humidity_ratio_matrix, flow_rate):
+    """
+    Compiles the converged fields into a lazily evaluated result.
+
+    Parameters:
+        pressures (dict): Inlet pressures for 'dry' and 'wet' conditions.
+        pressure_drop (dict): Pressure drops for 'dry' and 'wet' conditions.
+        enthalpy_matrix (dict): Converged enthalpy matrices.
+        humidity_ratio_matrix (dict): Converged humidity ratio matrices.
+        flow_rate (dict): Mass flow rates for 'dry' and 'wet' conditions.
+
+    Returns:
+        CompiledResult: Mapping with the same keys and nesting as the former result dictionary.
+    """
+    return CompiledResult(
+        pressures, pressure_drop,
+        boundary_means(enthalpy_matrix, humidity_ratio_matrix), flow_rate
+    )
+
+
+def _column_paths() -> dict:
+    paths = {}
+    for key in RESULT_KEYS:
+        if key in ('flow_rate', 'pressure_drop'):
+            for side in (DRY, WET):
+                paths[f"{key}_{side}"] = (key, side)
+        elif key in ('DPAT', 'vapor_transport', 'water_recovery_ratio',
+                     'max__pressure_differential'):
+            paths[key] = (key,)
+        else:
+            for side in (DRY, WET):
+                for port in (INLET, OUTLET):
+                    paths[f"{key}_{side}_{port}"] = (key, side, port)
+    return paths
+
+
+_COLUMN_PATHS = _column_paths()
+
+# Flat column names of a ResultTable, e.g. 'temperature_dry_outlet' or 'DPAT'
+RESULT_COLUMNS = tuple(_COLUMN_PATHS)
+
+
+def stack_boundary_means(enthalpy_matrices, humidity_ratio_matrices) -> np.ndarray:
+    """
+    Average stacked converged fields over the inlet and outlet boundaries.
+
+    Parameters:
+        enthalpy_matrices (dict): Enthalpy fields of shape (N, n, n) for 'dry' and 'wet' conditions.
+        humidity_ratio_matrices (dict): Humidity ratio fields of shape (N, n, n) for 'dry' and 'wet'.
+
+    Returns:
+        np.ndarray: Array of shape (N, 2, 2, 2), one `boundary_means` block per point.
+    """
+    count = np.shape(enthalpy_matrices[DRY])[0]
+    means = np.empty((count, 2, 2, 2))
+    for quantity, matrix in enumerate((enthalpy_matrices, humidity_ratio_matrices)):
+        means[:, quantity, 0, 0] = np.mean(matrix[DRY][:, :, 0], axis=1, dtype=np.float64)
+        means[:, quantity, 0, 1] = np.mean(matrix[DRY][:, :, -1], axis=1, dtype=np.float64)
+        means[:, quantity, 1, 0] = np.mean(matrix[WET][:, 0, :], axis=1, dtype=np.float64)
+        means[:, quantity, 1, 1] = np.mean(matrix[WET][:, -1, :], axis=1, dtype=np.float64)
+    return means
+
+
+def flatten_result(results) -> dict:
+    """
+    Flattens a compiled result into a single-level row.
+
+    Parameters:
+        results (Mapping): CompiledResult or nested result dictionary.
+
+    Returns:
+        dict: Values keyed by the names in `RESULT_COLUMNS`.
+    """
+    row = {}
+    for name in RESULT_COLUMNS:
+        value = results
+        for key in _COLUMN_PATHS[name]:
+            value = value[key]
+        row[name] = value
+    return row
+
+
+class ResultTable:
+    """
+    Column-oriented (struct-of-arrays) results for many operating points.
+
+    Every output column is computed in a single vectorized pass, with the same
+    rounding as `CompiledResult` unless `rounded` is False. Columns are addressed by the names in
+    `RESULT_COLUMNS`; `row` rebuilds the per-point `CompiledResult`.
+
+    Attributes:
+        pressures (dict): Inlet pressure arrays for 'dry' and 'wet' conditions.
+        pressure_drop (dict): Pressure drop arrays for 'dry' and 'wet' conditions.
+        flow_rate (dict): Mass flow rate arrays for 'dry' and 'wet' conditions.
+        means (np.ndarray): Boundary means of shape (N, 2, 2, 2).
+        rounded (bool): Whether the columns are rounded for presentation.
+        columns (dict): Output column name to array of length N.
+    """
+
+    def __init__(self, pressures: dict, pressure_drop: dict, means: np.ndarray, flow_rate: dict,
+                 rounded: bool = True):
+        """
+        Compiles all output columns from per-point inputs and boundary means.
+
+        Args:
+            pressures (dict): Inlet pressures for 'dry' and 'wet' conditions, arrays of length N.
+            pressure_drop (dict): Pressure drops for 'dry' and 'wet' conditions, arrays of length N.
+            means (np.ndarray): Boundary means of shape (N, 2, 2, 2).
+            flow_rate (dict): Mass flow rates for 'dry' and 'wet' conditions, arrays of length N.
+            rounded (bool): Round like `CompiledResult`; pass False for exact values, e.g.
+                            for finite differences.
+        """
+        self.pressures = {side: np.asarray(pressures[side], dtype=float) for side in (DRY, WET)}
+        self.pressure_drop = {
+            side: np.asarray(pressure_drop[side], dtype=float) for side in (DRY, WET)
+        }
+        self.flow_rate = {side: np.asarray(flow_rate[side], dtype=float) for side in (DRY, WET)}
+        self.means = np.asarray(means, dtype=float)
+        self.rounded = rounded
+        self.columns = self._compile_columns()
+
+    @classmethod
+    def from_results(cls, results, rounded: bool = True) -> 'ResultTable':
+        """
+        Stacks individual compiled results into a table.
+
+        Args:
+            results (iterable): CompiledResult instances.
+            rounded (bool): Whether the columns are rounded for presentation.
+
+        Returns:
+            ResultTable: Table with one row per result.
+        """
+        results = list(results)
+        return cls(
+            {side: [r._pressures[side] for r in results] for side in (DRY, WET)},
+            {side: [r.pressure_drop[side] for r in results] for side in (DRY, WET)},
+            np.array([r._means for r in results]).reshape(len(results), 2, 2, 2),
+            {side: [r.flow_rate[side] for r in results] for side in (DRY, WET)},
+            rounded,
+        )
+
+    def _round(self, values, digits: int):
+        return np.round(values, digits) if self.rounded else values
+
+    def _compile_columns(self) -> dict:
+        columns = {}
+        pressure = {}
+        for side in (DRY, WET):
+            columns[f'flow_rate_{side}'] = self.flow_rate[side]
+            columns[f'pressure_drop_{side}'] = self.pressure_drop[side]
+            pressure[side, INLET] = self._round(self.pressures[side], 1)
+            pressure[side, OUTLET] = self._round(
+                self.pressures[side] - self.pressure_drop[side], 1)
+
+        enthalpy_digits = {DRY: 0, WET: 1}
+        for side in (DRY, WET):
+            for port in (INLET, OUTLET):
+                side_index, port_index = SIDE_INDEX[side], PORT_INDEX[port]
+                enthalpy = self._round(
+                    self.means[:, 0, side_index, port_index], enthalpy_digits[side])
+                humidity_ratio = self._round(self.means[:, 1, side_index, port_index], 3)
+                temperature = self._round(calculate_temperature(enthalpy, humidity_ratio), 1)
+                relative_humidity = self._round(calculate_relative_humidity(
+                    temperature, w=humidity_ratio, P=pressure[side, port]), 1)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    dew_point = self._round(calculate_dew_point(temperature, relative_humidity), 1)
+
+                suffix = f'{side}_{port}'
+                columns[f'pressure_{suffix}'] = pressure[side, port]
+                columns[f'enthalpy_{suffix}'] = enthalpy
+                columns[f'humidity_ratio_{suffix}'] = humidity_ratio
+                columns[f'temperature_{suffix}'] = temperature
+                columns[f'relative_humidity_{suffix}'] = relative_humidity
+                columns[f'dew_point_{suffix}'] = dew_point
+
+        columns['DPAT'] = self._round(
+            columns['dew_point_wet_inlet'] - columns['dew_point_dry_outlet'], 1)
+        columns['vapor_transport'] = self._round(self.flow_rate[DRY] * (
+            columns['humidity_ratio_dry_outlet'] - columns['humidity_ratio_dry_inlet']), 1)
+        columns['water_recovery_ratio'] = self._round(
+            columns['vapor_transport'] /
+            (self.flow_rate[WET] * columns['humidity_ratio_wet_inlet']) * 100, 1)
+        all_pressures = np.stack(list(pressure.values()))
+        columns['max__pressure_differential'] = self._round(
+            all_pressures.max(axis=0) - all_pressures.min(axis=0), 1)
+
+        return {name: columns[name] for name in RESULT_COLUMNS}
+
+    def __len__(self) -> int:
+        return self.means.shape[0]
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def row(self, index: int) -> CompiledResult:
+        """
+        Returns the compiled result of a single operating point.
+
+        Args:
+            index (int): Row index.
+
+        Returns:
+            CompiledResult: Result of the operating point at `index`.
+        """
+        return CompiledResult(
+            {side: self.pressures[side][index].item() for side in (DRY, WET)},
+            {side: self.pressure_drop[side][index].item() for side in (DRY, WET)},
+            self.means[index],
+            {side: self.flow_rate[side][index].item() for side in (DRY, WET)},
+        )
+
+    def to_records(self) -> list:
+        """
+        Converts the table to a list of flat row dictionaries.
+
+        Returns:
+            list: One dictionary per operating point, keyed by column name.
+        """
+        return [
+            {name: values[index].item() for name, values in self.columns.items()}
+            for index in range(len(self))
+        ]
+
+    def __repr__(self):
+        return f"ResultTable(rows={len(self)}, columns={len(self.columns)})"
+
+
+def batch_result_compiler(pressures, pressure_drop, enthalpy_matrices, humidity_ratio_matrices,
+                          flow_rate) -> ResultTable:
+    """
+    Compiles stacked converged fields of many operating points in one pass.
+
+    Parameters:
+        pressures (dict): Inlet pressures for 'dry' and 'wet' conditions, arrays of length N.
+        pressure_drop (dict): Pressure drops for 'dry' and 'wet' conditions, arrays of length N.
+        enthalpy_matrices (dict): Enthalpy fields of shape (N, n, n).
+        humidity_ratio_matrices (dict): Humidity ratio fields of shape (N, n, n).
+        flow_rate (dict): Mass flow rates for 'dry' and 'wet' conditions, arrays of length N.
+
+    Returns:
+        ResultTable: Column-oriented results.
+    """
+    return ResultTable(
+        pressures, pressure_drop,
+        stack_boundary_means(enthalpy_matrices, humidity_ratio_matrices), flow_rate
+    )
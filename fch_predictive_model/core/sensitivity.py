@@ -0,0 +1,149 @@
+import numpy as np
+from .batch_runner import (
+    CONFIG_OVERRIDES_KEY, copy_operating_point, run_operating_point, run_operating_points
+)
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import ResultTable
+from ..utils.config_loader import load_config, merge_config
+
+# Inputs of the sensitivity report. Operating point inputs are addressed as
+# '<point key>.<side>', configuration inputs as '<config section>.<key>'.
+SENSITIVITY_INPUTS = (
+    'mass_flow_rates.dry', 'mass_flow_rates.wet',
+    'temperatures.dry', 'temperatures.wet',
+    'relative_humidities.dry', 'relative_humidities.wet',
+    'pressures.dry', 'pressures.wet',
+    'life_cycle_factor',
+    'membrane_properties.mass_transfer_resistance',
+    'membrane_properties.thermal_conductivity',
+)
+
+# Outputs of the sensitivity report, as ResultTable column names
+SENSITIVITY_OUTPUTS = (
+    'DPAT', 'vapor_transport', 'relative_humidity_dry_outlet', 'relative_humidity_wet_outlet',
+)
+
+_CONFIG_SECTIONS = ('membrane_properties', 'air_properties')
+
+
+def get_input(point: dict, config: dict, name: str) -> float:
+    """
+    Reads the value of a sensitivity input.
+
+    Parameters:
+        point (dict): Operating point.
+        config (dict): Configuration the point is solved with.
+        name (str): Input name, see `SENSITIVITY_INPUTS`.
+
+    Returns:
+        float: Current value of the input.
+    """
+    if name == 'life_cycle_factor':
+        if isinstance(point['life_cycle'], (int, float)):
+            return point['life_cycle']
+        return config['life_cycle_factor'][point['life_cycle']]
+    section, key = name.split('.')
+    if section in _CONFIG_SECTIONS:
+        return config[section][key]
+    return point[section][key]
+
+
+def set_input(point: dict, name: str, value: float) -> dict:
+    """
+    Returns a copy of an operating point with one sensitivity input changed.
+
+    Configuration inputs are applied through the point's configuration overlay, and
+    the life-cycle factor replaces the life cycle stage by a continuous factor.
+
+    Parameters:
+        point (dict): Operating point.
+        name (str): Input name, see `SENSITIVITY_INPUTS`.
+        value (float): New value of the input.
+
+    Returns:
+        dict: The modified copy of the operating point.
+    """
+    point = copy_operating_point(point)
+    if name == 'life_cycle_factor':
+        point['life_cycle'] = value
+        return point
+
+    section, key = name.split('.')
+    if section not in _CONFIG_SECTIONS:
+        point[section][key] = value
+        return point
+    overlay = {section: {key: value}}
+    point[CONFIG_OVERRIDES_KEY] = merge_config(point.get(CONFIG_OVERRIDES_KEY) or {}, overlay)
+    return point
+
+
+def compute_sensitivities(point: dict, inputs: tuple = SENSITIVITY_INPUTS,
+                          outputs: tuple = SENSITIVITY_OUTPUTS, relative_step: float = 0.01,
+                          central: bool = False, config_path: str = DEFAULT_CONFIG_PATH,
+                          max_workers: int = None) -> dict:
+    """
+    Computes the finite-difference Jacobian of the outputs around an operating point.
+
+    The base point is solved first; every perturbed point is then warm-started from
+    the base solution and all perturbed points are solved concurrently. Outputs are
+    taken unrounded so that small steps are resolved.
+
+    Parameters:
+        point (dict): Base operating point.
+        inputs (tuple): Input names, see `SENSITIVITY_INPUTS`.
+        outputs (tuple): ResultTable column names to differentiate.
+        relative_step (float): Step size relative to the input value.
+        central (bool): Use central instead of forward differences (twice the solves).
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        dict: 'base' output values, input 'values' and 'steps', the 'jacobian' and the
+              dimensionless 'elasticity' as {output: {input: value}}, and a flat 'table'
+              with one row per output and input.
+    """
+    config = load_config(config_path, point.get(CONFIG_OVERRIDES_KEY))
+    base_results, base_fields = run_operating_point(point, config_path)
+
+    values = {name: get_input(point, config, name) for name in inputs}
+    steps = {name: relative_step * (abs(value) or 1.0) for name, value in values.items()}
+    directions = (1, -1) if central else (1,)
+
+    perturbed_points = [
+        set_input(point, name, values[name] + direction * steps[name])
+        for name in inputs for direction in directions
+    ]
+    outcomes = run_operating_points(
+        perturbed_points, config_path, [base_fields] * len(perturbed_points), max_workers)
+
+    table = ResultTable.from_results(
+        [base_results] + [results for results, _ in outcomes], rounded=False)
+    base = {output: table[output][0].item() for output in outputs}
+
+    jacobian = {output: {} for output in outputs}
+    elasticity = {output: {} for output in outputs}
+    rows = []
+    for index, name in enumerate(inputs):
+        for output in outputs:
+            column = table[output][1:].reshape(len(inputs), len(directions))
+            if central:
+                derivative = (column[index, 0] - column[index, 1]) / (2 * steps[name])
+            else:
+                derivative = (column[index, 0] - base[output]) / steps[name]
+            derivative = derivative.item()
+            jacobian[output][name] = derivative
+            elasticity[output][name] = (
+                derivative * values[name] / base[output] if base[output] else np.nan)
+            rows.append({
+                'output': output, 'input': name, 'derivative': derivative,
+                'elasticity': elasticity[output][name]
+            })
+
+    return {
+        'base': base,
+        'values': values,
+        'steps': steps,
+        'jacobian': jacobian,
+        'elasticity': elasticity,
+        'table': rows,
+    }
@@ -0,0 +1,231 @@
+import json
+import os
+import threading
+import numpy as np
+from .active_set import ActiveSet
+from .model_trainer import solve
+
+# Engine name that picks the engine expected to be fastest from the cost model
+AUTO_ENGINE = 'auto'
+
+# Converged solves of an engine needed before its cost is predicted; engines with
+# fewer are tried first by the automatic selection
+MIN_OBSERVATIONS = 3
+
+# Regularization of the cost regression, keeping it defined with few observations
+COST_RIDGE = 1e-3
+
+# Inputs of the cost model, see `engine_features`
+FEATURE_NAMES = ('mesh_cells', 'flow_ratio', 'humidity_difference', 'life_cycle_factor')
+
+
+def solve_standard(*args, **kwargs):
+    """Iterates over the whole domain until convergence, see `model_trainer.solve`."""
+    return solve(*args, **kwargs)
+
+
+def solve_active_set(*args, **kwargs):
+    """Skips the converged regions of the domain, see `active_set.ActiveSet`."""
+    return solve(*args, active_set=ActiveSet(), **kwargs)
+
+
+# Solver engines by name. An engine takes the arguments of `model_trainer.solve`
+# (without the active set) and returns the same fields, converged to the same threshold.
+SOLVER_ENGINES = {
+    'standard': solve_standard,
+    'active_set': solve_active_set,
+}
+
+
+def register_engine(name: str, engine):
+    """
+    Adds a solver engine to the registry, making it selectable by name and by the
+    automatic selection.
+
+    Parameters:
+        name (str): Engine name.
+        engine (callable): Solve function with the interface of `model_trainer.solve`.
+
+    Raises:
+        ValueError: If the name is taken or reserved.
+    """
+    if name == AUTO_ENGINE or name in SOLVER_ENGINES:
+        raise ValueError(f"Solver engine {name!r} is already defined")
+    SOLVER_ENGINES[name] = engine
+
+
+def validate_engine(name: str) -> str:
+    """
+    Checks a solver engine name.
+
+    Parameters:
+        name (str): Engine name or `AUTO_ENGINE`.
+
+    Returns:
+        str: The name.
+
+    Raises:
+        ValueError: If no such engine is registered.
+    """
+    if name != AUTO_ENGINE and name not in SOLVER_ENGINES:
+        raise ValueError(
+            f"Unknown solver engine {name!r}, expected one of {[AUTO_ENGINE, *SOLVER_ENGINES]}")
+    return name
+
+
+def engine_features(mesh_size: int, mass_flow_rates: dict, relative_humidities: dict,
+                    life_cycle_factor: float) -> dict:
+    """
+    Describes an operating point by the inputs that drive the solver cost.
+
+    Parameters:
+        mesh_size (int): Number of cells per side of the domain.
+        mass_flow_rates (dict): Mass flow rates for dry and wet conditions.
+        relative_humidities (dict): Relative humidities for dry and wet conditions in %.
+        life_cycle_factor (float): Performance factor of the life cycle stage.
+
+    Returns:
+        dict: Values of the `FEATURE_NAMES`.
+    """
+    return {
+        'mesh_cells': float(mesh_size) ** 2,
+        'flow_ratio': float(mass_flow_rates['dry']) / float(mass_flow_rates['wet']),
+        'humidity_difference': abs(float(relative_humidities['wet']) - float(relative_humidities['dry'])),
+        'life_cycle_factor': float(life_cycle_factor),
+    }
+
+
+def _design_row(features: dict) -> np.ndarray:
+    """Regression inputs of a point: the solve time scales with powers of the cell count and flow ratio."""
+    return np.array([
+        1.0,
+        np.log(features['mesh_cells']),
+        np.log(features['flow_ratio']),
+        features['humidity_difference'] / 100,
+        features['life_cycle_factor'],
+    ])
+
+
+class EngineCostModel:
+    """
+    Predicts the solve time of each solver engine from past solves.
+
+    Per engine, the logarithm of the solve time is fitted linearly to the logarithm
+    of the cell count and flow ratio, the humidity difference and the life cycle
+    factor of the converged solves recorded so far. With a history file, the
+    observations are appended to it and read back by later processes, so the
+    predictions improve with every recorded solve.
+    """
+
+    def __init__(self, history_path: str = None, min_observations: int = MIN_OBSERVATIONS):
+        """
+        Initializes the cost model.
+
+        Args:
+            history_path (str): Optional JSON lines file of past observations, created if needed.
+            min_observations (int): Converged solves of an engine needed to predict its cost.
+        """
+        self.history_path = history_path
+        self.min_observations = min_observations
+        self.observations = []
+        self._fits = {}
+        self._lock = threading.Lock()
+        if history_path is not None and os.path.exists(history_path):
+            with open(history_path, 'r') as history_file:
+                self.observations = [json.loads(line) for line in history_file if line.strip()]
+
+    def record(self, engine: str, features: dict, seconds: float, iterations: int, converged: bool):
+        """
+        Records the actual cost of a solve.
+
+        Args:
+            engine (str): Engine that solved.
+            features (dict): Features of the operating point, see `engine_features`.
+            seconds (float): Wall-clock time of the solve.
+            iterations (int): Iterations of the solve.
+            converged (bool): Whether the solve converged; only converged solves are fitted.
+        """
+        observation = {'engine': engine, 'features': features, 'seconds': seconds,
+                       'iterations': iterations, 'converged': converged}
+        with self._lock:
+            self.observations.append(observation)
+            self._fits.pop(engine, None)
+            if self.history_path is not None:
+                with open(self.history_path, 'a') as history_file:
+                    history_file.write(json.dumps(observation) + '\n')
+
+    def _converged(self, engine: str) -> list:
+        return [observation for observation in self.observations
+                if observation['engine'] == engine and observation['converged']]
+
+    def _fit(self, engine: str) -> np.ndarray:
+        """Fits the regression coefficients of an engine, or returns None with too few solves."""
+        if engine not in self._fits:
+            observations = self._converged(engine)
+            if len(observations) < self.min_observations:
+                return None
+            design = np.array([_design_row(observation['features']) for observation in observations])
+            log_seconds = np.log([max(observation['seconds'], 1e-6) for observation in observations])
+            self._fits[engine] = np.linalg.solve(
+                design.T @ design + COST_RIDGE * np.eye(design.shape[1]), design.T @ log_seconds)
+        return self._fits[engine]
+
+    def predict(self, features: dict, engines=None) -> dict:
+        """
+        Predicts the solve time of the engines for an operating point.
+
+        Args:
+            features (dict): Features of the operating point, see `engine_features`.
+            engines (iterable): Engines to predict; defaults to all registered ones.
+
+        Returns:
+            dict: Engine name to the predicted seconds, or None for engines with too few solves.
+        """
+        with self._lock:
+            fits = {engine: self._fit(engine) for engine in (engines or SOLVER_ENGINES)}
+        row = _design_row(features)
+        return {engine: None if fit is None else float(np.exp(row @ fit)) for engine, fit in fits.items()}
+
+    def choose(self, features: dict, engines=None) -> tuple:
+        """
+        Picks the engine expected to converge fastest.
+
+        Engines with fewer than `min_observations` converged solves are picked first,
+        fewest first, so every engine is measured before the predictions are trusted.
+
+        Args:
+            features (dict): Features of the operating point, see `engine_features`.
+            engines (iterable): Candidate engines; defaults to all registered ones.
+
+        Returns:
+            tuple: The engine name and the predicted seconds of every candidate.
+        """
+        predictions = self.predict(features, engines)
+        with self._lock:
+            unmeasured = [engine for engine, seconds in predictions.items() if seconds is None]
+            if unmeasured:
+                counts = {engine: len(self._converged(engine)) for engine in unmeasured}
+                return min(unmeasured, key=counts.get), predictions
+        return min(predictions, key=predictions.get), predictions
+
+
+_cost_models = {}
+_cost_models_lock = threading.Lock()
+
+
+def shared_cost_model(history_path: str = None) -> EngineCostModel:
+    """
+    Returns the cost model of a history file, shared by all models of the process.
+
+    Parameters:
+        history_path (str): JSON lines file of past observations, or None for a cost
+                            model kept in memory only.
+
+    Returns:
+        EngineCostModel: The shared cost model.
+    """
+    key = os.path.abspath(history_path) if history_path is not None else None
+    with _cost_models_lock:
+        if key not in _cost_models:
+            _cost_models[key] = EngineCostModel(history_path)
+        return _cost_models[key]
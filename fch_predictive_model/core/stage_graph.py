@@ -0,0 +1,144 @@
+from collections import Counter
+
+
+def _equal(value, other) -> bool:
+    """Whether two stage values are equal; values without a plain truth value, like arrays, never are."""
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        return False
+
+
+class _Node:
+    """An input or a stage of a `StageGraph`."""
+
+    __slots__ = ('function', 'dependencies', 'value', 'evaluated', 'changed_at', 'verified_at')
+
+    def __init__(self, function=None, dependencies: tuple = ()):
+        self.function = function
+        self.dependencies = dependencies
+        self.value = None
+        self.evaluated = False
+        # Revision at which the value last changed and at which it was last found current
+        self.changed_at = 0
+        self.verified_at = -1
+
+
+class StageGraph:
+    """
+    Cached stages of a computation, recomputed only when their inputs change.
+
+    Inputs are set from outside; a stage is a function of inputs and other stages,
+    evaluated on first use and cached. Setting an input only marks the stages
+    downstream of it for verification: when a stage is used next, it is recomputed
+    if any of its dependencies changed since it was computed. A recomputed stage
+    equal to its cached value counts as unchanged, so e.g. an edit of one section
+    of the configuration does not recompute the stages that only read the others.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+        self._revision = 0
+        # Number of evaluations per stage, e.g. to check which stages an edit recomputed
+        self.evaluations = Counter()
+
+    def add_input(self, name: str, value=None):
+        """
+        Declares an input.
+
+        Args:
+            name (str): Input name.
+            value: Initial value.
+        """
+        self._nodes[name] = _Node()
+        self.set(name, value)
+
+    def add_stage(self, name: str, function, dependencies: tuple):
+        """
+        Declares a stage.
+
+        Args:
+            name (str): Stage name.
+            function (callable): Computes the stage from the values of its dependencies,
+                                 passed positionally in order.
+            dependencies (tuple): Names of the inputs and stages the stage is computed from,
+                                  which must be declared before.
+
+        Raises:
+            ValueError: If a dependency is not declared.
+        """
+        unknown = [dependency for dependency in dependencies if dependency not in self._nodes]
+        if unknown:
+            raise ValueError(f"Stage {name!r} depends on undeclared {unknown}")
+        self._nodes[name] = _Node(function, tuple(dependencies))
+
+    def set(self, name: str, value):
+        """
+        Sets an input, invalidating the stages downstream of it.
+
+        Args:
+            name (str): Input name.
+            value: New value. Values are not copied, so mutable values must be
+                   replaced rather than modified in place to be noticed.
+
+        Raises:
+            KeyError: If no such input is declared.
+        """
+        node = self._nodes[name]
+        if node.function is not None:
+            raise KeyError(f"{name!r} is a stage, not an input")
+        self._revision += 1
+        node.value = value
+        node.evaluated = True
+        node.changed_at = node.verified_at = self._revision
+
+    def provide(self, name: str, value):
+        """
+        Replaces the value of a stage, as if computed from its current dependencies.
+
+        Used for stages updated outside the graph, like the fields of an iterative solve.
+
+        Args:
+            name (str): Stage name.
+            value: New value of the stage.
+        """
+        node = self._nodes[name]
+        for dependency in node.dependencies:
+            self._refresh(dependency)
+        self._revision += 1
+        node.value = value
+        node.evaluated = True
+        node.changed_at = node.verified_at = self._revision
+
+    def get(self, name: str):
+        """
+        Returns the current value of an input or stage, recomputing stale stages.
+
+        Args:
+            name (str): Input or stage name.
+
+        Returns:
+            The value.
+        """
+        self._refresh(name)
+        return self._nodes[name].value
+
+    def _refresh(self, name: str):
+        """Brings a stage up to date with its dependencies."""
+        node = self._nodes[name]
+        if node.function is None or node.verified_at == self._revision:
+            return
+        for dependency in node.dependencies:
+            self._refresh(dependency)
+        if node.evaluated and all(self._nodes[dependency].changed_at <= node.verified_at
+                                  for dependency in node.dependencies):
+            node.verified_at = self._revision
+            return
+
+        value = node.function(*(self._nodes[dependency].value for dependency in node.dependencies))
+        self.evaluations[name] += 1
+        if not (node.evaluated and _equal(value, node.value)):
+            node.value = value
+            node.changed_at = self._revision
+        node.evaluated = True
+        node.verified_at = self._revision
@@ -0,0 +1,184 @@
+import contextlib
+import csv
+import io
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from .batch_runner import build_model
+from .calibration import PRODUCT_COLUMNS, point_from_row
+from .drive_cycle import CYCLE_COLUMNS
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import RESULT_COLUMNS, flatten_result
+
+# Formats of operating point and result streams
+STREAM_FORMATS = ('csv', 'ndjson')
+
+# Output column numbering the points in input order, and the column of failed points
+POINT_COLUMN = 'point'
+ERROR_COLUMN = 'error'
+
+# Points in flight or waiting for their turn per worker; bounds the memory of a stream
+POINTS_PER_WORKER = 4
+
+
+def read_points(lines, stream_format: str = 'csv'):
+    """
+    Reads operating points from a stream one line at a time.
+
+    CSV streams have a header with the `CYCLE_COLUMNS` and the product columns.
+    NDJSON streams have one JSON object per line, either such a flat row or an
+    operating point with the nested `batch_runner.OPERATING_POINT_KEYS`.
+
+    Parameters:
+        lines (iterable): Lines of the stream, e.g. an open file or `sys.stdin`.
+        stream_format (str): 'csv' or 'ndjson'.
+
+    Yields:
+        dict: The operating points in stream order.
+
+    Raises:
+        ValueError: If the format is unknown or a line is not a valid operating point.
+    """
+    if stream_format == 'csv':
+        reader = csv.DictReader(lines)
+        missing = (set(CYCLE_COLUMNS) | set(PRODUCT_COLUMNS)) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Input is missing the columns: {sorted(missing)}")
+        for row in reader:
+            try:
+                yield point_from_row(row)
+            except ValueError as error:
+                raise ValueError(f"Line {reader.line_num}: {error}") from None
+    elif stream_format == 'ndjson':
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield record if 'mass_flow_rates' in record else point_from_row(record)
+            except (ValueError, TypeError) as error:
+                raise ValueError(f"Line {line_number}: {error}") from None
+    else:
+        raise ValueError(f"Unknown stream format {stream_format!r}, expected one of {STREAM_FORMATS}")
+
+
+def _solve_point(point: dict, config_path: str) -> tuple:
+    """Solves one point, returning its flattened result or the reason it failed."""
+    try:
+        # The solver reports its progress on stdout, which carries the result stream
+        with contextlib.redirect_stdout(io.StringIO()):
+            return flatten_result(build_model(point, config_path).compile_results()), None
+    except Exception as error:
+        # One failing point must not stop the stream
+        return None, f"{type(error).__name__}: {error}"
+
+
+def _solve_point_task(task: tuple) -> tuple:
+    return _solve_point(*task)
+
+
+def solve_stream(points, config_path: str = DEFAULT_CONFIG_PATH, max_workers: int = None,
+                 ordered: bool = True):
+    """
+    Solves a stream of operating points with a pool of worker processes.
+
+    Points are read from the stream only as workers become free, so at most
+    `POINTS_PER_WORKER` points per worker are held at any time, whatever the
+    length of the stream.
+
+    Parameters:
+        points (iterable): Operating points, e.g. from `read_points`.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes; defaults to the CPU count.
+                           With a single worker the points are solved in-process.
+        ordered (bool): Yield the results in input order; otherwise as they complete.
+
+    Yields:
+        tuple: The position of the point in the stream, its result row keyed by
+               `RESULT_COLUMNS` (None if it failed) and the error message (None if solved).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        for index, point in enumerate(points):
+            yield (index,) + _solve_point(point, config_path)
+        return
+
+    window = max_workers * POINTS_PER_WORKER
+    points = enumerate(points)
+    pending = {}
+    completed = {}
+    next_index = 0
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # Points waiting for an earlier one count against the window too
+            while not exhausted and len(pending) + len(completed) < window:
+                entry = next(points, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                index, point = entry
+                pending[executor.submit(_solve_point_task, (point, config_path))] = index
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                if ordered:
+                    completed[index] = future.result()
+                else:
+                    yield (index,) + future.result()
+            while next_index in completed:
+                yield (next_index,) + completed.pop(next_index)
+                next_index += 1
+
+
+def write_results(results, output, stream_format: str = 'csv') -> int:
+    """
+    Writes solved points to a stream, one line per point as it arrives.
+
+    CSV output has a `POINT_COLUMN`, the `RESULT_COLUMNS` and an `ERROR_COLUMN`
+    that is only filled for failed points; NDJSON output has one object per point
+    with the `POINT_COLUMN` and either the results or the error.
+
+    Parameters:
+        results (iterable): (position, row, error) tuples as yielded by `solve_stream`.
+        output: Text stream to write to, e.g. `sys.stdout`.
+        stream_format (str): 'csv' or 'ndjson'.
+
+    Returns:
+        int: The number of failed points.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if stream_format not in STREAM_FORMATS:
+        raise ValueError(f"Unknown stream format {stream_format!r}, expected one of {STREAM_FORMATS}")
+    writer = None
+    if stream_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=(POINT_COLUMN,) + RESULT_COLUMNS + (ERROR_COLUMN,),
+                                lineterminator='\n')
+
+    failed = 0
+    header = writer is not None
+    for index, row, error in results:
+        # The header is written with the first result, so invalid input writes nothing
+        if header:
+            writer.writeheader()
+            header = False
+        if error is not None:
+            failed += 1
+            record = {POINT_COLUMN: index, ERROR_COLUMN: error}
+        else:
+            record = {POINT_COLUMN: index, **row}
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            output.write(json.dumps(record) + '\n')
+        # Hand every line to the next command of the pipeline right away
+        output.flush()
+    if header:
+        writer.writeheader()
+    return failed
@@ -0,0 +1,212 @@
+import math
+from statistics import NormalDist
+import numpy as np
+from .batch_runner import CONFIG_OVERRIDES_KEY, run_operating_point, run_operating_points
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import ResultTable
+from .sensitivity import get_input, set_input
+from ..utils.config_loader import load_config
+
+# Outputs summarised by default, as ResultTable column names
+UQ_OUTPUTS = ('DPAT', 'vapor_transport')
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile with the P-square algorithm.
+
+    Keeps five markers instead of the observations, so memory is constant in the
+    number of samples (Jain & Chlamtac, 1985).
+    """
+
+    def __init__(self, probability: float):
+        self.probability = probability
+        self.heights = []
+        self.positions = [0, 1, 2, 3, 4]
+        p = probability
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def update(self, value: float):
+        q, n = self.heights, self.positions
+        if len(q) < 5:
+            q.append(value)
+            q.sort()
+            return
+
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= value < q[i + 1])
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    @property
+    def value(self) -> float:
+        if len(self.heights) < 5:
+            if not self.heights:
+                return math.nan
+            return float(np.percentile(self.heights, 100 * self.probability))
+        return self.heights[2]
+
+
+class StreamingStatistics:
+    """
+    Running mean, variance (Welford) and P-square percentiles of a stream of values.
+    """
+
+    def __init__(self, percentiles: tuple = (5, 50, 95)):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._quantiles = {percentile: P2Quantile(percentile / 100) for percentile in percentiles}
+
+    def update(self, value: float):
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        for quantile in self._quantiles.values():
+            quantile.update(value)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+    def summary(self, confidence: float = 0.95) -> dict:
+        """
+        Summarises the values seen so far.
+
+        Args:
+            confidence (float): Confidence level of the interval on the mean.
+
+        Returns:
+            dict: 'count', 'mean', 'std', 'min', 'max', 'percentiles' and the
+                  'mean_confidence_interval'.
+        """
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * self.std / math.sqrt(self.count) if self.count > 1 else math.nan
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.minimum,
+            'max': self.maximum,
+            'percentiles': {p: quantile.value for p, quantile in self._quantiles.items()},
+            'mean_confidence_interval': (self.mean - half_width, self.mean + half_width),
+        }
+
+
+def _unit_samples(count: int, dimensions: int, method: str, rng) -> np.ndarray:
+    """Samples in the unit hypercube, either independent or Latin hypercube."""
+    if method == 'random':
+        return rng.random((count, dimensions))
+    if method == 'latin_hypercube':
+        strata = np.array([rng.permutation(count) for _ in range(dimensions)]).T
+        return (strata + rng.random((count, dimensions))) / count
+    raise ValueError(f"Unknown sampling method: {method}")
+
+
+def _transform(unit: np.ndarray, distribution: dict, base_value: float) -> np.ndarray:
+    kind = distribution['distribution']
+    if kind == 'normal':
+        normal = NormalDist(distribution.get('mean', base_value), distribution['std'])
+        return np.array([normal.inv_cdf(min(max(u, 1e-12), 1 - 1e-12)) for u in unit])
+    if kind == 'uniform':
+        return distribution['low'] + (distribution['high'] - distribution['low']) * unit
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+def propagate_uncertainty(point: dict, uncertainties: dict, samples: int = 1000,
+                          method: str = 'latin_hypercube', outputs: tuple = UQ_OUTPUTS,
+                          percentiles: tuple = (5, 50, 95), confidence: float = 0.95,
+                          chunk_size: int = 256, seed: int = None,
+                          config_path: str = DEFAULT_CONFIG_PATH, max_workers: int = None) -> dict:
+    """
+    Monte Carlo propagation of input and material uncertainties to the outputs.
+
+    Samples are generated and solved chunk by chunk in the process pool, each solve
+    warm-started from the base solution, and the outputs are folded into streaming
+    statistics, so memory does not grow with the number of samples. With Latin
+    hypercube sampling every chunk is stratified on its own.
+
+    Parameters:
+        point (dict): Base operating point.
+        uncertainties (dict): Input name to its distribution. Names follow
+            `sensitivity.SENSITIVITY_INPUTS` and may address any 'membrane_properties' or
+            'air_properties' entry. Distributions are {'distribution': 'normal', 'std': ...,
+            'mean': ... (default: the base value)} or {'distribution': 'uniform',
+            'low': ..., 'high': ...}.
+        samples (int): Number of Monte Carlo samples.
+        method (str): 'latin_hypercube' or 'random'.
+        outputs (tuple): ResultTable column names to summarise (unrounded).
+        percentiles (tuple): Percentiles to estimate.
+        confidence (float): Confidence level of the interval on the mean.
+        chunk_size (int): Number of samples solved per batch.
+        seed (int): Random seed.
+        config_path (str): Path to the configuration file.
+        max_workers (int): Number of worker processes.
+
+    Returns:
+        dict: Output name to its summary, see `StreamingStatistics.summary`.
+    """
+    rng = np.random.default_rng(seed)
+    config = load_config(config_path, point.get(CONFIG_OVERRIDES_KEY))
+    names = tuple(uncertainties)
+    base_values = {name: get_input(point, config, name) for name in names}
+    statistics = {output: StreamingStatistics(percentiles) for output in outputs}
+
+    _, base_fields = run_operating_point(point, config_path)
+
+    remaining = samples
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        remaining -= count
+
+        unit = _unit_samples(count, len(names), method, rng)
+        values = {
+            name: _transform(unit[:, index], uncertainties[name], base_values[name])
+            for index, name in enumerate(names)
+        }
+        points = []
+        for index in range(count):
+            candidate = point
+            for name in names:
+                candidate = set_input(candidate, name, values[name][index].item())
+            points.append(candidate)
+
+        outcomes = run_operating_points(
+            points, config_path, [base_fields] * count, max_workers)
+        table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+        for output in outputs:
+            for value in table[output]:
+                statistics[output].update(value.item())
+
+    return {output: statistics[output].summary(confidence) for output in outputs}
@@ -0,0 +1,283 @@
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from .chunk_scheduler import run_chunked
+from .model import DEFAULT_CONFIG_PATH
+from .results_compiler import CompiledResult
+
+# Files and directories of a work queue
+MANIFEST_FILE = 'manifest.json'
+CONFIG_FILE = 'config.yaml'
+LEASE_DIR = 'leases'
+RESULT_DIR = 'results'
+RESULT_FILE = 'shard_{shard:05d}.jsonl'
+LEASE_FILE = 'shard_{shard:05d}.{generation}.lease'
+
+
+def create_queue(queue_dir: str, points: list, shard_size: int = 16,
+                 config_path: str = DEFAULT_CONFIG_PATH, lease_seconds: float = 300.0) -> int:
+    """
+    Creates a work queue of operating points on a (shared) directory.
+
+    The points are split into shards of consecutive points. The configuration file
+    is copied into the queue, so workers on every host solve with the same one.
+
+    Parameters:
+        queue_dir (str): Directory of the queue; created if needed, and must not hold a queue.
+        points (list): Operating points with the keys in `batch_runner.OPERATING_POINT_KEYS`.
+        shard_size (int): Number of points per shard.
+        config_path (str): Path to the configuration file.
+        lease_seconds (float): Time after which the shard of a worker that stopped
+                               renewing its lease may be claimed by another worker.
+
+    Returns:
+        int: The number of shards.
+
+    Raises:
+        ValueError: If the directory already holds a queue.
+    """
+    manifest_path = os.path.join(queue_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        raise ValueError(f"{queue_dir} already holds a work queue")
+    os.makedirs(os.path.join(queue_dir, LEASE_DIR), exist_ok=True)
+    os.makedirs(os.path.join(queue_dir, RESULT_DIR), exist_ok=True)
+    shutil.copyfile(config_path, os.path.join(queue_dir, CONFIG_FILE))
+
+    shards = [list(range(start, min(start + shard_size, len(points))))
+              for start in range(0, len(points), shard_size)]
+    _write_atomically(manifest_path, json.dumps(
+        {'points': points, 'shards': shards, 'lease_seconds': lease_seconds}))
+    return len(shards)
+
+
+def _write_atomically(path: str, content: str):
+    """Writes a file next to its destination and moves it in place."""
+    temporary_path = f'{path}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temporary_path, 'w') as temporary_file:
+        temporary_file.write(content)
+    os.replace(temporary_path, path)
+
+
+def _read_manifest(queue_dir: str) -> dict:
+    with open(os.path.join(queue_dir, MANIFEST_FILE), 'r') as manifest_file:
+        return json.load(manifest_file)
+
+
+def _result_path(queue_dir: str, shard: int) -> str:
+    return os.path.join(queue_dir, RESULT_DIR, RESULT_FILE.format(shard=shard))
+
+
+def _latest_lease(queue_dir: str, shard: int) -> tuple:
+    """Returns the latest lease generation of a shard and its path, or (-1, None)."""
+    prefix = f'shard_{shard:05d}.'
+    generations = [
+        int(name[len(prefix):-len('.lease')])
+        for name in os.listdir(os.path.join(queue_dir, LEASE_DIR))
+        if name.startswith(prefix) and name.endswith('.lease')
+    ]
+    if not generations:
+        return -1, None
+    generation = max(generations)
+    return generation, os.path.join(
+        queue_dir, LEASE_DIR, LEASE_FILE.format(shard=shard, generation=generation))
+
+
+def claim_shard(queue_dir: str, shard: int, worker_id: str, lease_seconds: float) -> str:
+    """
+    Tries to take the lease of a shard.
+
+    Leases are numbered files; a worker claims a shard by creating the next
+    generation exclusively, which at most one worker can do. The next generation
+    may only be created once the latest lease has not been renewed for
+    `lease_seconds`, i.e. its worker has stopped.
+
+    Parameters:
+        queue_dir (str): Directory of the queue.
+        shard (int): Shard number.
+        worker_id (str): Identity of the claiming worker.
+        lease_seconds (float): Lease duration in seconds.
+
+    Returns:
+        str: Path of the lease file, or None if the shard is leased by another worker.
+    """
+    generation, lease_path = _latest_lease(queue_dir, shard)
+    if lease_path is not None:
+        try:
+            if time.time() - os.stat(lease_path).st_mtime < lease_seconds:
+                return None
+        except FileNotFoundError:
+            return None
+
+    lease_path = os.path.join(
+        queue_dir, LEASE_DIR, LEASE_FILE.format(shard=shard, generation=generation + 1))
+    try:
+        descriptor = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return None
+    with os.fdopen(descriptor, 'w') as lease_file:
+        json.dump({'worker': worker_id, 'claimed': time.time()}, lease_file)
+    return lease_path
+
+
+class _LeaseRenewal:
+    """Renews a lease from a background thread while its shard is solved."""
+
+    def __init__(self, lease_path: str, interval: float):
+        self.lease_path = lease_path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                os.utime(self.lease_path)
+            except FileNotFoundError:
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def solve_shard(queue_dir: str, shard: int, manifest: dict, memory_budget: int):
+    """
+    Solves the points of a shard and writes its result shard.
+
+    The result shard is written atomically with one line per point, so solving a
+    shard twice (after an expired lease) leaves one complete result.
+
+    Parameters:
+        queue_dir (str): Directory of the queue.
+        shard (int): Shard number.
+        manifest (dict): Manifest of the queue.
+        memory_budget (int): Memory available to the solver in bytes.
+    """
+    indices = manifest['shards'][shard]
+    points = [manifest['points'][index] for index in indices]
+    results, solver_info, _ = run_chunked(points, memory_budget,
+                                          config_path=os.path.join(queue_dir, CONFIG_FILE),
+                                          max_workers=1)
+    lines = []
+    for index, result, info in zip(indices, results, solver_info):
+        if result is None:
+            lines.append({'index': index, 'error': f"Model did not converge ({info['stop_reason']})"})
+        else:
+            lines.append({'index': index, **result.to_record()})
+    _write_atomically(_result_path(queue_dir, shard), ''.join(json.dumps(line) + '\n' for line in lines))
+
+
+def work(queue_dir: str, worker_id: str = None, memory_budget: int = 2 ** 30,
+         wait: bool = True, poll_interval: float = 5.0) -> int:
+    """
+    Claims and solves shards of a work queue until every shard has a result.
+
+    Any number of workers on any number of hosts may work on the same queue
+    directory. Shards leased by running workers are skipped; the shards of workers
+    that crashed are claimed again once their lease has expired.
+
+    Parameters:
+        queue_dir (str): Directory of the queue.
+        worker_id (str): Identity of the worker; defaults to the host name and process id.
+        memory_budget (int): Memory available to the solver in bytes, see `chunk_scheduler`.
+        wait (bool): Wait for shards leased by other workers, to take them over if their
+                     worker stops; otherwise return once no shard can be claimed.
+        poll_interval (float): Seconds between checks while waiting.
+
+    Returns:
+        int: The number of shards solved by this worker.
+    """
+    worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+    manifest = _read_manifest(queue_dir)
+    lease_seconds = manifest['lease_seconds']
+    solved = 0
+
+    while True:
+        pending = [shard for shard in range(len(manifest['shards']))
+                   if not os.path.exists(_result_path(queue_dir, shard))]
+        if not pending:
+            return solved
+
+        claimed = False
+        for shard in pending:
+            if os.path.exists(_result_path(queue_dir, shard)):
+                continue
+            lease_path = claim_shard(queue_dir, shard, worker_id, lease_seconds)
+            if lease_path is None:
+                continue
+            claimed = True
+            with _LeaseRenewal(lease_path, lease_seconds / 4):
+                solve_shard(queue_dir, shard, manifest, memory_budget)
+            solved += 1
+
+        if not claimed:
+            if not wait:
+                return solved
+            time.sleep(poll_interval)
+
+
+def queue_status(queue_dir: str) -> dict:
+    """
+    Reports the progress of a work queue.
+
+    Parameters:
+        queue_dir (str): Directory of the queue.
+
+    Returns:
+        dict: The number of 'shards', 'done' shards, shards 'leased' by a live worker
+              and 'pending' shards.
+    """
+    manifest = _read_manifest(queue_dir)
+    done = leased = 0
+    for shard in range(len(manifest['shards'])):
+        if os.path.exists(_result_path(queue_dir, shard)):
+            done += 1
+            continue
+        _, lease_path = _latest_lease(queue_dir, shard)
+        try:
+            if lease_path and time.time() - os.stat(lease_path).st_mtime < manifest['lease_seconds']:
+                leased += 1
+        except FileNotFoundError:
+            pass
+    shards = len(manifest['shards'])
+    return {'shards': shards, 'done': done, 'leased': leased, 'pending': shards - done - leased}
+
+
+def merge_results(queue_dir: str) -> tuple:
+    """
+    Collects the result shards of a work queue into one result list.
+
+    Parameters:
+        queue_dir (str): Directory of the queue.
+
+    Returns:
+        tuple: The CompiledResult of each point in manifest order (None for points that
+               failed or are not solved yet) and the {index: error} of the failed points.
+
+    Raises:
+        ValueError: If shards are still unsolved.
+    """
+    manifest = _read_manifest(queue_dir)
+    missing = [shard for shard in range(len(manifest['shards']))
+               if not os.path.exists(_result_path(queue_dir, shard))]
+    if missing:
+        raise ValueError(f"{len(missing)} shards of {queue_dir} are not solved yet")
+
+    results = [None] * len(manifest['points'])
+    errors = {}
+    for shard in range(len(manifest['shards'])):
+        with open(_result_path(queue_dir, shard), 'r') as result_file:
+            for line in result_file:
+                record = json.loads(line)
+                if 'error' in record:
+                    errors[record['index']] = record['error']
+                else:
+                    results[record['index']] = CompiledResult.from_record(record)
+    return results, errors
@@ -0,0 +1,52 @@
+import argparse
+import json
+import yaml
+from ..core.calibration import CALIBRATION_PARAMETERS, calibrate, read_measurements
+from ..core.model import DEFAULT_CONFIG_PATH
+
+# Fit membrane and degradation parameters to measured bench data.
+# Usage:
+#   python -m fch_predictive_model.scripts.calibrate bench.csv --product-model AX_150 \
+#       --layer-count 100 --life-cycle EOL --bound life_cycle_factor=0.8:1.0 \
+#       -o calibrated.yaml --diagnostics fit.json
+# The written overlay can be passed to FCHPerformanceModel as `config_overrides`.
+
+parser = argparse.ArgumentParser(description="Calibrate FCH model parameters to measured data.")
+parser.add_argument('data', help="CSV of measured operating points and outlet conditions")
+parser.add_argument('--parameter', action='append', dest='parameters',
+                    help="Parameter to fit (repeatable), default: " + ", ".join(CALIBRATION_PARAMETERS))
+parser.add_argument('--bound', action='append', default=[],
+                    help="Bounds of a parameter as name=lower:upper (repeatable)")
+parser.add_argument('--product-model', help="Product model of rows without a product_model column")
+parser.add_argument('--layer-count', type=int, help="Layer count of rows without a layer_count column")
+parser.add_argument('--life-cycle', help="Life cycle of rows without a life_cycle column")
+parser.add_argument('--max-iterations', type=int, default=20)
+parser.add_argument('--workers', type=int, help="Number of worker processes")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+parser.add_argument('-o', '--output', default='calibrated_config.yaml',
+                    help="Calibrated configuration overlay (YAML)")
+parser.add_argument('--diagnostics', help="Fit diagnostics (JSON)")
+args = parser.parse_args()
+
+defaults = {key: value for key, value in (
+    ('product_model', args.product_model), ('layer_count', args.layer_count),
+    ('life_cycle', args.life_cycle)) if value is not None}
+bounds = {}
+for bound in args.bound:
+    name, limits = bound.split('=')
+    lower, upper = limits.split(':')
+    bounds[name] = (float(lower), float(upper))
+
+points, measured = read_measurements(args.data, defaults)
+fit = calibrate(points, measured, tuple(args.parameters or CALIBRATION_PARAMETERS), bounds,
+                max_iterations=args.max_iterations, config_path=args.config,
+                max_workers=args.workers)
+
+with open(args.output, 'w') as overlay_file:
+    yaml.safe_dump(fit['overlay'], overlay_file, sort_keys=False)
+print(f"Calibrated parameters: {fit['parameters']}")
+print(f"RMSE per output: {fit['diagnostics']['rmse']}")
+
+if args.diagnostics:
+    with open(args.diagnostics, 'w') as diagnostics_file:
+        json.dump({'parameters': fit['parameters'], **fit['diagnostics']}, diagnostics_file, indent=2)
@@ -0,0 +1,49 @@
+import argparse
+import yaml
+from ..core.calibration import read_measurements
+from ..core.grid_study import GRID_TOLERANCES, grid_convergence_study, mesh_overlay
+from ..core.model import DEFAULT_CONFIG_PATH, normalize_product_model
+
+# Recommend the coarsest accurate mesh resolution per product model.
+# Usage:
+#   python -m fch_predictive_model.scripts.grid_study points.csv --tolerance DPAT=0.1 -o mesh.yaml
+# The operating points CSV has the columns of a drive cycle plus product_model, layer_count and
+# life_cycle. The written overlay can be merged into the 'model_properties' of the configuration
+# or passed to FCHPerformanceModel as `config_overrides` for production runs.
+
+parser = argparse.ArgumentParser(description="Grid-convergence study of the FCH model mesh.")
+parser.add_argument('points', help="CSV of operating points covering the range of interest")
+parser.add_argument('--tolerance', action='append', default=[],
+                    help="Allowed discretization error of an output as name=value (repeatable), "
+                         "default: " + ", ".join(f"{k}={v}" for k, v in GRID_TOLERANCES.items()))
+parser.add_argument('--resolutions', help="Comma-separated resolutions to solve for every product")
+parser.add_argument('--workers', type=int, help="Number of worker processes")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+parser.add_argument('-o', '--output', default='mesh_resolution.yaml',
+                    help="Configuration overlay with the recommended resolutions (YAML)")
+args = parser.parse_args()
+
+tolerances = {}
+for tolerance in args.tolerance:
+    name, value = tolerance.split('=')
+    tolerances[name] = float(value)
+
+points, _ = read_measurements(args.points)
+resolutions = None
+if args.resolutions:
+    values = [int(value) for value in args.resolutions.split(',')]
+    resolutions = {normalize_product_model(point['product_model']): values for point in points}
+
+study = grid_convergence_study(points, tolerances or GRID_TOLERANCES, resolutions,
+                               config_path=args.config, max_workers=args.workers)
+
+for product_model, product_study in study.items():
+    print(f"{product_model}: recommended mesh resolution {product_study['recommended']}"
+          + ("" if product_study['within_tolerance'] else " (no resolution within tolerance)"))
+    for index, resolution in enumerate(product_study['resolutions']):
+        errors = ", ".join(f"{output} {errors[index]:.3g}"
+                           for output, errors in product_study['errors'].items())
+        print(f"  {resolution:4d} cells: {errors}")
+
+with open(args.output, 'w') as overlay_file:
+    yaml.safe_dump(mesh_overlay(study), overlay_file, sort_keys=False)
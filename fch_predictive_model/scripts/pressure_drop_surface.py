@@ -0,0 +1,47 @@
+import argparse
+import csv
+import sys
+import numpy as np
+from ..core.model import DEFAULT_CONFIG_PATH, normalize_product_model
+from ..core.pressure_drop_calculator import pressure_drop_records, pressure_drop_surface
+from ..utils.config_loader import load_config
+from ..utils.model_output import write_pressure_drop_to_excel
+
+# Tabulate the pressure drop over a grid of flow rates, layer counts and products for system sizing.
+# Usage:
+#   python -m fch_predictive_model.scripts.pressure_drop_surface --flow 0.02 0.3 57 --layers 50 400 351 -o surface.csv
+# Values are exact unless --rounded is given.
+
+parser = argparse.ArgumentParser(description="Tabulate FCH pressure drop surfaces.")
+parser.add_argument('--flow', nargs=3, type=float, metavar=('MIN', 'MAX', 'COUNT'), required=True,
+                    help="Evenly spaced mass flow rates in kg/s, applied to both sides")
+parser.add_argument('--layers', nargs=3, type=int, metavar=('MIN', 'MAX', 'COUNT'), required=True,
+                    help="Evenly spaced layer counts")
+parser.add_argument('--products', nargs='+', help="Product models (default: all configured)")
+parser.add_argument('--rounded', action='store_true', help="Round to 0.1 kPa like the model results")
+parser.add_argument('-o', '--output', help="Output CSV file (default: stdout)")
+parser.add_argument('--excel', help="Also write the surface to this Excel file")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+args = parser.parse_args()
+
+config = load_config(args.config)
+products = [normalize_product_model(product) for product in args.products] if args.products else None
+surface = pressure_drop_surface(
+    np.linspace(args.flow[0], args.flow[1], int(args.flow[2])),
+    np.unique(np.linspace(args.layers[0], args.layers[1], args.layers[2]).round().astype(int)),
+    config['pressure_drop_model'], products, args.rounded,
+)
+records = pressure_drop_records(surface)
+
+output_file = open(args.output, 'w', newline='') if args.output else sys.stdout
+try:
+    writer = csv.DictWriter(output_file, fieldnames=list(records[0]) if records else [])
+    writer.writeheader()
+    writer.writerows(records)
+finally:
+    if args.output:
+        output_file.close()
+
+if args.excel:
+    write_pressure_drop_to_excel(records, args.excel)
+print(f"{len(records)} combinations of {len(surface['product_models'])} products", file=sys.stderr)
@@ -0,0 +1,46 @@
+import argparse
+import csv
+import sys
+from ..core.calibration import read_measurements
+from ..core.chunk_scheduler import DEFAULT_CACHE_BYTES, run_chunked
+from ..core.model import DEFAULT_CONFIG_PATH
+from ..core.results_compiler import RESULT_COLUMNS, flatten_result
+
+# Solve operating points in batches sized to a memory budget, and report the throughput.
+# Usage:
+#   python -m fch_predictive_model.scripts.run_batch points.csv -o results.csv --memory-budget-mb 2048
+# The points CSV has the columns of a drive cycle plus product_model, layer_count and life_cycle.
+
+parser = argparse.ArgumentParser(description="Run the FCH model over operating points in batches.")
+parser.add_argument('points', help="CSV of operating points")
+parser.add_argument('-o', '--output', help="Output CSV file (default: stdout)")
+parser.add_argument('--memory-budget-mb', type=float, default=1024,
+                    help="Memory available to the solvers of all workers in MiB")
+parser.add_argument('--cache-mb', type=float, default=DEFAULT_CACHE_BYTES / 2 ** 20,
+                    help="Cache-friendly working set of a batch in MiB (0 to fill the budget)")
+parser.add_argument('--workers', type=int, help="Number of worker processes")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+args = parser.parse_args()
+
+points, _ = read_measurements(args.points)
+results, _, report = run_chunked(points, int(args.memory_budget_mb * 2 ** 20),
+                                 int(args.cache_mb * 2 ** 20), args.config, args.workers)
+
+output_file = open(args.output, 'w', newline='') if args.output else sys.stdout
+try:
+    writer = csv.DictWriter(output_file, fieldnames=('point',) + RESULT_COLUMNS)
+    writer.writeheader()
+    for index, result in enumerate(results):
+        if result is None:
+            print(f"Point {index} did not converge", file=sys.stderr)
+            continue
+        writer.writerow({'point': index, **flatten_result(result)})
+finally:
+    if args.output:
+        output_file.close()
+
+for chunk in report['chunks']:
+    print(f"Batch of {chunk['size']} points ({chunk['working_set'] / 2 ** 20:.1f} MiB): "
+          f"{chunk['points_per_second']:.2f} points/s", file=sys.stderr)
+print(f"{report['points']} points in {report['seconds']:.1f} s with {report['workers']} workers: "
+      f"{report['points_per_second']:.2f} points/s", file=sys.stderr)
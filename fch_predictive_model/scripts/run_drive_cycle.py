@@ -0,0 +1,25 @@
+import argparse
+import sys
+from ..core.drive_cycle import run_drive_cycle
+from ..core.model import DEFAULT_CONFIG_PATH
+
+# Simulate a drive cycle and stream the per-step results as CSV.
+# Usage:
+#   python -m fch_predictive_model.scripts.run_drive_cycle cycle.csv AX_150 100 BOL -o results.csv
+
+parser = argparse.ArgumentParser(description="Run the FCH model over a drive cycle.")
+parser.add_argument('cycle', help="Drive-cycle CSV file (time, mass_flow_dry, ..., pressure_wet)")
+parser.add_argument('product_model', help="Model name/identifier, e.g. AX_150")
+parser.add_argument('layer_count', type=int, help="Number of layers in the model")
+parser.add_argument('life_cycle', help="Life cycle stage, e.g. BOL or EOL")
+parser.add_argument('-o', '--output', help="Output CSV file (default: stdout)")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+args = parser.parse_args()
+
+output_file = open(args.output, 'w', newline='') if args.output else sys.stdout
+try:
+    run_drive_cycle(args.cycle, output_file, args.product_model, args.layer_count,
+                    args.life_cycle, config_path=args.config)
+finally:
+    if args.output:
+        output_file.close()
@@ -1,9 +1,4 @@
-import yaml
-from ..core.model import FCHPerformanceModel
-
-# Load configuration file
-with open('config/config.yaml', 'r') as file:
-    config = yaml.safe_load(file)
+from ..core.model import DEFAULT_CONFIG_PATH, FCHPerformanceModel
 
 # Define model parameters
 product_model = "AX_150"  # Model name/identifier
@@ -31,7 +26,7 @@ pressures = {
 # Instantiate the model
 model = FCHPerformanceModel(
     product_model, layer_count, life_cycle, mass_flow_rates,
-    temperatures, relative_humidities, pressures, config
+    temperatures, relative_humidities, pressures, config_path=DEFAULT_CONFIG_PATH
 )
 
 
@@ -0,0 +1,43 @@
+import argparse
+import csv
+import sys
+from ..core.calibration import read_measurements
+from ..core.checkpoint import run_sweep
+from ..core.model import DEFAULT_CONFIG_PATH
+from ..core.results_compiler import RESULT_COLUMNS, flatten_result
+
+# Solve a sweep of operating points with checkpointing, and resume it after an interruption.
+# Usage:
+#   python -m fch_predictive_model.scripts.run_sweep points.csv -o results.csv
+#   python -m fch_predictive_model.scripts.run_sweep points.csv -o results.csv --resume
+# The points CSV has the columns of a drive cycle plus product_model, layer_count and life_cycle.
+
+parser = argparse.ArgumentParser(description="Run the FCH model over a sweep of operating points.")
+parser.add_argument('points', help="CSV of operating points")
+parser.add_argument('-o', '--output', help="Output CSV file (default: stdout)")
+parser.add_argument('--checkpoint-dir', default='sweep_checkpoint',
+                    help="Directory of the sweep progress and solver checkpoints")
+parser.add_argument('--resume', action='store_true',
+                    help="Skip finished points and continue partially converged ones")
+parser.add_argument('--checkpoint-interval', type=float, default=60.0,
+                    help="Minimum time between solver checkpoints in seconds")
+parser.add_argument('--workers', type=int, help="Number of worker processes")
+parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+args = parser.parse_args()
+
+points, _ = read_measurements(args.points)
+results = run_sweep(points, args.checkpoint_dir, args.config, args.resume,
+                    args.checkpoint_interval, args.workers)
+
+output_file = open(args.output, 'w', newline='') if args.output else sys.stdout
+try:
+    writer = csv.DictWriter(output_file, fieldnames=('point',) + RESULT_COLUMNS)
+    writer.writeheader()
+    for index, result in enumerate(results):
+        if result is None:
+            print(f"Point {index} did not converge", file=sys.stderr)
+            continue
+        writer.writerow({'point': index, **flatten_result(result)})
+finally:
+    if args.output:
+        output_file.close()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+from ..core.model import DEFAULT_CONFIG_PATH
+from ..core.stream_runner import STREAM_FORMATS, read_points, solve_stream, write_results
+
+# Solve a stream of operating points and write one result line per point to stdout.
+# Installed as the `fch-solve` command; usage:
+#   fch-solve points.csv > results.csv
+#   zcat points.ndjson.gz | fch-solve --format ndjson --workers 8 --unordered | jq .DPAT
+# CSV input has the columns of a drive cycle plus product_model, layer_count and life_cycle;
+# NDJSON input has such a row or a nested operating point per line.
+# Exits with 1 if any point failed (its line holds the error) and 2 on invalid input.
+
+
+def _guess_format(path: str) -> str:
+    return 'ndjson' if os.path.splitext(path)[1].lower() in ('.ndjson', '.jsonl', '.json') else 'csv'
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='fch-solve', description="Solve a stream of FCH operating points.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="CSV or NDJSON file of operating points (default: stdin)")
+    parser.add_argument('--format', choices=STREAM_FORMATS,
+                        help="Input format (default: from the file extension, csv for stdin)")
+    parser.add_argument('--output-format', choices=STREAM_FORMATS,
+                        help="Output format (default: the input format)")
+    parser.add_argument('--workers', type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--unordered', action='store_true',
+                        help="Write results as they complete instead of in input order")
+    parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or ('csv' if args.input == '-' else _guess_format(args.input))
+    output_format = args.output_format or input_format
+    input_file = sys.stdin if args.input == '-' else open(args.input, 'r', newline='')
+    try:
+        results = solve_stream(read_points(input_file, input_format), args.config,
+                               args.workers, ordered=not args.unordered)
+        failed = write_results(results, sys.stdout, output_format)
+    except ValueError as error:
+        print(f"fch-solve: {error}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reading end closed early, e.g. `| head`; stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+    if failed:
+        print(f"fch-solve: {failed} points failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
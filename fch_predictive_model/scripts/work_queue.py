@@ -0,0 +1,73 @@
+import argparse
+import csv
+import sys
+from ..core.calibration import read_measurements
+from ..core.model import DEFAULT_CONFIG_PATH
+from ..core.results_compiler import RESULT_COLUMNS, flatten_result
+from ..core.work_queue import create_queue, merge_results, queue_status, work
+
+# Run a large sweep on several hosts through a work queue on a shared directory.
+# Usage:
+#   python -m fch_predictive_model.scripts.work_queue create /shared/doe points.csv --shard-size 32
+#   python -m fch_predictive_model.scripts.work_queue work /shared/doe      (on any number of hosts)
+#   python -m fch_predictive_model.scripts.work_queue status /shared/doe
+#   python -m fch_predictive_model.scripts.work_queue merge /shared/doe -o results.csv
+# The points CSV has the columns of a drive cycle plus product_model, layer_count and life_cycle.
+
+parser = argparse.ArgumentParser(description="Solve a sweep through a file-based work queue.")
+commands = parser.add_subparsers(dest='command', required=True)
+
+create_parser = commands.add_parser('create', help="Create a queue from a CSV of operating points")
+create_parser.add_argument('queue', help="Queue directory")
+create_parser.add_argument('points', help="CSV of operating points")
+create_parser.add_argument('--shard-size', type=int, default=16, help="Points per work item")
+create_parser.add_argument('--lease', type=float, default=300.0,
+                           help="Seconds before the work item of a stopped worker is taken over")
+create_parser.add_argument('--config', default=DEFAULT_CONFIG_PATH, help="Configuration file")
+
+work_parser = commands.add_parser('work', help="Solve work items until the queue is done")
+work_parser.add_argument('queue', help="Queue directory")
+work_parser.add_argument('--worker-id', help="Worker identity (default: host and process id)")
+work_parser.add_argument('--memory-budget-mb', type=float, default=1024,
+                         help="Memory available to the solver in MiB")
+work_parser.add_argument('--no-wait', action='store_true',
+                         help="Stop once no work item can be claimed")
+
+status_parser = commands.add_parser('status', help="Show the progress of a queue")
+status_parser.add_argument('queue', help="Queue directory")
+
+merge_parser = commands.add_parser('merge', help="Merge the result shards into one table")
+merge_parser.add_argument('queue', help="Queue directory")
+merge_parser.add_argument('-o', '--output', help="Output CSV file (default: stdout)")
+
+args = parser.parse_args()
+
+if args.command == 'create':
+    points, _ = read_measurements(args.points)
+    shards = create_queue(args.queue, points, args.shard_size, args.config, args.lease)
+    print(f"Queued {len(points)} points in {shards} work items", file=sys.stderr)
+
+elif args.command == 'work':
+    solved = work(args.queue, args.worker_id, int(args.memory_budget_mb * 2 ** 20),
+                  wait=not args.no_wait)
+    print(f"Solved {solved} work items", file=sys.stderr)
+
+elif args.command == 'status':
+    status = queue_status(args.queue)
+    print(f"{status['done']}/{status['shards']} done, {status['leased']} in progress, "
+          f"{status['pending']} pending")
+
+else:
+    results, errors = merge_results(args.queue)
+    output_file = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = csv.DictWriter(output_file, fieldnames=('point',) + RESULT_COLUMNS)
+        writer.writeheader()
+        for index, result in enumerate(results):
+            if result is None:
+                print(f"Point {index}: {errors.get(index)}", file=sys.stderr)
+                continue
+            writer.writerow({'point': index, **flatten_result(result)})
+    finally:
+        if args.output:
+            output_file.close()
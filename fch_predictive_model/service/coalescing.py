@@ -0,0 +1,117 @@
+import asyncio
+from ..core.cancellation import CancellationToken
+
+
+class Abandoned(Exception):
+    """Raised to a caller of `SingleFlight.run` that gave up waiting for the result."""
+
+
+class _Flight:
+    """One in-flight computation and the callers waiting for it."""
+
+    __slots__ = ('task', 'cancel_token', 'waiters')
+
+    def __init__(self, task: asyncio.Task, cancel_token: CancellationToken):
+        self.task = task
+        self.cancel_token = cancel_token
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations with equal keys into one.
+
+    The first caller of a key starts the computation; callers arriving while it
+    runs await the same result, which fans out to all of them (as does an
+    exception). The computation is cancelled through its CancellationToken once
+    every waiting caller has abandoned it.
+
+    Attributes:
+        calls (int): Number of `run` calls.
+        executions (int): Number of computations started.
+        coalesced (int): Number of calls that joined an in-flight computation.
+        abandoned (int): Number of calls that gave up waiting.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def metrics(self) -> dict:
+        """
+        Returns the coalescing counters.
+
+        Returns:
+            dict: 'calls', 'executions', 'coalesced', 'abandoned', 'in_flight' and the
+                  'coalescing_ratio' (share of calls served by another call's computation).
+        """
+        return {
+            'calls': self.calls,
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'abandoned': self.abandoned,
+            'in_flight': self.in_flight,
+            'coalescing_ratio': self.coalesced / self.calls if self.calls else 0.0,
+        }
+
+    async def run(self, key, compute, abandoned=None):
+        """
+        Returns the result of `compute` for a key, sharing in-flight computations.
+
+        Args:
+            key (hashable): Identity of the computation, e.g. `batch_runner.operating_point_key`.
+            compute (callable): Takes a CancellationToken and returns an awaitable result.
+            abandoned (awaitable): Optional awaitable completing when the caller no longer
+                needs the result, e.g. on a client disconnect.
+
+        Returns:
+            The result of the shared computation.
+
+        Raises:
+            Abandoned: If `abandoned` completes before the result.
+        """
+        self.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            cancel_token = CancellationToken()
+            task = asyncio.ensure_future(compute(cancel_token))
+            flight = _Flight(task, cancel_token)
+            self._flights[key] = flight
+            self.executions += 1
+            task.add_done_callback(lambda _: self._finished(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        watcher = asyncio.ensure_future(abandoned) if abandoned is not None else None
+        try:
+            if watcher is not None:
+                await asyncio.wait({flight.task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+                if not flight.task.done():
+                    self.abandoned += 1
+                    raise Abandoned()
+            return await asyncio.shield(flight.task)
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is waiting anymore; later callers start a fresh computation
+                flight.cancel_token.cancel()
+                self._discard(key, flight)
+
+    def _discard(self, key, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def _finished(self, key, flight: _Flight):
+        if not flight.task.cancelled():
+            flight.task.exception()  # Retrieved even if every caller abandoned it
+        self._discard(key, flight)
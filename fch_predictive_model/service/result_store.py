@@ -0,0 +1,158 @@
+import json
+import sqlite3
+import threading
+import time
+from ..core.checkpoint import pack_solver_state, unpack_solver_state
+from ..core.results_compiler import CompiledResult
+
+# Solver information kept with a stored result
+STORED_SOLVER_INFO = ('iterations', 'initial_error', 'convergence_error', 'converged', 'stop_reason',
+                      'engine', 'solve_seconds')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    result TEXT,
+    solver_info TEXT NOT NULL,
+    state BLOB,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class ResultStore:
+    """
+    Result store shared by all worker processes through one SQLite file.
+
+    Holds compiled results of converged solves and compressed solver states
+    (converged fields, or the fields of a solve stopped by its time budget, from
+    which a later request resumes). The file runs in WAL mode, so readers in every
+    worker proceed while one worker writes. The store is bounded in entries and
+    bytes; the least recently used entries are evicted first. Hit and miss
+    counters are kept in the file as well, so they cover all workers.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, max_bytes: int = 256 * 2 ** 20):
+        """
+        Opens (or creates) the store.
+
+        Args:
+            path (str): SQLite database file.
+            max_entries (int): Maximum number of entries.
+            max_bytes (int): Maximum total size of the stored results and states.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread; sqlite3 connections are not shared across threads."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _count(self, connection: sqlite3.Connection, name: str):
+        connection.execute(
+            'INSERT INTO counters (name, value) VALUES (?, 1) '
+            'ON CONFLICT(name) DO UPDATE SET value = value + 1', (name,))
+
+    def get(self, key: str) -> tuple:
+        """
+        Looks up the result of a converged solve.
+
+        Args:
+            key (str): Entry key, e.g. `batch_runner.operating_point_key`.
+
+        Returns:
+            tuple: The CompiledResult and its solver information, or None on a miss.
+        """
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT result, solver_info FROM entries WHERE key = ? AND result IS NOT NULL',
+                (key,)).fetchone()
+            self._count(connection, 'hits' if row else 'misses')
+            if row is None:
+                return None
+            connection.execute('UPDATE entries SET last_used = ? WHERE key = ?', (time.time(), key))
+        return CompiledResult.from_record(json.loads(row[0])), json.loads(row[1])
+
+    def get_state(self, key: str) -> dict:
+        """
+        Looks up the stored solver state of an entry.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            dict: Solver state suitable for `FCHPerformanceModel.resume`, or None.
+        """
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT state FROM entries WHERE key = ? AND state IS NOT NULL', (key,)).fetchone()
+        return unpack_solver_state(row[0]) if row else None
+
+    def put(self, key: str, results: CompiledResult, solver_info: dict, state: dict = None):
+        """
+        Stores the outcome of a solve, then evicts entries beyond the size limits.
+
+        Args:
+            key (str): Entry key.
+            results (CompiledResult): Compiled results; None for an unconverged solve.
+            solver_info (dict): Solver information of the solve.
+            state (dict): Optional solver state ('fields', 'iteration', 'residual_history',
+                          'convergence_error') to keep compressed.
+        """
+        result = json.dumps(results.to_record()) if results is not None else None
+        info = json.dumps({name: solver_info.get(name) for name in STORED_SOLVER_INFO})
+        packed = pack_solver_state(state) if state is not None else None
+        size = len(result or '') + len(info) + len(packed or b'')
+
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO entries (key, result, solver_info, state, size, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?)', (key, result, info, packed, size, time.time()))
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection):
+        count, total = connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        while count > self.max_entries or (total > self.max_bytes and count > 1):
+            key, size = connection.execute(
+                'SELECT key, size FROM entries ORDER BY last_used LIMIT 1').fetchone()
+            connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self._count(connection, 'evictions')
+            count, total = count - 1, total - size
+
+    def metrics(self) -> dict:
+        """
+        Returns the store counters of all workers.
+
+        Returns:
+            dict: 'entries', 'bytes', 'hits', 'misses', 'evictions' and the 'hit_rate'.
+        """
+        connection = self._connection()
+        entries, size = connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        counters = dict(connection.execute('SELECT name, value FROM counters').fetchall())
+        hits, misses = counters.get('hits', 0), counters.get('misses', 0)
+        return {
+            'entries': entries,
+            'bytes': size,
+            'hits': hits,
+            'misses': misses,
+            'evictions': counters.get('evictions', 0),
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+        }
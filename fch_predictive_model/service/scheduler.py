@@ -0,0 +1,180 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+
+# Priority classes, served in this order
+INTERACTIVE = 0
+BATCH = 1
+
+# Lanes of the scheduler; short jobs never queue behind regular solves
+SHORT = 'short'
+REGULAR = 'regular'
+
+
+class Rejected(Exception):
+    """
+    Raised when the scheduler cannot admit a request.
+
+    Attributes:
+        status_code (int): 429 for a client over its concurrency limit, 503 for a full queue.
+        retry_after (int): Suggested delay before retrying, in seconds.
+    """
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class _Lane:
+    """Solve slots with a bounded priority queue of waiting jobs."""
+
+    def __init__(self, slots: int, max_queue: int):
+        self.slots = slots
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = []
+        self.completed = 0
+        self.rejected = 0
+        self.service_time = None
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, future in self.waiting if not future.done())
+
+    def retry_after(self) -> int:
+        """Estimated wait until a slot frees up for a new job, in seconds."""
+        service_time = self.service_time or 1.0
+        return max(1, math.ceil(service_time * (self.queued + 1) / self.slots))
+
+    def record(self, duration: float):
+        self.completed += 1
+        # Exponentially weighted moving average of the solve duration
+        if self.service_time is None:
+            self.service_time = duration
+        else:
+            self.service_time += 0.2 * (duration - self.service_time)
+
+    def release(self):
+        while self.waiting:
+            *_, future = heapq.heappop(self.waiting)
+            if not future.done():
+                future.set_result(None)  # The slot passes to the waiting job
+                return
+        self.active -= 1
+
+
+class AdmissionScheduler:
+    """
+    Admission control in front of the solver.
+
+    Solves run in a fixed number of slots. Jobs that find no free slot wait in a
+    bounded queue, interactive jobs ahead of batch jobs; short jobs (fast
+    estimates) have their own slots and queue. Each client may have a limited
+    number of outstanding requests. Requests that cannot be admitted are
+    rejected with a status code and a Retry-After estimate instead of piling up.
+    """
+
+    def __init__(self, max_concurrent: int = 1, max_queue: int = 8, max_per_client: int = 4,
+                 short_slots: int = 1, max_short_queue: int = 8):
+        """
+        Initializes the scheduler.
+
+        Args:
+            max_concurrent (int): Number of concurrent regular solves.
+            max_queue (int): Number of regular jobs allowed to wait for a slot.
+            max_per_client (int): Outstanding requests allowed per client.
+            short_slots (int): Number of concurrent short jobs.
+            max_short_queue (int): Number of short jobs allowed to wait for a slot.
+        """
+        self.max_per_client = max_per_client
+        self.lanes = {REGULAR: _Lane(max_concurrent, max_queue), SHORT: _Lane(short_slots, max_short_queue)}
+        self._clients = {}
+        self._sequence = itertools.count()
+        self.client_rejections = 0
+
+    @asynccontextmanager
+    async def client(self, client_id: str):
+        """
+        Counts an outstanding request of a client for the duration of the block.
+
+        Args:
+            client_id (str): Identity of the client, e.g. its address.
+
+        Raises:
+            Rejected: With status 429 if the client already has `max_per_client` requests.
+        """
+        if self._clients.get(client_id, 0) >= self.max_per_client:
+            self.client_rejections += 1
+            raise Rejected(429, self.lanes[REGULAR].retry_after(),
+                           f"Client {client_id} has too many requests in progress")
+        self._clients[client_id] = self._clients.get(client_id, 0) + 1
+        try:
+            yield
+        finally:
+            self._clients[client_id] -= 1
+            if not self._clients[client_id]:
+                del self._clients[client_id]
+
+    async def run(self, compute, priority: int = INTERACTIVE, short: bool = False):
+        """
+        Runs a job once a solve slot is available.
+
+        Args:
+            compute (callable): Returns an awaitable with the job result.
+            priority (int): `INTERACTIVE` or `BATCH`.
+            short (bool): Whether the job is short and runs in the short-job lane.
+
+        Returns:
+            The result of the job.
+
+        Raises:
+            Rejected: With status 503 if the queue of the lane is full.
+        """
+        lane = self.lanes[SHORT if short else REGULAR]
+        if lane.active < lane.slots and not lane.queued:
+            lane.active += 1
+        else:
+            if lane.queued >= lane.max_queue:
+                lane.rejected += 1
+                raise Rejected(503, lane.retry_after(), "The model service is saturated")
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(lane.waiting, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    lane.release()  # The slot was handed over just before the cancellation
+                raise
+
+        start = time.monotonic()
+        try:
+            return await compute()
+        finally:
+            lane.record(time.monotonic() - start)
+            lane.release()
+
+    def metrics(self) -> dict:
+        """
+        Returns the scheduler state and counters.
+
+        Returns:
+            dict: Per lane the 'slots', 'active' and 'queued' jobs, 'completed' and
+                  'rejected' jobs and the average 'service_time'; the number of
+                  'clients' with requests in progress and of 'client_rejections'.
+        """
+        return {
+            'lanes': {
+                name: {
+                    'slots': lane.slots, 'active': lane.active, 'queued': lane.queued,
+                    'completed': lane.completed, 'rejected': lane.rejected,
+                    'service_time': lane.service_time,
+                }
+                for name, lane in self.lanes.items()
+            },
+            'clients': len(self._clients),
+            'client_rejections': self.client_rejections,
+        }
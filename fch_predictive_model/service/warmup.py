@@ -0,0 +1,41 @@
+import time
+from ..core.model import FCHPerformanceModel
+from ..utils.config_loader import load_config
+
+# Operating point of the warm-up solves; any converging point serves
+WARM_UP_POINT = {
+    'layer_count': 100,
+    'life_cycle': 'BOL',
+    'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+    'temperatures': {'dry': 80, 'wet': 80},
+    'relative_humidities': {'dry': 10, 'wet': 90},
+    'pressures': {'dry': 120, 'wet': 120},
+}
+
+
+def warm_up(config_path: str, mesh_resolution: int = 12) -> dict:
+    """
+    Prepares a model service for its first request.
+
+    Parses and caches the configuration and runs one coarse solve per product
+    model, so the first request does not pay for the configuration parsing and
+    the first use of the solver code paths.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        mesh_resolution (int): Mesh resolution of the warm-up solves.
+
+    Returns:
+        dict: Per product model the 'mesh' resolution of its warm-up solve and the
+              warm-up 'duration' in seconds.
+    """
+    config = load_config(config_path)
+
+    report = {}
+    for product_model in config['channel_properties']:
+        start = time.perf_counter()
+        model = FCHPerformanceModel(product_model, **WARM_UP_POINT, config_path=config_path,
+                                    mesh_resolution=mesh_resolution)
+        model.compile_results()
+        report[product_model] = {'mesh': model.mesh['model'], 'duration': time.perf_counter() - start}
+    return report
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import os
+import unittest
+import numpy as np
+from fch_predictive_model.core.active_set import ActiveSet
+from fch_predictive_model.core.model import FCHPerformanceModel
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestActiveSet(unittest.TestCase):
+    """
+    Unit tests for the active-set solver.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def _solve(self, active_set: bool) -> FCHPerformanceModel:
+        model = FCHPerformanceModel(**self.point, config_path=CONFIG_PATH, mesh_resolution=64,
+                                    active_set=active_set)
+        with contextlib.redirect_stdout(io.StringIO()):
+            model.compile_results()
+        return model
+
+    def test_same_results(self) -> None:
+        """Test that freezing converged tiles does not change the outlet results."""
+        reference = self._solve(False)
+        model = self._solve(True)
+
+        self.assertTrue(model.solver_info['converged'])
+        self.assertLess(model.solver_info['active_fraction'], 1.0)
+        self.assertNotIn('active_fraction', reference.solver_info)
+        self.assertEqual(model.compile_solution().to_dict(), reference.compile_solution().to_dict())
+        for side in ('dry', 'wet'):
+            np.testing.assert_allclose(model.enthalpy_matrix[side], reference.enthalpy_matrix[side],
+                                       rtol=0, atol=model.solver_info['convergence_threshold'])
+
+    def test_plan(self) -> None:
+        """Test that only tiles with every upstream tile converged are frozen."""
+        active_set = ActiveSet(tile_size=64)
+        active_set.cell_changes = np.ones((256, 256))
+        active_set.cell_changes[:128, :192] = 0.0
+        active_set.cell_changes[128:192, :64] = 0.0
+        # Converged, but downstream of an active tile
+        active_set.cell_changes[192:, 128:] = 0.0
+
+        slabs = active_set._plan(convergence_threshold=1.0)
+
+        self.assertEqual(slabs, [(0, 128, 192), (128, 192, 64), (192, 256, 0)])
+        # Small slabs are merged, as every slab costs a solver call
+        active_set.tile_size = 16
+        active_set.cell_changes = np.ones((32, 32))
+        active_set.cell_changes[:16, :16] = 0.0
+        self.assertEqual(active_set._plan(convergence_threshold=1.0), [(0, 32, 0)])
+        active_set.cell_changes[:] = 1.0
+        self.assertIsNone(active_set._plan(convergence_threshold=1.0))
+
+    def test_invalid_settings(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with self.assertRaises(ValueError):
+            ActiveSet(tile_size=0)
+        with self.assertRaises(ValueError):
+            ActiveSet(freeze_factor=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
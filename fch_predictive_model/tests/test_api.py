@@ -0,0 +1,113 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from starlette.testclient import TestClient
+
+# The service modules are imported without a result store file
+os.environ.setdefault('FCH_RESULT_STORE', '')
+import main
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestPressureDropApi(unittest.TestCase):
+    """
+    Unit tests for the pressure drop surface endpoint.
+    """
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(main, 'CONFIG_PATH', CONFIG_PATH)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Without a context manager, the startup warm-up does not run
+        self.client = TestClient(main.app)
+
+    def test_surface(self) -> None:
+        """Test that the surface holds one value per flow rate and layer count."""
+        response = self.client.post('/api/pressure_drop', json={
+            'flow_rates': [0.1, 0.2], 'layer_counts': [100, 150, 200], 'product_models': ['ax100']})
+
+        self.assertEqual(response.status_code, 200)
+        surface = response.json()
+        self.assertEqual(surface['product_models'], ['AX_100'])
+        self.assertEqual(len(surface['pressure_drop']['AX_100']['wet']), 2)
+        self.assertEqual(len(surface['pressure_drop']['AX_100']['wet'][0]), 3)
+
+    def test_invalid_requests(self) -> None:
+        """Test that malformed requests are rejected with 422 instead of failing."""
+        for request in (
+                {'layer_counts': [100]},
+                {'flow_rates': 0.1, 'layer_counts': [100]},
+                {'flow_rates': [], 'layer_counts': [100]},
+                {'flow_rates': [0.1], 'layer_counts': [0]},
+                {'flow_rates': [0.1], 'layer_counts': [-5]},
+                {'flow_rates': [0.1, 'fast'], 'layer_counts': [100]},
+                {'flow_rates': [0.1], 'layer_counts': [True]},
+                {'flow_rates': [0.1], 'layer_counts': [1e-300]},
+                {'flow_rates': [0.1], 'layer_counts': [100], 'product_models': 'AX_100'},
+                {'flow_rates': [0.1], 'layer_counts': [100], 'product_models': ['AX_999']},
+                {'flow_rates': list(range(1, 2001)), 'layer_counts': list(range(1, 2001))},
+        ):
+            with self.subTest(request=request):
+                self.assertEqual(self.client.post('/api/pressure_drop', json=request).status_code, 422)
+
+
+class TestConfigFingerprint(unittest.TestCase):
+    """
+    Unit tests for the configuration fingerprint in the result keys.
+    """
+
+    def test_follows_config_edits(self) -> None:
+        """Test that editing the configuration without a restart changes the fingerprint."""
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = os.path.join(directory, 'config.yaml')
+            with open(config_path, 'w') as config_file:
+                config_file.write('model_properties:\n  relaxation_factor: 0.01\n')
+            with mock.patch.object(main, 'CONFIG_PATH', config_path):
+                fingerprint = main.config_fingerprint()
+                self.assertEqual(main.config_fingerprint(), fingerprint)
+
+                with open(config_path, 'w') as config_file:
+                    config_file.write('model_properties:\n  relaxation_factor: 0.02\n')
+                os.utime(config_path, ns=(0, 0))
+
+                self.assertNotEqual(main.config_fingerprint(), fingerprint)
+            with mock.patch.object(main, 'CONFIG_PATH', os.path.join(directory, 'missing.yaml')):
+                with self.assertRaises(FileNotFoundError):
+                    main.config_fingerprint()
+
+
+class TestDefaultConfig(unittest.TestCase):
+    """
+    Unit tests for the service with its default configuration, as deployed.
+    """
+
+    def test_pressure_drop(self) -> None:
+        """Test that the endpoints read the configuration the service is started with."""
+        self.assertTrue(os.path.isfile(main.CONFIG_PATH))
+        self.assertTrue(main.config_fingerprint())
+
+        response = TestClient(main.app).post('/api/pressure_drop', json={
+            'flow_rates': [0.1], 'layer_counts': [100]})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_ready(self) -> None:
+        """Test that the startup warm-up succeeds, as checked by the container health check."""
+        with TestClient(main.app) as client:
+            deadline = time.monotonic() + 120
+            response = client.get('/ready')
+            while response.status_code != 200 and response.json()['error'] is None \
+                    and time.monotonic() < deadline:
+                time.sleep(0.1)
+                response = client.get('/ready')
+
+        self.assertEqual(response.status_code, 200, response.json())
+        for product_report in response.json()['warm_up'].values():
+            self.assertEqual(product_report['mesh'], main.ESTIMATE_MESH_RESOLUTION)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import contextlib
+import io
+import os
+import unittest
+from unittest import mock
+import numpy as np
+from fch_predictive_model.core.batch_runner import CONFIG_OVERRIDES_KEY, build_model, run_operating_point
+from fch_predictive_model.core.batch_solver import solve_models
+from fch_predictive_model.core.grid_study import with_mesh_resolution
+from fch_predictive_model.core import model_trainer
+from fch_predictive_model.utils.psychrometric_functions import calculate_relative_humidity
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestBatchSolver(unittest.TestCase):
+    """
+    Unit tests for solving several models in lockstep.
+    """
+
+    def setUp(self) -> None:
+        """Set up operating points of one product with different conditions."""
+        base = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.points = [
+            base,
+            {**base, 'life_cycle': 'EOL', 'mass_flow_rates': {'dry': 0.05, 'wet': 0.1}},
+            {**base, 'temperatures': {'dry': 60, 'wet': 80}, 'pressures': {'dry': 150, 'wet': 110}},
+        ]
+
+    def test_matches_single_solves(self) -> None:
+        """Test that batched solves reproduce the single solves exactly."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = [run_operating_point(point, CONFIG_PATH)[0] for point in self.points]
+        models = [build_model(point, CONFIG_PATH) for point in self.points]
+        results = solve_models(models)
+
+        for result, reference, model in zip(results, expected, models):
+            self.assertEqual(result.to_record(), reference.to_record())
+            self.assertTrue(model.solver_info['converged'])
+            self.assertEqual(model.solver_info['stop_reason'], 'converged')
+            # The batched solution is kept, not solved again
+            self.assertEqual(model.compile_results().to_record(), reference.to_record())
+            self.assertEqual(model.solver_info['engine'], 'batched')
+
+    def test_relative_humidity(self) -> None:
+        """Test that the relative humidity is evaluated for the solved fields."""
+        single = build_model(self.points[2], CONFIG_PATH)
+        with contextlib.redirect_stdout(io.StringIO()):
+            single.compile_results()
+        batched = build_model(self.points[2], CONFIG_PATH)
+        solve_models([batched])
+
+        for side in ('dry', 'wet'):
+            expected = calculate_relative_humidity(
+                single.temperature_matrix[side], w=single.humidity_ratio_matrix[side],
+                P=single.pressures[side])
+            np.testing.assert_array_equal(single.relative_humidity_matrix[side], expected)
+            np.testing.assert_array_equal(batched.relative_humidity_matrix[side], expected)
+
+    def test_relative_humidity_outside_loop(self) -> None:
+        """Test that the solvers evaluate the relative humidity once per side, not per iteration."""
+        for solve in (lambda model: model.compile_results(), lambda model: solve_models([model])):
+            model = build_model(self.points[0], CONFIG_PATH)
+            with mock.patch.object(model_trainer, 'calculate_relative_humidity',
+                                   wraps=model_trainer.calculate_relative_humidity) as relative_humidity, \
+                    contextlib.redirect_stdout(io.StringIO()):
+                solve(model)
+
+            self.assertGreater(model.solver_info['iterations'], 1)
+            self.assertEqual(relative_humidity.call_count, 2)
+
+    def test_iteration_limit(self) -> None:
+        """Test that a model reaching the iteration limit leaves the batch without results."""
+        point = dict(self.points[0])
+        point[CONFIG_OVERRIDES_KEY] = {'model_properties': {'max_iterations': 5}}
+        models = [build_model(point, CONFIG_PATH)]
+
+        self.assertEqual(solve_models(models), [None])
+        self.assertEqual(models[0].solver_info['stop_reason'], 'max_iterations')
+        self.assertEqual(models[0].solver_info['iterations'], 5)
+
+    def test_incompatible_models(self) -> None:
+        """Test that models of different meshes are rejected."""
+        models = [build_model(self.points[0], CONFIG_PATH),
+                  build_model(with_mesh_resolution(self.points[1], 20), CONFIG_PATH)]
+
+        with self.assertRaises(ValueError):
+            solve_models(models)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from fch_predictive_model.core.batch_runner import run_operating_points
+from fch_predictive_model.core.calibration import calibrate, expand_parameters, read_measurements
+from fch_predictive_model.core.results_compiler import ResultTable
+from fch_predictive_model.core.sensitivity import set_input
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+PARAMETER = 'membrane_properties.mass_transfer_resistance'
+
+
+class TestCalibration(unittest.TestCase):
+    """
+    Unit tests for the least-squares calibration engine.
+    """
+
+    def setUp(self) -> None:
+        """Set up synthetic measurements of a few operating points."""
+        base = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.points = [set_input(base, 'mass_flow_rates.dry', flow) for flow in (0.05, 0.1, 0.2)]
+        truth = [set_input(point, PARAMETER, 65) for point in self.points]
+        outcomes = run_operating_points(truth, CONFIG_PATH, max_workers=1)
+        table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+        self.measured = {'dew_point_dry_outlet': table['dew_point_dry_outlet']}
+
+    def test_recovers_parameter(self) -> None:
+        """Test that the fit recovers the parameter the measurements were made with."""
+        fit = calibrate(self.points, self.measured, (PARAMETER,), bounds={PARAMETER: (10, 200)},
+                        config_path=CONFIG_PATH, max_workers=1)
+        diagnostics = fit['diagnostics']
+
+        self.assertAlmostEqual(fit['parameters'][PARAMETER], 65, delta=0.5)
+        self.assertEqual(fit['overlay'], {'membrane_properties': {
+            'mass_transfer_resistance': fit['parameters'][PARAMETER]}})
+        self.assertLess(diagnostics['cost_history'][-1], diagnostics['cost_history'][0])
+        self.assertLess(diagnostics['rmse']['dew_point_dry_outlet'], 0.05)
+
+    def test_respects_bounds(self) -> None:
+        """Test that the calibrated parameter stays within its bounds."""
+        fit = calibrate(self.points, self.measured, (PARAMETER,), bounds={PARAMETER: (70, 200)},
+                        config_path=CONFIG_PATH, max_workers=1)
+
+        self.assertGreaterEqual(fit['parameters'][PARAMETER], 70)
+        self.assertTrue(np.isfinite(fit['diagnostics']['rmse']['dew_point_dry_outlet']))
+
+    def test_life_cycle_stages(self) -> None:
+        """Test that a dataset mixing life cycle stages fits one factor per stage."""
+        points = self.points[:2] + [dict(point, life_cycle='EOL') for point in self.points[:2]]
+        truth = [set_input(point, 'life_cycle_factor', 0.98 if point['life_cycle'] == 'BOL' else 0.9)
+                 for point in points]
+        outcomes = run_operating_points(truth, CONFIG_PATH, max_workers=1)
+        table = ResultTable.from_results([results for results, _ in outcomes], rounded=False)
+        measured = {'dew_point_dry_outlet': table['dew_point_dry_outlet']}
+
+        fit = calibrate(points, measured, ('life_cycle_factor',),
+                        bounds={'life_cycle_factor': (0.5, 1.2)}, config_path=CONFIG_PATH, max_workers=1)
+
+        self.assertEqual(set(fit['parameters']), {'life_cycle_factor.BOL', 'life_cycle_factor.EOL'})
+        self.assertAlmostEqual(fit['parameters']['life_cycle_factor.BOL'], 0.98, delta=0.005)
+        self.assertAlmostEqual(fit['parameters']['life_cycle_factor.EOL'], 0.9, delta=0.005)
+        self.assertEqual(fit['overlay'], {'life_cycle_factor': {
+            'BOL': fit['parameters']['life_cycle_factor.BOL'],
+            'EOL': fit['parameters']['life_cycle_factor.EOL'],
+        }})
+        with self.assertRaises(ValueError):
+            expand_parameters(('life_cycle_factor',), truth)
+
+    def test_standard_errors(self) -> None:
+        """Test that the standard errors are evaluated at the calibrated values."""
+        fit = calibrate(self.points, self.measured, (PARAMETER,), initial={PARAMETER: 65},
+                        max_iterations=0, config_path=CONFIG_PATH, max_workers=1)
+        diagnostics = fit['diagnostics']
+
+        self.assertEqual(fit['parameters'][PARAMETER], 65)
+        # The residual and one Jacobian column at the calibrated value
+        self.assertEqual(diagnostics['solves'], 2 * len(self.points))
+        self.assertTrue(np.isfinite(diagnostics['standard_errors'][PARAMETER]))
+
+    def test_read_measurements(self) -> None:
+        """Test that numeric life cycles are read as performance factors, like streamed points."""
+        with tempfile.TemporaryDirectory() as directory:
+            data_path = os.path.join(directory, 'measurements.csv')
+            with open(data_path, 'w') as data_file:
+                data_file.write(
+                    'mass_flow_dry,mass_flow_wet,temp_dry,temp_wet,humidity_dry,humidity_wet,'
+                    'pressure_dry,pressure_wet,life_cycle,dew_point_dry_outlet\n'
+                    '0.1,0.1,80,80,10,90,120,120,EOL,40.5\n'
+                    '0.1,0.1,80,80,10,90,120,120,0.95,\n'
+                    '0.1,0.1,80,80,10,90,120,120,,41.0\n'
+                )
+            points, measured = read_measurements(
+                data_path, {'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL'})
+
+        self.assertEqual([point['life_cycle'] for point in points], ['EOL', 0.95, 'BOL'])
+        self.assertEqual(points[0]['mass_flow_rates'], {'dry': 0.1, 'wet': 0.1})
+        np.testing.assert_array_equal(measured['dew_point_dry_outlet'], [40.5, np.nan, 41.0])
+        self.assertEqual(expand_parameters(('life_cycle_factor',), points),
+                         ('life_cycle_factor.BOL', 'life_cycle_factor.EOL'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import threading
+import unittest
+from fch_predictive_model.core.batch_runner import build_model
+from fch_predictive_model.core.cancellation import CancellationToken
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestCancellation(unittest.TestCase):
+    """
+    Unit tests for solve time budgets and cooperative cancellation.
+    """
+
+    def setUp(self) -> None:
+        """Set up a model of the base operating point."""
+        self.model = build_model({
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }, CONFIG_PATH)
+
+    def test_time_budget(self) -> None:
+        """Test that an expired budget returns a partial result flagged as unconverged."""
+        results = self.model.compile_results(time_budget=0)
+        info = self.model.solver_info
+
+        self.assertFalse(info['converged'])
+        self.assertEqual(info['stop_reason'], 'time_budget')
+        self.assertEqual(info['iterations'], 0)
+        self.assertIn('DPAT', results)
+
+    def test_cancel_from_another_thread(self) -> None:
+        """Test that a running solve stops once its token is cancelled."""
+        token = CancellationToken()
+        timer = threading.Timer(0.1, token.cancel)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.model.model_properties['convergence_threshold'] = 0
+        self.model.model_properties['max_iterations'] = 10 ** 9
+
+        self.model.compile_results(cancel_token=token)
+        info = self.model.solver_info
+
+        self.assertFalse(info['converged'])
+        self.assertEqual(info['stop_reason'], 'cancelled')
+        self.assertGreater(info['iterations'], 0)
+
+    def test_converged(self) -> None:
+        """Test that a solve within its budget is flagged as converged."""
+        self.model.compile_results(time_budget=60, cancel_token=CancellationToken())
+
+        self.assertTrue(self.model.solver_info['converged'])
+        self.assertEqual(self.model.solver_info['stop_reason'], 'converged')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+from fch_predictive_model.core.batch_runner import build_model, run_operating_point
+from fch_predictive_model.core.checkpoint import (
+    RESULTS_FILE, load_solver_state, run_sweep, save_solver_state
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class Interrupted(Exception):
+    """Raised by a checkpoint callback to simulate a crash."""
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Unit tests for solver checkpoints and resumable sweeps.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point and a checkpoint directory."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_resume_solve(self) -> None:
+        """Test that a resumed solve reproduces the uninterrupted solution."""
+        reference = build_model(self.point, CONFIG_PATH)
+        reference_results = reference.compile_results()
+        state_path = os.path.join(self.directory.name, 'state.npz')
+
+        def interrupt(state: dict):
+            save_solver_state(state_path, state)
+            if state['iteration'] >= 150:
+                raise Interrupted
+
+        model = build_model(self.point, CONFIG_PATH)
+        model.enable_checkpoints(interrupt, interval=0)
+        with self.assertRaises(Interrupted):
+            model.compile_results()
+
+        state = load_solver_state(state_path)
+        self.assertEqual(state['iteration'], 150)
+        resumed = build_model(self.point, CONFIG_PATH)
+        resumed.resume(state)
+        results = resumed.compile_results()
+
+        self.assertEqual(results.to_dict(), reference_results.to_dict())
+        self.assertEqual(resumed.solver_info['iterations'], reference.solver_info['iterations'])
+
+    def test_resume_sweep(self) -> None:
+        """Test that a resumed sweep skips finished points."""
+        points = [self.point, dict(self.point, mass_flow_rates={'dry': 0.2, 'wet': 0.1})]
+        results = run_sweep(points, self.directory.name, CONFIG_PATH, max_workers=1)
+        expected, _ = run_operating_point(points[1], CONFIG_PATH)
+        self.assertEqual(results[1].to_dict(), expected.to_dict())
+
+        # Forget the second point, as if the sweep died while solving it
+        results_path = os.path.join(self.directory.name, RESULTS_FILE)
+        with open(results_path, 'r') as results_file:
+            first_line = results_file.readline()
+        with open(results_path, 'w') as results_file:
+            results_file.write(first_line)
+
+        resumed = run_sweep(points, self.directory.name, CONFIG_PATH, resume=True, max_workers=1)
+        self.assertEqual([r.to_dict() for r in resumed], [r.to_dict() for r in results])
+        with open(results_path, 'r') as results_file:
+            self.assertEqual([json.loads(line)['index'] for line in results_file], [0, 1])
+
+        with self.assertRaises(ValueError):
+            run_sweep(points[:1], self.directory.name, CONFIG_PATH, resume=True)
+
+    def test_resume_sweep_after_partial_write(self) -> None:
+        """Test that a sweep interrupted while writing a result can be resumed repeatedly."""
+        points = [self.point, dict(self.point, mass_flow_rates={'dry': 0.2, 'wet': 0.1})]
+        results = run_sweep(points, self.directory.name, CONFIG_PATH, max_workers=1)
+
+        # Cut the second line short, as if the sweep died while writing it
+        results_path = os.path.join(self.directory.name, RESULTS_FILE)
+        with open(results_path, 'r') as results_file:
+            first_line, second_line = results_file.readlines()
+        with open(results_path, 'w') as results_file:
+            results_file.write(first_line + second_line[:len(second_line) // 2])
+
+        for _ in range(2):
+            resumed = run_sweep(points, self.directory.name, CONFIG_PATH, resume=True, max_workers=1)
+            self.assertEqual([r.to_dict() for r in resumed], [r.to_dict() for r in results])
+            with open(results_path, 'r') as results_file:
+                self.assertEqual([json.loads(line)['index'] for line in results_file], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import os
+import unittest
+from fch_predictive_model.core.batch_runner import run_operating_point
+from fch_predictive_model.core.chunk_scheduler import (
+    MIN_CHUNK_SIZE, batch_key, plan_chunks, run_chunked, working_set
+)
+from fch_predictive_model.core.grid_study import with_mesh_resolution
+from fch_predictive_model.core.precision_study import with_field_precision
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestChunkScheduler(unittest.TestCase):
+    """
+    Unit tests for the memory-budget chunk scheduler.
+    """
+
+    def setUp(self) -> None:
+        """Set up operating points of two products."""
+        base = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.points = [
+            {**base, 'product_model': product_model, 'mass_flow_rates': {'dry': flow, 'wet': 0.1}}
+            for flow in (0.05, 0.1, 0.15) for product_model in ('AX_100', 'AX_150')
+        ]
+
+    def test_working_set(self) -> None:
+        """Test the working set estimate of the mesh size and precision."""
+        self.assertEqual(working_set(40), 4 * working_set(20))
+        self.assertLess(working_set(40, 'float32'), working_set(40))
+        _, point_working_set = batch_key(with_mesh_resolution(self.points[0], 20), CONFIG_PATH)
+        self.assertEqual(point_working_set, working_set(20))
+        _, point_working_set = batch_key(with_field_precision(self.points[0], 'float32'), CONFIG_PATH)
+        self.assertEqual(point_working_set, working_set(44, 'float32'))
+
+    def test_plan_chunks(self) -> None:
+        """Test that chunks hold one product each and fit the memory budget."""
+        budget = 2 * working_set(69)
+        chunks = plan_chunks(self.points, budget, None, CONFIG_PATH)
+
+        self.assertEqual(sorted(index for indices, _ in chunks for index in indices), list(range(6)))
+        for indices, chunk_working_set in chunks:
+            self.assertEqual(len({self.points[index]['product_model'] for index in indices}), 1)
+            self.assertLessEqual(chunk_working_set, budget)
+        with self.assertRaises(ValueError):
+            plan_chunks(self.points, working_set(44), None, CONFIG_PATH)
+
+        # The cache limit applies down to the minimum chunk size
+        chunks = plan_chunks(self.points * 4, 100 * working_set(69), working_set(69), CONFIG_PATH)
+        self.assertEqual(max(len(indices) for indices, _ in chunks), MIN_CHUNK_SIZE)
+
+    def test_run_chunked(self) -> None:
+        """Test that chunked results match single solves and the throughput is reported."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = [run_operating_point(point, CONFIG_PATH)[0] for point in self.points]
+        results, solver_info, report = run_chunked(
+            self.points, 4 * working_set(69), config_path=CONFIG_PATH, max_workers=1)
+
+        self.assertEqual([result.to_record() for result in results],
+                         [result.to_record() for result in expected])
+        self.assertTrue(all(info['converged'] for info in solver_info))
+        self.assertEqual(report['points'], 6)
+        self.assertEqual(sum(chunk['size'] for chunk in report['chunks']), 6)
+        self.assertGreater(report['points_per_second'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
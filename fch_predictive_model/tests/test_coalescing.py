@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from fch_predictive_model.core.batch_runner import operating_point_key
+from fch_predictive_model.service.coalescing import Abandoned, SingleFlight
+
+
+class TestCoalescing(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for single-flight request coalescing.
+    """
+
+    async def test_duplicates_share_one_computation(self) -> None:
+        """Test that concurrent calls with equal keys run the computation once."""
+        single_flight = SingleFlight()
+        started = []
+
+        async def compute(cancel_token):
+            started.append(cancel_token)
+            await asyncio.sleep(0.05)
+            return {'DPAT': 24.0}
+
+        results = await asyncio.gather(*(single_flight.run('key', compute) for _ in range(5)))
+        other = await single_flight.run('other', compute)
+
+        self.assertEqual(len(started), 2)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(other, {'DPAT': 24.0})
+        self.assertEqual(single_flight.metrics(), {
+            'calls': 6, 'executions': 2, 'coalesced': 4, 'abandoned': 0, 'in_flight': 0,
+            'coalescing_ratio': 4 / 6,
+        })
+
+    async def test_exception_fans_out(self) -> None:
+        """Test that every waiter receives the error of the shared computation."""
+        single_flight = SingleFlight()
+
+        async def compute(cancel_token):
+            await asyncio.sleep(0.01)
+            raise ValueError("Model diverged")
+
+        outcomes = await asyncio.gather(
+            *(single_flight.run('key', compute) for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+        self.assertEqual(single_flight.executions, 1)
+
+    async def test_abandoned_computation_is_cancelled(self) -> None:
+        """Test that the computation is cancelled once all waiters gave up."""
+        single_flight = SingleFlight()
+        tokens = []
+
+        async def compute(cancel_token):
+            tokens.append(cancel_token)
+            while not cancel_token.cancelled:
+                await asyncio.sleep(0.01)
+            return None
+
+        async def gone(delay):
+            await asyncio.sleep(delay)
+
+        outcomes = await asyncio.gather(
+            single_flight.run('key', compute, gone(0.02)),
+            single_flight.run('key', compute, gone(0.05)),
+            return_exceptions=True)
+
+        self.assertTrue(all(isinstance(outcome, Abandoned) for outcome in outcomes))
+        self.assertTrue(tokens[0].cancelled)
+        self.assertEqual(single_flight.in_flight, 0)
+
+    def test_operating_point_key(self) -> None:
+        """Test that equivalent operating points share a key."""
+        point = {
+            'product_model': 'AX_150', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        equivalent = dict(point, product_model='ax-150', temperatures={'wet': 80.0, 'dry': 80.0})
+        different = dict(point, temperatures={'dry': 80, 'wet': 70})
+
+        self.assertEqual(operating_point_key(point), operating_point_key(equivalent))
+        self.assertNotEqual(operating_point_key(point), operating_point_key(different))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+import numpy as np
+from fch_predictive_model.core.batch_runner import run_operating_point
+from fch_predictive_model.core.continuation import continuation
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestContinuation(unittest.TestCase):
+    """
+    Unit tests for the natural-parameter continuation engine.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def test_continuous_life_cycle_factor(self) -> None:
+        """Test that a numeric life cycle is used as the performance factor."""
+        stage, _ = run_operating_point(self.point, CONFIG_PATH)
+        self.point['life_cycle'] = 1.0
+        factor, _ = run_operating_point(self.point, CONFIG_PATH)
+
+        self.assertEqual(stage.to_dict(), factor.to_dict())
+
+    def test_flow_curve(self) -> None:
+        """Test a DPAT vs dry flow curve traced with adaptive steps."""
+        curve = continuation(
+            self.point, 'mass_flow_rates.dry', 0.05, 0.3, 0.01, config_path=CONFIG_PATH)
+        values = curve['values']
+
+        self.assertEqual(values[0], 0.05)
+        self.assertAlmostEqual(values[-1], 0.3)
+        self.assertTrue(np.all(np.diff(values) > 0))
+        self.assertGreater(np.max(np.diff(values)), 0.01)
+        self.assertTrue(np.all(np.diff(curve['table']['DPAT']) > 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+from fch_predictive_model.core.batch_runner import run_operating_point
+from fch_predictive_model.core.drive_cycle import (
+    read_drive_cycle, run_drive_cycle, simulate_drive_cycle
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+CYCLE = """time,mass_flow_dry,mass_flow_wet,temp_dry,temp_wet,humidity_dry,humidity_wet,pressure_dry,pressure_wet
+0,0.1,0.1,80,80,10,90,120,120
+1,0.1,0.1,80,80,10,90,120,120
+2,0.12,0.11,80,82,10,90,120,120
+"""
+
+
+class TestDriveCycle(unittest.TestCase):
+    """
+    Unit tests for the drive-cycle simulation mode.
+    """
+
+    def setUp(self) -> None:
+        """Write the drive-cycle file."""
+        handle, self.cycle_path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as cycle_file:
+            cycle_file.write(CYCLE)
+
+    def tearDown(self) -> None:
+        os.remove(self.cycle_path)
+
+    def test_warm_started_steps(self) -> None:
+        """Test that repeated steps are reused and warm-started steps match cold solves."""
+        steps = list(simulate_drive_cycle(
+            read_drive_cycle(self.cycle_path), 'AX_100', 100, 'BOL', config_path=CONFIG_PATH))
+
+        self.assertEqual([time for time, _ in steps], [0.0, 1.0, 2.0])
+        self.assertIs(steps[0][1], steps[1][1])
+
+        _, conditions = list(read_drive_cycle(self.cycle_path))[2]
+        cold, _ = run_operating_point(
+            {'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL', **conditions},
+            CONFIG_PATH)
+        self.assertEqual(steps[2][1].to_dict(), cold.to_dict())
+
+    def test_streamed_output(self) -> None:
+        """Test that one CSV row is written per step."""
+        output = io.StringIO()
+        count = run_drive_cycle(
+            self.cycle_path, output, 'AX_100', 100, 'BOL', config_path=CONFIG_PATH)
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        self.assertEqual(count, 3)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[2]['flow_rate_dry'], '0.12')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import unittest
+from fch_predictive_model.core.batch_runner import build_model, run_operating_point
+from fch_predictive_model.core.grid_study import (
+    grid_convergence_study, mesh_overlay, richardson_extrapolation, with_mesh_resolution
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestGridStudy(unittest.TestCase):
+    """
+    Unit tests for the mesh resolution override and the grid-convergence study.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def test_channel_resolution_unchanged(self) -> None:
+        """Test that the channel-based resolution reproduces the default mesh."""
+        default, _ = run_operating_point(self.point, CONFIG_PATH)
+        explicit, _ = run_operating_point(with_mesh_resolution(self.point, 44), CONFIG_PATH)
+
+        self.assertEqual(default.to_dict(), explicit.to_dict())
+
+    def test_mesh_resolution(self) -> None:
+        """Test that the mesh resolution sets the domain size."""
+        model = build_model(with_mesh_resolution(self.point, 20), CONFIG_PATH)
+
+        self.assertEqual(model.mesh['model'], 20)
+        self.assertEqual(model.humidity_ratio_matrix['dry'].shape, (20, 20))
+        with self.assertRaises(ValueError):
+            build_model(with_mesh_resolution(self.point, 1), CONFIG_PATH)
+
+    def test_richardson_extrapolation(self) -> None:
+        """Test the extrapolation of a first-order converging quantity."""
+        resolutions = (40, 27, 17)
+        values = tuple(3.0 + 5.0 / resolution for resolution in resolutions)
+        extrapolated, order = richardson_extrapolation(values, resolutions)
+
+        self.assertAlmostEqual(extrapolated, 3.0)
+        self.assertAlmostEqual(order, 1.0)
+
+    def test_recommendation(self) -> None:
+        """Test that the recommended resolution is the coarsest within tolerance."""
+        study = grid_convergence_study(
+            [self.point], {'DPAT': 0.3}, {'AX_100': [44, 29, 20, 13]},
+            config_path=CONFIG_PATH, max_workers=1)['AX_100']
+
+        self.assertEqual(study['resolutions'], [44, 29, 20, 13])
+        self.assertTrue(study['within_tolerance'])
+        self.assertTrue(all(error <= 0.3 for error, resolution
+                            in zip(study['errors']['DPAT'], study['resolutions'])
+                            if resolution >= study['recommended']))
+        self.assertGreater(study['errors']['DPAT'][-1], 0.3)
+        self.assertEqual(mesh_overlay({'AX_100': study}),
+                         {'model_properties': {'mesh_resolution': {'AX_100': study['recommended']}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import unittest
+from fch_predictive_model.core.batch_runner import run_operating_point
+from fch_predictive_model.core.inverse_design import find_minimum_layer_count
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestInverseDesign(unittest.TestCase):
+    """
+    Unit tests for the inverse-design search.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def test_warm_start_reproduces_cold_solve(self) -> None:
+        """Test that a warm-started solve converges to the cold solution."""
+        cold, fields = run_operating_point(self.point, CONFIG_PATH)
+
+        self.point['layer_count'] = 120
+        reference, _ = run_operating_point(self.point, CONFIG_PATH)
+        warm, _ = run_operating_point(self.point, CONFIG_PATH, initial_fields=fields)
+
+        self.assertNotEqual(cold['DPAT'], reference['DPAT'])
+        self.assertEqual(warm['DPAT'], reference['DPAT'])
+
+    def test_minimum_layer_count(self) -> None:
+        """Test that the optimum is the smallest stack meeting both constraints."""
+        search = find_minimum_layer_count(
+            self.point, target=30.0, max_pressure_drop=20, bounds=(1, 400),
+            config_path=CONFIG_PATH, max_workers=1
+        )
+        optimum = search['optimum']
+
+        self.assertLessEqual(search['results']['DPAT'], 30.0)
+        self.assertLess(search['solves'], 20)
+
+        self.point['layer_count'] = optimum - 1
+        below, _ = run_operating_point(self.point, CONFIG_PATH)
+        self.assertGreater(below['DPAT'], 30.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import unittest
+from fch_predictive_model.core.performance_map import generate_performance_map
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestPerformanceMap(unittest.TestCase):
+    """
+    Unit tests for the adaptive performance-map generator.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.bounds = {'mass_flow_rates.dry': (0.02, 0.4), 'temperatures.wet': (60, 85)}
+
+    def test_adaptive_refinement(self) -> None:
+        """Test that refinement needs fewer solves than the equivalent uniform grid."""
+        performance_map = generate_performance_map(
+            self.point, self.bounds, {'DPAT': 1.0}, max_level=3,
+            config_path=CONFIG_PATH, max_workers=1
+        )
+
+        self.assertLess(performance_map.solves, performance_map.uniform_solves)
+        table = performance_map.to_table()
+        self.assertEqual(len(table['DPAT']), performance_map.solves)
+
+        # The map reproduces its own samples
+        sample = {name: table[name][3] for name in self.bounds}
+        self.assertAlmostEqual(performance_map.interpolate(sample)['DPAT'], table['DPAT'][3])
+
+    def test_solve_budget(self) -> None:
+        """Test that refinement stops at the solve budget."""
+        performance_map = generate_performance_map(
+            self.point, self.bounds, {'DPAT': 0.01}, max_level=4, max_solves=12,
+            config_path=CONFIG_PATH, max_workers=1
+        )
+
+        self.assertLessEqual(performance_map.solves, 12)
+        self.assertIsInstance(performance_map.interpolate([0.3, 70])['DPAT'], float)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import os
+import unittest
+import numpy as np
+from fch_predictive_model.core.batch_runner import build_model
+from fch_predictive_model.core.checkpoint import pack_solver_state
+from fch_predictive_model.core.precision_study import precision_study, with_field_precision
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestPrecisionStudy(unittest.TestCase):
+    """
+    Unit tests for the float32 field precision policy.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def _solve(self, point):
+        model = build_model(point, CONFIG_PATH)
+        with contextlib.redirect_stdout(io.StringIO()):
+            model.compile_results()
+        return model
+
+    def test_field_types(self) -> None:
+        """Test that float32 fields stay float32 and the residuals are float64."""
+        model = self._solve(with_field_precision(self.point, 'float32'))
+
+        for fields in (model.humidity_ratio_matrix, model.enthalpy_matrix,
+                       model.temperature_matrix, model.relative_humidity_matrix):
+            for matrix in fields.values():
+                self.assertEqual(matrix.dtype, np.float32)
+        self.assertIsInstance(model.solver_info['convergence_error'], np.float64)
+        self.assertTrue(model.solver_info['converged'])
+
+        reference = self._solve(self.point)
+        self.assertEqual(reference.enthalpy_matrix['dry'].dtype, np.float64)
+        self.assertEqual(reference.solver_info['convergence_threshold'],
+                         reference.model_properties['convergence_threshold'])
+        # Archived float32 states are smaller
+        sizes = [
+            len(pack_solver_state({'iteration': 0, 'convergence_error': 0.0, 'residual_history': [],
+                                   'fields': solved.get_fields()}))
+            for solved in (model, reference)
+        ]
+        self.assertLess(sizes[0], sizes[1])
+
+    def test_zero_threshold(self) -> None:
+        """Test that a threshold of 0 is not raised, so the solve runs to its iteration limit."""
+        model = build_model(with_field_precision(self.point, 'float32'), CONFIG_PATH)
+        model.model_properties['convergence_threshold'] = 0
+        model.model_properties['max_iterations'] = 50
+        with contextlib.redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            model.compile_results()
+
+        self.assertEqual(model.solver_info['convergence_threshold'], 0)
+        self.assertEqual(model.solver_info['iterations'], 50)
+        self.assertFalse(model.solver_info['converged'])
+
+    def test_resume_across_precisions(self) -> None:
+        """Test that a float32 state warm-starts a float64 model."""
+        fields = self._solve(with_field_precision(self.point, 'float32')).get_fields()
+        model = build_model(self.point, CONFIG_PATH)
+        model.warm_start(fields)
+
+        self.assertEqual(model.enthalpy_matrix['wet'].dtype, np.float64)
+
+    def test_unknown_precision(self) -> None:
+        """Test that an unknown precision is rejected."""
+        with self.assertRaises(ValueError):
+            with_field_precision(self.point, 'float16')
+
+    def test_against_reference(self) -> None:
+        """Test that float32 outputs agree with the float64 reference."""
+        points = [self.point, {**self.point, 'temperatures': {'dry': 60, 'wet': 80}}]
+        with contextlib.redirect_stdout(io.StringIO()):
+            study = precision_study(points, config_path=CONFIG_PATH, max_workers=1)
+
+        self.assertTrue(study['within_tolerance'])
+        self.assertLess(study['max_errors']['DPAT'], 0.01)
+        self.assertEqual(study['field_bytes'], {'float64': 8, 'float32': 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+import numpy as np
+from fch_predictive_model.core.pressure_drop_calculator import (
+    SIDES, calculate_pressure_drop, pressure_drop_records, pressure_drop_surface
+)
+from fch_predictive_model.utils.config_loader import load_config
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestPressureDrop(unittest.TestCase):
+    """
+    Unit tests for the vectorized pressure drop surfaces.
+    """
+
+    def setUp(self) -> None:
+        self.pressure_drop_model = load_config(CONFIG_PATH)['pressure_drop_model']
+        self.flow_rates = [0.05, 0.1, 0.2]
+        self.layer_counts = [50, 100, 150, 200]
+
+    def test_surface_matches_scalar(self) -> None:
+        """Test that the surface holds the unrounded values of the per-point calculation."""
+        surface = pressure_drop_surface(self.flow_rates, self.layer_counts, self.pressure_drop_model)
+
+        self.assertEqual(surface['sides'], SIDES)
+        self.assertEqual(surface['pressure_drop'].shape,
+                         (len(self.pressure_drop_model), 2, len(self.flow_rates), len(self.layer_counts)))
+        self.assertNotEqual(surface['pressure_drop'][0, 0, 1, 1],
+                            round(surface['pressure_drop'][0, 0, 1, 1], 1))
+        rounded = pressure_drop_surface(self.flow_rates, self.layer_counts,
+                                        self.pressure_drop_model, rounded=True)
+        for p, product in enumerate(surface['product_models']):
+            for s, side in enumerate(SIDES):
+                for f, flow_rate in enumerate(self.flow_rates):
+                    for l, layers in enumerate(self.layer_counts):
+                        expected = calculate_pressure_drop(
+                            flow_rate, layers, self.pressure_drop_model[product][side])
+                        self.assertAlmostEqual(surface['pressure_drop'][p, s, f, l], expected, delta=0.05)
+                        self.assertEqual(rounded['pressure_drop'][p, s, f, l], expected)
+
+    def test_products(self) -> None:
+        """Test that the products can be selected and unknown ones are rejected."""
+        surface = pressure_drop_surface(self.flow_rates, self.layer_counts,
+                                        self.pressure_drop_model, ['AX_100'])
+        full = pressure_drop_surface(self.flow_rates, self.layer_counts, self.pressure_drop_model)
+
+        self.assertEqual(surface['product_models'], ['AX_100'])
+        np.testing.assert_array_equal(
+            surface['pressure_drop'][0], full['pressure_drop'][full['product_models'].index('AX_100')])
+        with self.assertRaises(ValueError):
+            pressure_drop_surface(self.flow_rates, self.layer_counts, self.pressure_drop_model, ['AX_999'])
+
+    def test_records(self) -> None:
+        """Test that the records hold one row per product, flow rate and layer count."""
+        surface = pressure_drop_surface(self.flow_rates, self.layer_counts, self.pressure_drop_model)
+        records = pressure_drop_records(surface)
+
+        self.assertEqual(len(records),
+                         len(self.pressure_drop_model) * len(self.flow_rates) * len(self.layer_counts))
+        record = records[0]
+        self.assertEqual(record['pressure_drop_wet'], surface['pressure_drop'][0, 1, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from fch_predictive_model.core.results_compiler import CompiledResult
+from fch_predictive_model.service.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    """
+    Unit tests for the shared SQLite result store.
+    """
+
+    def setUp(self) -> None:
+        """Set up a store file and a compiled result."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'results.sqlite')
+        self.results = CompiledResult(
+            {'dry': 120, 'wet': 120}, {'dry': 4.0, 'wet': 25.4},
+            np.array([[[148276.0, 232514.0], [989903.4, 903804.5]],
+                      [[0.026, 0.057], [0.343, 0.311]]]), {'dry': 0.1, 'wet': 0.1})
+        self.info = {'converged': True, 'stop_reason': 'converged', 'iterations': 400,
+                     'convergence_error': 9e-4, 'initial_error': 10.0}
+        self.state = {
+            'iteration': 400, 'convergence_error': 9e-4, 'residual_history': [],
+            'fields': {quantity: {side: np.full((4, 4), value) for side in ('dry', 'wet')}
+                       for quantity, value in (('humidity_ratio', 0.01), ('enthalpy', 1e5))},
+        }
+
+    def test_shared_between_workers(self) -> None:
+        """Test that results stored by one worker are hits in another."""
+        writer = ResultStore(self.path)
+        reader = ResultStore(self.path)
+        self.assertIsNone(reader.get('a'))
+
+        writer.put('a', self.results, self.info, self.state)
+        results, info = reader.get('a')
+
+        self.assertEqual(results.to_dict(), self.results.to_dict())
+        self.assertEqual(info['iterations'], 400)
+        np.testing.assert_array_equal(
+            reader.get_state('a')['fields']['enthalpy']['wet'], self.state['fields']['enthalpy']['wet'])
+        self.assertEqual(writer.metrics()['hits'], 1)
+        self.assertEqual(writer.metrics()['misses'], 1)
+
+    def test_unconverged_state_only(self) -> None:
+        """Test that an unconverged solve stores its state but no result."""
+        store = ResultStore(self.path)
+        store.put('a', None, dict(self.info, converged=False), self.state)
+
+        self.assertIsNone(store.get('a'))
+        self.assertEqual(store.get_state('a')['iteration'], 400)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entries are evicted beyond the limit."""
+        store = ResultStore(self.path, max_entries=2)
+        store.put('a', self.results, self.info)
+        store.put('b', self.results, self.info)
+        store.get('a')
+        store.put('c', self.results, self.info)
+
+        self.assertIsNotNone(store.get('a'))
+        self.assertIsNone(store.get('b'))
+        self.assertEqual(store.metrics()['entries'], 2)
+        self.assertEqual(store.metrics()['evictions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import unittest
+import numpy as np
+from fch_predictive_model.core.results_compiler import (
+    RESULT_COLUMNS, RESULT_KEYS, CompiledResult, ResultTable,
+    batch_result_compiler, result_compiler
+)
+from fch_predictive_model.utils.psychrometric_functions import calculate_dew_point
+
+
+class TestCompiledResult(unittest.TestCase):
+    """
+    Unit tests for the lazily evaluated CompiledResult.
+    """
+
+    def setUp(self) -> None:
+        """Build a small synthetic solution."""
+        n = 6
+        self.enthalpy_matrix = {
+            'dry': np.full((n, n), 148276.0), 'wet': np.full((n, n), 989903.4)
+        }
+        self.humidity_ratio_matrix = {
+            'dry': np.full((n, n), 0.026), 'wet': np.full((n, n), 0.343)
+        }
+        self.enthalpy_matrix['dry'][:, -1] = 313773.0
+        self.enthalpy_matrix['wet'][-1, :] = 822155.0
+        self.humidity_ratio_matrix['dry'][:, -1] = 0.088
+        self.humidity_ratio_matrix['wet'][-1, :] = 0.28
+        self.pressures = {'dry': 120, 'wet': 120}
+        self.pressure_drop = {'dry': 2.5, 'wet': 13.8}
+        self.flow_rate = {'dry': 0.1, 'wet': 0.1}
+
+    def _compile(self) -> CompiledResult:
+        return result_compiler(
+            self.pressures, self.pressure_drop, self.enthalpy_matrix,
+            self.humidity_ratio_matrix, self.flow_rate
+        )
+
+    def test_values(self) -> None:
+        """Test the derived quantities against a reference solution."""
+        results = self._compile()
+
+        self.assertEqual(list(results.keys()), list(RESULT_KEYS))
+        self.assertEqual(results['pressure']['wet']['outlet'], 106.2)
+        self.assertEqual(results['temperature']['dry']['inlet'], 79.0)
+        self.assertEqual(results['relative_humidity']['dry']['outlet'], 30.6)
+        self.assertEqual(results['dew_point']['wet']['inlet'], 77.5)
+        self.assertEqual(results['DPAT'], 23.9)
+        self.assertEqual(results['max__pressure_differential'], 13.8)
+
+    def test_lazy_evaluation(self) -> None:
+        """Test that derived quantities are only computed on access."""
+        results = self._compile()
+        self.assertFalse(hasattr(results, '__dict__'))
+        self.assertIsNone(results._dew_point)
+
+        results['humidity_ratio']
+        self.assertIsNone(results._dew_point)
+
+        dew_point = results['dew_point']
+        self.assertIs(results['dew_point'], dew_point)
+
+    def test_dict_view(self) -> None:
+        """Test the plain dictionary view used by the template and exporters."""
+        results = self._compile()
+        as_dict = results.to_dict()
+
+        self.assertEqual(dict(results), as_dict)
+        self.assertEqual(json.loads(json.dumps(as_dict))['DPAT'], 23.9)
+
+
+class TestResultTable(unittest.TestCase):
+    """
+    Unit tests for the vectorized ResultTable.
+    """
+
+    def setUp(self) -> None:
+        """Build a stack of random solutions."""
+        rng = np.random.default_rng(0)
+        count, n = 50, 5
+        self.enthalpy_matrices = {
+            'dry': rng.uniform(1e5, 4e5, (count, n, n)),
+            'wet': rng.uniform(5e5, 1e6, (count, n, n))
+        }
+        self.humidity_ratio_matrices = {
+            'dry': rng.uniform(0.01, 0.1, (count, n, n)),
+            'wet': rng.uniform(0.2, 0.35, (count, n, n))
+        }
+        self.pressures = {'dry': np.full(count, 120.0), 'wet': rng.uniform(100, 150, count)}
+        self.pressure_drop = {'dry': np.full(count, 2.5), 'wet': np.full(count, 13.8)}
+        self.flow_rate = {'dry': rng.uniform(0.05, 5, count), 'wet': rng.uniform(0.05, 5, count)}
+
+    def test_matches_scalar_compiler(self) -> None:
+        """Test that every column matches the per-point compiler."""
+        table = batch_result_compiler(
+            self.pressures, self.pressure_drop, self.enthalpy_matrices,
+            self.humidity_ratio_matrices, self.flow_rate
+        )
+        self.assertEqual(len(table), 50)
+        self.assertEqual(tuple(table.columns), RESULT_COLUMNS)
+
+        for index in range(len(table)):
+            results = result_compiler(
+                {side: self.pressures[side][index] for side in ('dry', 'wet')},
+                {side: self.pressure_drop[side][index] for side in ('dry', 'wet')},
+                {side: self.enthalpy_matrices[side][index] for side in ('dry', 'wet')},
+                {side: self.humidity_ratio_matrices[side][index] for side in ('dry', 'wet')},
+                {side: self.flow_rate[side][index] for side in ('dry', 'wet')},
+            )
+            self.assertEqual(table['DPAT'][index], results['DPAT'])
+            self.assertEqual(table['dew_point_dry_outlet'][index],
+                             results['dew_point']['dry']['outlet'])
+            self.assertEqual(table['water_recovery_ratio'][index],
+                             results['water_recovery_ratio'])
+            self.assertEqual(table.row(index).to_dict(), results.to_dict())
+
+        restacked = ResultTable.from_results(table.row(i) for i in range(len(table)))
+        np.testing.assert_array_equal(restacked['DPAT'], table['DPAT'])
+
+    def test_dew_point_without_humidity(self) -> None:
+        """Test that a scalar dew point rejects a humidity of zero, while arrays get NaN."""
+        with self.assertRaises(ValueError):
+            calculate_dew_point(80.0, 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dew_points = calculate_dew_point(np.array([80.0, 80.0]), np.array([50.0, 0.0]))
+        self.assertEqual(dew_points[0], calculate_dew_point(80.0, 50.0))
+        self.assertTrue(np.isnan(dew_points[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
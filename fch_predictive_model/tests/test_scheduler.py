@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from fch_predictive_model.service.scheduler import BATCH, INTERACTIVE, AdmissionScheduler, Rejected
+
+
+class TestScheduler(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the admission scheduler.
+    """
+
+    async def asyncSetUp(self) -> None:
+        """Set up a scheduler with one slot per lane and a job holding the regular slot."""
+        self.scheduler = AdmissionScheduler(max_concurrent=1, max_queue=2, max_per_client=2,
+                                            short_slots=1)
+        self.release = asyncio.Event()
+        self.order = []
+        self.blocker = asyncio.ensure_future(self.scheduler.run(self.job('blocker', self.release)))
+        await asyncio.sleep(0)
+
+    def job(self, name: str, event: asyncio.Event = None):
+        async def compute():
+            if event is not None:
+                await event.wait()
+            self.order.append(name)
+            return name
+        return compute
+
+    async def test_interactive_before_batch(self) -> None:
+        """Test that queued interactive jobs run before earlier batch jobs."""
+        batch = asyncio.ensure_future(self.scheduler.run(self.job('batch'), BATCH))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(self.scheduler.run(self.job('interactive'), INTERACTIVE))
+        await asyncio.sleep(0)
+        self.assertEqual(self.scheduler.metrics()['lanes']['regular']['queued'], 2)
+
+        self.release.set()
+        await asyncio.gather(self.blocker, batch, interactive)
+        self.assertEqual(self.order, ['blocker', 'interactive', 'batch'])
+
+    async def test_full_queue_rejected(self) -> None:
+        """Test that a job finding the queue full is rejected with 503 and Retry-After."""
+        queued = [asyncio.ensure_future(self.scheduler.run(self.job(f'queued {i}'))) for i in range(2)]
+        await asyncio.sleep(0)
+
+        with self.assertRaises(Rejected) as context:
+            await self.scheduler.run(self.job('rejected'))
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertGreaterEqual(context.exception.retry_after, 1)
+
+        self.release.set()
+        await asyncio.gather(self.blocker, *queued)
+        self.assertNotIn('rejected', self.order)
+
+    async def test_client_limit(self) -> None:
+        """Test that a client over its concurrency limit is rejected with 429."""
+        async with self.scheduler.client('a'), self.scheduler.client('a'):
+            with self.assertRaises(Rejected) as context:
+                async with self.scheduler.client('a'):
+                    pass
+            async with self.scheduler.client('b'):
+                pass
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertEqual(self.scheduler.metrics()['clients'], 0)
+        self.release.set()
+        await self.blocker
+
+    async def test_short_lane(self) -> None:
+        """Test that short jobs do not wait behind regular jobs."""
+        result = await asyncio.wait_for(self.scheduler.run(self.job('short'), short=True), 1)
+
+        self.assertEqual(result, 'short')
+        self.release.set()
+        await self.blocker
+        self.assertEqual(self.order, ['short', 'blocker'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import unittest
+from fch_predictive_model.core.sensitivity import (
+    SENSITIVITY_INPUTS, SENSITIVITY_OUTPUTS, compute_sensitivities, set_input
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestSensitivity(unittest.TestCase):
+    """
+    Unit tests for the finite-difference sensitivity report.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def test_set_input(self) -> None:
+        """Test that inputs are applied to the point or its configuration overlay."""
+        point = set_input(self.point, 'temperatures.wet', 85)
+        self.assertEqual(point['temperatures']['wet'], 85)
+        self.assertEqual(self.point['temperatures']['wet'], 80)
+
+        point = set_input(point, 'membrane_properties.mass_transfer_resistance', 60)
+        point = set_input(point, 'life_cycle_factor', 0.95)
+        self.assertEqual(point['config_overrides'], {
+            'membrane_properties': {'mass_transfer_resistance': 60},
+        })
+        self.assertEqual(point['life_cycle'], 0.95)
+
+    def test_jacobian(self) -> None:
+        """Test the shape and physical signs of the Jacobian."""
+        report = compute_sensitivities(self.point, config_path=CONFIG_PATH, max_workers=1)
+        jacobian = report['jacobian']
+
+        self.assertEqual(set(jacobian), set(SENSITIVITY_OUTPUTS))
+        self.assertEqual(set(jacobian['DPAT']), set(SENSITIVITY_INPUTS))
+        self.assertEqual(len(report['table']), len(SENSITIVITY_INPUTS) * len(SENSITIVITY_OUTPUTS))
+
+        # Degradation and a higher membrane resistance both raise the approach temperature
+        self.assertLess(jacobian['DPAT']['life_cycle_factor'], 0)
+        self.assertGreater(jacobian['DPAT']['membrane_properties.mass_transfer_resistance'], 0)
+        self.assertGreater(jacobian['relative_humidity_wet_outlet']['relative_humidities.wet'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from fch_predictive_model.core.model import FCHPerformanceModel
+from fch_predictive_model.core.solver_engines import (
+    SOLVER_ENGINES, EngineCostModel, engine_features, register_engine
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestSolverEngines(unittest.TestCase):
+    """
+    Unit tests for the solver engine registry and the automatic engine selection.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def _solve(self, engine: str = None, **kwargs) -> FCHPerformanceModel:
+        model = FCHPerformanceModel(**self.point, config_path=CONFIG_PATH, mesh_resolution=32, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            model.compile_results(engine=engine)
+        return model
+
+    def test_engines_agree(self) -> None:
+        """Test that every engine converges to the same outlet results and is recorded."""
+        results = {}
+        for engine in SOLVER_ENGINES:
+            model = self._solve(engine)
+            self.assertEqual(model.solver_info['engine'], engine)
+            self.assertGreater(model.solver_info['solve_seconds'], 0.0)
+            self.assertNotIn('predicted_seconds', model.solver_info)
+            results[engine] = model.compile_solution().to_dict()
+        self.assertEqual(results['active_set'], results['standard'])
+        self.assertEqual(self._solve(active_set=True).solver_info['engine'], 'active_set')
+
+    def test_auto(self) -> None:
+        """Test that automatic solves measure every engine and record their cost."""
+        with tempfile.TemporaryDirectory() as directory:
+            history_path = os.path.join(directory, 'engines.jsonl')
+            overrides = {'model_properties': {'solver_engine': 'auto', 'engine_history': history_path}}
+            engines = [self._solve(config_overrides=overrides).solver_info['engine']
+                       for _ in SOLVER_ENGINES]
+
+            self.assertEqual(sorted(engines), sorted(SOLVER_ENGINES))
+            with open(history_path, 'r') as history_file:
+                observations = [json.loads(line) for line in history_file]
+            self.assertEqual([observation['engine'] for observation in observations], engines)
+            self.assertTrue(all(observation['converged'] for observation in observations))
+            self.assertEqual(observations[0]['features']['mesh_cells'], 32 ** 2)
+
+    def test_cost_model(self) -> None:
+        """Test that the engine predicted fastest depends on the point and the history persists."""
+        with tempfile.TemporaryDirectory() as directory:
+            history_path = os.path.join(directory, 'engines.jsonl')
+            cost_model = EngineCostModel(history_path)
+            # The standard engine is cheaper on coarse meshes, the active set on fine ones
+            for mesh_size in (32, 64, 128, 256):
+                features = engine_features(mesh_size, self.point['mass_flow_rates'],
+                                           self.point['relative_humidities'], 1.0)
+                cost_model.record('standard', features, 1e-5 * mesh_size ** 2, 1000, True)
+                cost_model.record('active_set', features, 0.05 + 2e-6 * mesh_size ** 2, 1000, True)
+            cost_model.record('active_set', features, 1e-9, 10, False)
+
+            coarse = engine_features(40, self.point['mass_flow_rates'], self.point['relative_humidities'], 1.0)
+            fine = engine_features(200, self.point['mass_flow_rates'], self.point['relative_humidities'], 1.0)
+            self.assertEqual(cost_model.choose(coarse)[0], 'standard')
+            engine, predictions = cost_model.choose(fine)
+            self.assertEqual(engine, 'active_set')
+            self.assertLess(predictions['active_set'], predictions['standard'])
+
+            self.assertEqual(EngineCostModel(history_path).predict(fine), predictions)
+
+    def test_invalid_engine(self) -> None:
+        """Test that unknown and duplicate engine names are rejected."""
+        with self.assertRaises(ValueError):
+            FCHPerformanceModel(**self.point, config_path=CONFIG_PATH, solver_engine='multigrid')
+        with self.assertRaises(ValueError):
+            register_engine('standard', SOLVER_ENGINES['standard'])
+
+
+if __name__ == '__main__':
+    unittest.main()
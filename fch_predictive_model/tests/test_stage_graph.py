@@ -0,0 +1,120 @@
+import contextlib
+import io
+import os
+import unittest
+from fch_predictive_model.core.model import FCHPerformanceModel
+from fch_predictive_model.core.stage_graph import StageGraph
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestStageGraph(unittest.TestCase):
+    """
+    Unit tests for the cached model stages.
+    """
+
+    def setUp(self) -> None:
+        """Set up the base operating point."""
+        self.point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+
+    def _model(self, **kwargs) -> FCHPerformanceModel:
+        return FCHPerformanceModel(**{**self.point, **kwargs}, config_path=CONFIG_PATH, mesh_resolution=32)
+
+    def _compile(self, model: FCHPerformanceModel) -> dict:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return model.compile_results().to_dict()
+
+    def test_graph(self) -> None:
+        """Test that only the stages downstream of a changed value are recomputed."""
+        graph = StageGraph()
+        graph.add_input('a', 1)
+        graph.add_input('b', 10)
+        graph.add_stage('sign', lambda a: a > 0, ('a',))
+        graph.add_stage('total', lambda a, b: a + b, ('a', 'b'))
+        graph.add_stage('report', lambda sign, b: (sign, b), ('sign', 'b'))
+
+        self.assertEqual(graph.get('report'), (True, 10))
+        self.assertEqual(graph.get('total'), 11)
+        graph.set('a', 2)
+        self.assertEqual(graph.get('report'), (True, 10))
+        self.assertEqual(graph.get('total'), 12)
+        # The sign did not change, so the report was not recomputed
+        self.assertEqual(graph.evaluations, {'sign': 2, 'total': 2, 'report': 1})
+        graph.set('b', 20)
+        self.assertEqual(graph.get('report'), (True, 20))
+        self.assertEqual(graph.evaluations['sign'], 2)
+
+        with self.assertRaises(ValueError):
+            graph.add_stage('missing', lambda c: c, ('c',))
+
+    def test_pressure_drop_edit(self) -> None:
+        """Test that a new pressure drop coefficient recompiles the results without solving."""
+        overrides = {'pressure_drop_model': {'AX_100': {'dry': {'poly_coefficient': 0.002}}}}
+        model = self._model()
+        self._compile(model)
+        iterations = model.solver_info['iterations']
+        model.solver_info['iterations'] = None
+
+        model.config_overrides = overrides
+        results = self._compile(model)
+
+        self.assertIsNone(model.solver_info['iterations'])
+        self.assertEqual(model._graph.evaluations['solution'], 1)
+        self.assertEqual(model._graph.evaluations['solver_parameters'], 1)
+        reference = self._model(config_overrides=overrides)
+        self.assertEqual(results, self._compile(reference))
+        self.assertEqual(reference.solver_info['iterations'], iterations)
+
+    def test_inlet_edit(self) -> None:
+        """Test that new inlet conditions solve again, like a new model."""
+        model = self._model()
+        self._compile(model)
+
+        model.temperatures = {'dry': 60, 'wet': 80}
+        self.assertFalse(model._graph.get('solution')['solved'])
+        results = self._compile(model)
+
+        self.assertEqual(model._graph.evaluations['channel_parameters'], 1)
+        self.assertEqual(results, self._compile(self._model(temperatures={'dry': 60, 'wet': 80})))
+
+    def test_resume_reset(self) -> None:
+        """Test that an input edit discards a resumed state with the solution it belongs to."""
+        source = self._model()
+        model = self._model()
+        model.resume({'fields': source.get_fields(), 'iteration': 500, 'residual_history': []})
+        self.assertEqual(model.start_iteration, 500)
+        self.assertTrue(model._graph.get('solution')['warm_started'])
+
+        model.temperatures = {'dry': 60, 'wet': 80}
+
+        self.assertEqual(model.start_iteration, 0)
+        self.assertFalse(model._graph.get('solution')['warm_started'])
+        self._compile(model)
+        reference = self._model(temperatures={'dry': 60, 'wet': 80})
+        self._compile(reference)
+        self.assertEqual(model.solver_info['iterations'], reference.solver_info['iterations'])
+
+    def test_membrane_edit(self) -> None:
+        """Test that a membrane property only recomputes the stages that depend on it."""
+        model = self._model()
+        self._compile(model)
+
+        model.config_overrides = {'membrane_properties': {'mass_transfer_resistance': 60}}
+        results = self._compile(model)
+
+        evaluations = model._graph.evaluations
+        self.assertEqual((evaluations['model_parameters'], evaluations['channel_parameters'],
+                          evaluations['specific_volume'], evaluations['pressure_drop']), (1, 1, 1, 1))
+        self.assertEqual((evaluations['solver_parameters'], evaluations['solution']), (2, 2))
+        self.assertEqual(results, self._compile(
+            self._model(config_overrides={'membrane_properties': {'mass_transfer_resistance': 60}})))
+
+
+if __name__ == '__main__':
+    unittest.main()
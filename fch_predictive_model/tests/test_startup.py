@@ -0,0 +1,76 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from fch_predictive_model.service.warmup import warm_up
+from fch_predictive_model.utils.config_loader import load_config
+
+# Path to the test configuration file
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+# Wall-clock budget of importing the model and service modules in a fresh interpreter
+IMPORT_TIME_BUDGET = 2.0
+
+# Modules loaded only when results are written to Excel
+HEAVY_MODULES = ('pandas', 'openpyxl')
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import fch_predictive_model.core.model
+import fch_predictive_model.core.batch_runner
+import fch_predictive_model.service.result_store
+import fch_predictive_model.service.warmup
+duration = time.perf_counter() - start
+print(json.dumps({'duration': duration, 'modules': sorted(sys.modules)}))
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Unit tests for the import cost of the model and service modules.
+    """
+
+    def test_import_budget(self):
+        """Importing the model does not load pandas and stays within the time budget."""
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.run([sys.executable, '-c', _IMPORT_PROBE], cwd=root, check=True,
+                                capture_output=True, text=True).stdout
+        probe = json.loads(output.splitlines()[-1])
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, probe['modules'])
+        self.assertLess(probe['duration'], IMPORT_TIME_BUDGET)
+
+
+class TestWarmUp(unittest.TestCase):
+    """
+    Unit tests for the service warm-up and the configuration cache.
+    """
+
+    def test_warm_up(self):
+        """The warm-up solves every product model of the configuration."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = warm_up(CONFIG_PATH, mesh_resolution=8)
+
+        self.assertEqual(set(report), set(load_config(CONFIG_PATH)['channel_properties']))
+        for product_report in report.values():
+            self.assertEqual(product_report['mesh'], 8)
+            self.assertGreaterEqual(product_report['duration'], 0.0)
+
+    def test_cached_config_copies(self):
+        """Cached configurations are independent copies."""
+        config = load_config(CONFIG_PATH)
+        config['membrane_properties']['mass_transfer_resistance'] = 0
+
+        self.assertNotEqual(load_config(CONFIG_PATH)['membrane_properties']['mass_transfer_resistance'], 0)
+        overridden = load_config(CONFIG_PATH, {'membrane_properties': {'mass_transfer_resistance': 60}})
+        self.assertEqual(overridden['membrane_properties']['mass_transfer_resistance'], 60)
+        self.assertEqual(load_config(CONFIG_PATH)['membrane_properties']['mass_transfer_resistance'], 55)
+
+
+if __name__ == '__main__':
+    unittest.main()
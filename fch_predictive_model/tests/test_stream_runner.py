@@ -0,0 +1,92 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from fch_predictive_model.core.stream_runner import (
+    ERROR_COLUMN, POINT_COLUMN, read_points, solve_stream, write_results
+)
+from fch_predictive_model.scripts.solve_stream import main
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+CSV_POINTS = """product_model,layer_count,life_cycle,mass_flow_dry,mass_flow_wet,temp_dry,temp_wet,humidity_dry,humidity_wet,pressure_dry,pressure_wet
+AX_100,100,BOL,0.1,0.1,80,80,10,90,120,120
+AX_100,100,0.965,0.05,0.1,60,80,20,80,120,120
+AX_999,100,BOL,0.1,0.1,80,80,10,90,120,120
+AX_100,100,EOL,0.1,0.05,80,60,10,90,150,110
+"""
+
+
+class TestStreamRunner(unittest.TestCase):
+    """
+    Unit tests for the streaming command-line pipeline.
+    """
+
+    def test_read_points(self) -> None:
+        """Test that CSV rows and flat or nested NDJSON objects give the same points."""
+        points = list(read_points(io.StringIO(CSV_POINTS), 'csv'))
+
+        self.assertEqual(len(points), 4)
+        self.assertEqual(points[0]['temperatures'], {'dry': 80.0, 'wet': 80.0})
+        self.assertEqual(points[1]['life_cycle'], 0.965)
+        rows = list(csv.DictReader(io.StringIO(CSV_POINTS)))
+        lines = [json.dumps(rows[0]), '', json.dumps(points[1])]
+        self.assertEqual(list(read_points(lines, 'ndjson')), points[:2])
+
+        with self.assertRaises(ValueError):
+            list(read_points(io.StringIO("product_model,layer_count\nAX_100,100\n"), 'csv'))
+        with self.assertRaises(ValueError):
+            list(read_points(['{"product_model": "AX_100"}'], 'ndjson'))
+
+    def test_orders(self) -> None:
+        """Test that parallel streams give the in-process results in either order."""
+        points = list(read_points(io.StringIO(CSV_POINTS), 'csv'))
+        expected = list(solve_stream(points, CONFIG_PATH, max_workers=1))
+
+        self.assertEqual([index for index, _, _ in expected], [0, 1, 2, 3])
+        self.assertIsNotNone(expected[2][2])
+        self.assertEqual(list(solve_stream(iter(points), CONFIG_PATH, max_workers=2)), expected)
+        unordered = list(solve_stream(iter(points), CONFIG_PATH, max_workers=2, ordered=False))
+        self.assertEqual(sorted(unordered, key=lambda result: result[0]), expected)
+
+    def test_command(self) -> None:
+        """Test the command from a file to CSV and NDJSON output."""
+        with tempfile.TemporaryDirectory() as directory:
+            points_path = os.path.join(directory, 'points.csv')
+            with open(points_path, 'w') as points_file:
+                points_file.write(CSV_POINTS)
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+                status = main([points_path, '--config', CONFIG_PATH, '--workers', '1'])
+            self.assertEqual(status, 1)
+            rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+            self.assertEqual([row[POINT_COLUMN] for row in rows], ['0', '1', '2', '3'])
+            self.assertTrue(rows[2][ERROR_COLUMN])
+            self.assertFalse(rows[0][ERROR_COLUMN])
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+                main([points_path, '--config', CONFIG_PATH, '--workers', '1', '--output-format', 'ndjson'])
+            records = [json.loads(line) for line in output.getvalue().splitlines()]
+            self.assertEqual(float(rows[0]['DPAT']), records[0]['DPAT'])
+            self.assertEqual(set(records[2]), {POINT_COLUMN, ERROR_COLUMN})
+
+    def test_invalid_input(self) -> None:
+        """Test that invalid input writes no results and exits with status 2."""
+        output = io.StringIO()
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False) as points_file:
+            points_file.write('not json\n')
+        self.addCleanup(os.remove, points_file.name)
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main([points_file.name, '--config', CONFIG_PATH]), 2)
+        self.assertEqual(output.getvalue(), '')
+        with self.assertRaises(ValueError):
+            write_results([], io.StringIO(), 'xlsx')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import unittest
+import numpy as np
+from fch_predictive_model.core.uncertainty import StreamingStatistics, propagate_uncertainty
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestUncertainty(unittest.TestCase):
+    """
+    Unit tests for the Monte Carlo uncertainty propagation.
+    """
+
+    def test_streaming_statistics(self) -> None:
+        """Test the streaming moments and percentiles against NumPy."""
+        values = np.random.default_rng(0).normal(3, 2, 5000)
+        statistics = StreamingStatistics((5, 50, 95))
+        for value in values:
+            statistics.update(value)
+        summary = statistics.summary()
+
+        self.assertEqual(summary['count'], 5000)
+        self.assertAlmostEqual(summary['mean'], np.mean(values))
+        self.assertAlmostEqual(summary['std'], np.std(values, ddof=1))
+        for percentile, estimate in summary['percentiles'].items():
+            self.assertAlmostEqual(estimate, np.percentile(values, percentile), delta=0.1)
+        low, high = summary['mean_confidence_interval']
+        self.assertLess(low, 3)
+        self.assertGreater(high, 3)
+
+    def test_propagation(self) -> None:
+        """Test that sampled membrane and inlet uncertainties spread the outputs."""
+        point = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        uncertainties = {
+            'membrane_properties.mass_transfer_resistance': {'distribution': 'normal', 'std': 5},
+            'temperatures.wet': {'distribution': 'uniform', 'low': 78, 'high': 82},
+        }
+        summary = propagate_uncertainty(
+            point, uncertainties, samples=10, chunk_size=4, seed=1,
+            config_path=CONFIG_PATH, max_workers=1
+        )
+
+        self.assertEqual(summary['DPAT']['count'], 10)
+        self.assertGreater(summary['DPAT']['std'], 0)
+        self.assertLessEqual(summary['DPAT']['min'], summary['DPAT']['percentiles'][50])
+        self.assertGreater(summary['vapor_transport']['mean'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from fch_predictive_model.core.batch_runner import run_operating_point
+from fch_predictive_model.core.work_queue import (
+    claim_shard, create_queue, merge_results, queue_status, work
+)
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'test_config.yaml')
+
+
+class TestWorkQueue(unittest.TestCase):
+    """
+    Unit tests for the file-based sharded work queue.
+    """
+
+    def setUp(self) -> None:
+        """Set up a queue directory and operating points."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.queue_dir = os.path.join(directory.name, 'queue')
+        base = {
+            'product_model': 'AX_100', 'layer_count': 100, 'life_cycle': 'BOL',
+            'mass_flow_rates': {'dry': 0.1, 'wet': 0.1},
+            'temperatures': {'dry': 80, 'wet': 80},
+            'relative_humidities': {'dry': 10, 'wet': 90},
+            'pressures': {'dry': 120, 'wet': 120},
+        }
+        self.points = [{**base, 'mass_flow_rates': {'dry': flow, 'wet': 0.1}}
+                       for flow in (0.05, 0.08, 0.1, 0.12, 0.15)]
+
+    def test_claim_shard(self) -> None:
+        """Test that a lease is exclusive until it expires."""
+        create_queue(self.queue_dir, self.points, 2, CONFIG_PATH, lease_seconds=60)
+        lease_path = claim_shard(self.queue_dir, 0, 'a', 60)
+
+        self.assertIsNotNone(lease_path)
+        self.assertIsNone(claim_shard(self.queue_dir, 0, 'b', 60))
+        os.utime(lease_path, (time.time() - 120, time.time() - 120))
+        self.assertTrue(claim_shard(self.queue_dir, 0, 'b', 60).endswith('shard_00000.1.lease'))
+        self.assertIsNone(claim_shard(self.queue_dir, 0, 'c', 60))
+        with self.assertRaises(ValueError):
+            create_queue(self.queue_dir, self.points, 2, CONFIG_PATH)
+
+    def test_workers(self) -> None:
+        """Test several worker processes, a crashed worker and a worker still holding a lease."""
+        create_queue(self.queue_dir, self.points, 2, CONFIG_PATH, lease_seconds=2)
+        # A worker crashed long ago while solving shard 0; another one is solving shard 1
+        crashed = claim_shard(self.queue_dir, 0, 'crashed', 2)
+        os.utime(crashed, (time.time() - 60, time.time() - 60))
+        claim_shard(self.queue_dir, 1, 'stopping', 2)
+
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=work, args=(self.queue_dir, f'worker-{index}'),
+                                   kwargs={'wait': False}) for index in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(queue_status(self.queue_dir), {'shards': 3, 'done': 2, 'leased': 1, 'pending': 0})
+        with self.assertRaises(ValueError):
+            merge_results(self.queue_dir)
+
+        # The worker of shard 1 stops renewing its lease and the shard is taken over
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(work(self.queue_dir, 'late', poll_interval=0.2), 1)
+        results, errors = merge_results(self.queue_dir)
+
+        self.assertEqual(errors, {})
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = [run_operating_point(point, CONFIG_PATH)[0] for point in self.points]
+        self.assertEqual([result.to_record() for result in results],
+                         [result.to_record() for result in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
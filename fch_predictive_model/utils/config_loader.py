@@ -0,0 +1,53 @@
+import copy
+import os
+import yaml
+
+# Parsed configuration files by path, with the modification time and size they were read at
+_config_cache = {}
+
+
+def merge_config(config: dict, overrides: dict) -> dict:
+    """
+    Merges a (partial) configuration overlay into a configuration.
+
+    Nested dictionaries are merged key by key; any other value in `overrides`
+    replaces the value in `config`.
+
+    Parameters:
+    - config (dict): Base configuration.
+    - overrides (dict): Overlay with the same structure as the configuration file.
+
+    Returns:
+    - dict: New merged configuration; the inputs are not modified.
+    """
+    merged = copy.deepcopy(config)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_config(config_path: str, overrides: dict = None) -> dict:
+    """
+    Loads the YAML configuration file and applies an optional overlay.
+
+    The parsed file is cached until it changes on disk; every call returns its own
+    copy, so callers may modify the configuration.
+
+    Parameters:
+    - config_path (str): Path to the configuration YAML file.
+    - overrides (dict): Optional overlay, see `merge_config`.
+
+    Returns:
+    - dict: The configuration.
+    """
+    stat = os.stat(config_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(config_path)
+    if cached is None or cached[0] != signature:
+        with open(config_path, 'r') as config_file:
+            cached = (signature, yaml.safe_load(config_file))
+        _config_cache[config_path] = cached
+    return merge_config(cached[1], overrides)
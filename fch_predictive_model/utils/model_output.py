@@ -1,48 +1,52 @@
-import pandas as pd
+# Excel column headers and the result entry each one is read from
+EXCEL_COLUMNS = (
+    ('Mass Flow Dry Inlet (kg/s)', ('flow_rate', 'dry')),
+    ('Temperature Dry Inlet (°C)', ('temperature', 'dry', 'inlet')),
+    ('Pressure Dry Inlet (kPa)', ('pressure', 'dry', 'inlet')),
+    ('Relative Humidity Dry Inlet (%)', ('relative_humidity', 'dry', 'inlet')),
+    ('Absolute Humidity Dry Inlet (kg/kg_dry)', ('humidity_ratio', 'dry', 'inlet')),
+    ('Dew Point Dry Inlet (°C)', ('dew_point', 'dry', 'inlet')),
 
-def write_to_excel(results: dict, filename: str) -> None:
-    """
-    Writes the compiled results to an Excel file.
+    ('Temperature Dry Outlet (°C)', ('temperature', 'dry', 'outlet')),
+    ('Pressure Dry Outlet (kPa)', ('pressure', 'dry', 'outlet')),
+    ('Relative Humidity Dry Outlet (%)', ('relative_humidity', 'dry', 'outlet')),
+    ('Absolute Humidity Dry Outlet (kg/kg_dry)', ('humidity_ratio', 'dry', 'outlet')),
+    ('Dew Point Dry Outlet (°C)', ('dew_point', 'dry', 'outlet')),
 
-    Parameters:
-    - results (dict): Dictionary containing the compiled results from the model.
-    - filename (str): Name of the Excel file to write the results to.
-    """
-    # Prepare the data for the DataFrame
-    data = {
-        'Mass Flow Dry Inlet (kg/s)': [results['flow_rate']['dry']],
-        'Temperature Dry Inlet (°C)': [results['temperature']['dry']['inlet']],
-        'Pressure Dry Inlet (kPa)': [results['pressure']['dry']['inlet']],
-        'Relative Humidity Dry Inlet (%)': [results['relative_humidity']['dry']['inlet']],
-        'Absolute Humidity Dry Inlet (kg/kg_dry)': [results['humidity_ratio']['dry']['inlet']],
-        'Dew Point Dry Inlet (°C)': [results['dew_point']['dry']['inlet']],
-
-        'Temperature Dry Outlet (°C)': [results['temperature']['dry']['outlet']],
-        'Pressure Dry Outlet (kPa)': [results['pressure']['dry']['outlet']],
-        'Relative Humidity Dry Outlet (%)': [results['relative_humidity']['dry']['outlet']],
-        'Absolute Humidity Dry Outlet (kg/kg_dry)': [results['humidity_ratio']['dry']['outlet']],
-        'Dew Point Dry Outlet (°C)': [results['dew_point']['dry']['outlet']],
-
-        'Mass Flow Wet Inlet (kg/s)': [results['flow_rate']['wet']],
-        'Temperature Wet Inlet (°C)': [results['temperature']['wet']['inlet']],
-        'Pressure Wet Inlet (kPa)': [results['pressure']['wet']['inlet']],
-        'Relative Humidity Wet Inlet (%)': [results['relative_humidity']['wet']['inlet']],
-        'Absolute Humidity Wet Inlet (kg/kg_dry)': [results['humidity_ratio']['wet']['inlet']],
-        'Dew Point Wet Inlet (°C)': [results['dew_point']['wet']['inlet']],
-
-        'Temperature Wet Outlet (°C)': [results['temperature']['wet']['outlet']],
-        'Pressure Wet Outlet (kPa)': [results['pressure']['wet']['outlet']],
-        'Relative Humidity Wet Outlet (%)': [results['relative_humidity']['wet']['outlet']],
-        'Absolute Humidity Wet Outlet (kg/kg_dry)': [results['humidity_ratio']['wet']['outlet']],
-        'Dew Point Wet Outlet (°C)': [results['dew_point']['wet']['outlet']],
-
-        'Pressure Drop Dry (kPa)': [results['pressure_drop']['dry']],
-        'Pressure Drop Wet (kPa)': [results['pressure_drop']['wet']],
-        'DPAT (°C)': [results['DPAT']],
-        'Vapor Transport (kg/s)': [results['vapor_transport']],
-        'Water Recovery Ratio (%)': [results['water_recovery_ratio']],
-        'Max Pressure Differential (kPa)': [results['max__pressure_differential']],
-    }
+    ('Mass Flow Wet Inlet (kg/s)', ('flow_rate', 'wet')),
+    ('Temperature Wet Inlet (°C)', ('temperature', 'wet', 'inlet')),
+    ('Pressure Wet Inlet (kPa)', ('pressure', 'wet', 'inlet')),
+    ('Relative Humidity Wet Inlet (%)', ('relative_humidity', 'wet', 'inlet')),
+    ('Absolute Humidity Wet Inlet (kg/kg_dry)', ('humidity_ratio', 'wet', 'inlet')),
+    ('Dew Point Wet Inlet (°C)', ('dew_point', 'wet', 'inlet')),
+
+    ('Temperature Wet Outlet (°C)', ('temperature', 'wet', 'outlet')),
+    ('Pressure Wet Outlet (kPa)', ('pressure', 'wet', 'outlet')),
+    ('Relative Humidity Wet Outlet (%)', ('relative_humidity', 'wet', 'outlet')),
+    ('Absolute Humidity Wet Outlet (kg/kg_dry)', ('humidity_ratio', 'wet', 'outlet')),
+    ('Dew Point Wet Outlet (°C)', ('dew_point', 'wet', 'outlet')),
+
+    ('Pressure Drop Dry (kPa)', ('pressure_drop', 'dry')),
+    ('Pressure Drop Wet (kPa)', ('pressure_drop', 'wet')),
+    ('DPAT (°C)', ('DPAT',)),
+    ('Vapor Transport (kg/s)', ('vapor_transport',)),
+    ('Water Recovery Ratio (%)', ('water_recovery_ratio',)),
+    ('Max Pressure Differential (kPa)', ('max__pressure_differential',)),
+)
+
+# Excel column headers of pressure drop surfaces and the record entry each one is read from
+PRESSURE_DROP_EXCEL_COLUMNS = (
+    ('Product Model', 'product_model'),
+    ('Mass Flow (kg/s)', 'flow_rate'),
+    ('Layer Count', 'layer_count'),
+    ('Pressure Drop Dry (kPa)', 'pressure_drop_dry'),
+    ('Pressure Drop Wet (kPa)', 'pressure_drop_wet'),
+)
+
+
+def _write_data(data: dict, filename: str) -> None:
+    # pandas (and its Excel writer) is only imported once results are written
+    import pandas as pd
 
     # Create a DataFrame
     df = pd.DataFrame(data)
@@ -53,3 +57,48 @@ def write_to_excel(results: dict, filename: str) -> None:
         print(f"Results have been successfully written to {filename}")
     except Exception as e:
         print(f"Failed to write results to {filename}: {e}")
+
+
+def write_to_excel(results: dict, filename: str) -> None:
+    """
+    Writes the compiled results to an Excel file.
+
+    Parameters:
+    - results (dict): Dictionary containing the compiled results from the model.
+    - filename (str): Name of the Excel file to write the results to.
+    """
+    # Prepare the data for the DataFrame
+    data = {}
+    for header, path in EXCEL_COLUMNS:
+        value = results
+        for key in path:
+            value = value[key]
+        data[header] = [value]
+
+    _write_data(data, filename)
+
+
+def write_table_to_excel(table, filename: str) -> None:
+    """
+    Writes a ResultTable to an Excel file, one row per operating point.
+
+    Parameters:
+    - table (ResultTable): Column-oriented results of several operating points.
+    - filename (str): Name of the Excel file to write the results to.
+    """
+    data = {header: table['_'.join(path)] for header, path in EXCEL_COLUMNS}
+
+    _write_data(data, filename)
+
+
+def write_pressure_drop_to_excel(records: list, filename: str) -> None:
+    """
+    Writes a pressure drop surface to an Excel file, one row per product, flow rate and layer count.
+
+    Parameters:
+    - records (list): Rows as returned by `pressure_drop_calculator.pressure_drop_records`.
+    - filename (str): Name of the Excel file to write the surface to.
+    """
+    data = {header: [record[key] for record in records] for header, key in PRESSURE_DROP_EXCEL_COLUMNS}
+
+    _write_data(data, filename)
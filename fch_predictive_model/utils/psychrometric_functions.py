@@ -166,15 +166,21 @@ def calculate_dew_point(T: float, RH: float) -> float:
     Calculate dew point temperature (DP) in degrees Celsius.
 
     Parameters:
-    T  : Temperature in degrees Celsius
-    RH : Relative humidity in percent
+    T  : Temperature in degrees Celsius, a number or an array
+    RH : Relative humidity in percent, a number or an array
 
     Returns:
-    DP : Dew point temperature in degrees Celsius
+    DP : Dew point temperature in degrees Celsius; for arrays, NaN where RH <= 0
+
+    Raises:
+    ValueError: If a scalar RH is not positive.
     """
     C0 = 243.12
     C1 = 17.62
-    term1 = math.log(RH / 100) + (C1 * T) / (C0 + T)
+    if np.ndim(T) == 0 and np.ndim(RH) == 0:
+        term1 = math.log(RH / 100) + (C1 * T) / (C0 + T)
+    else:
+        term1 = np.log(np.divide(RH, 100)) + (C1 * T) / (C0 + T)
     return C0 * term1 / (C1 - term1)
 
 
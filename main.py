@@ -1,9 +1,119 @@
-from fastapi import FastAPI, HTTPException, Form, Request
-from fastapi.responses import HTMLResponse
+import asyncio
+import hashlib
+import math
+import os
+from contextlib import asynccontextmanager
+import numpy as np
+from fastapi import Body, FastAPI, HTTPException, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
-from fch_predictive_model.core.model import FCHPerformanceModel  # Adjusted import
+from fch_predictive_model.core.batch_runner import (
+    CONFIG_OVERRIDES_KEY, OPERATING_POINT_KEYS, operating_point_key
+)
+from fch_predictive_model.core.cancellation import CancellationToken
+from fch_predictive_model.core.grid_study import with_mesh_resolution
+from fch_predictive_model.core.model import (  # Adjusted import
+    DEFAULT_CONFIG_PATH, FCHPerformanceModel, normalize_product_model
+)
+from fch_predictive_model.core.pressure_drop_calculator import pressure_drop_surface
+from fch_predictive_model.service.coalescing import Abandoned, SingleFlight
+from fch_predictive_model.service.result_store import ResultStore
+from fch_predictive_model.service.scheduler import (
+    BATCH, INTERACTIVE, AdmissionScheduler, Rejected
+)
+from fch_predictive_model.service.warmup import warm_up
+from fch_predictive_model.utils.config_loader import load_config
 
-app = FastAPI()
+
+def config_fingerprint() -> str:
+    """
+    Fingerprint of the configuration content, recomputed when the file changes on disk,
+    like the configuration reloaded by `load_config`.
+
+    Returns:
+    str: Hash prefix of the configuration file.
+
+    Raises:
+    FileNotFoundError: If the configuration file does not exist.
+    """
+    stat = os.stat(CONFIG_PATH)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if _config_fingerprint['signature'] != signature:
+        with open(CONFIG_PATH, 'rb') as config_file:
+            fingerprint = hashlib.sha256(config_file.read()).hexdigest()[:16]
+        _config_fingerprint.update(signature=signature, fingerprint=fingerprint)
+    return _config_fingerprint['fingerprint']
+
+
+async def run_warm_up():
+    """
+    Warm the service up in a worker thread and record the outcome for /ready.
+    """
+    try:
+        readiness['warm_up'] = await run_in_threadpool(warm_up, CONFIG_PATH, ESTIMATE_MESH_RESOLUTION)
+        readiness['ready'] = True
+    except Exception as e:
+        readiness['error'] = str(e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start the warm-up when the server starts; requests are served meanwhile, but
+    /ready reports the service as not ready until the warm-up has finished.
+    """
+    task = asyncio.create_task(run_warm_up())
+    yield
+    task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# Outcome of the startup warm-up, see `warm_up`
+readiness = {'ready': False, 'warm_up': None, 'error': None}
+
+# Model configuration, by default the one shipped with the package; set FCH_CONFIG_PATH
+# to serve another. Its content is part of every result key
+CONFIG_PATH = os.environ.get('FCH_CONFIG_PATH') or DEFAULT_CONFIG_PATH
+
+# Fingerprint of the configuration with the modification time and size it was computed at
+_config_fingerprint = {'signature': None, 'fingerprint': ''}
+
+# Result store shared by all uvicorn workers; set FCH_RESULT_STORE to '' to disable it
+RESULT_STORE_PATH = os.environ.get('FCH_RESULT_STORE', 'fch_results.sqlite')
+result_store = ResultStore(
+    RESULT_STORE_PATH,
+    max_entries=int(os.environ.get('FCH_RESULT_STORE_ENTRIES', 10000)),
+    max_bytes=int(os.environ.get('FCH_RESULT_STORE_MB', 256)) * 2 ** 20,
+) if RESULT_STORE_PATH else None
+
+# Identical requests in flight at the same time share one solve
+single_flight = SingleFlight()
+
+# Admission control: concurrent solves, queue lengths and outstanding requests per client
+scheduler = AdmissionScheduler(
+    max_concurrent=int(os.environ.get('FCH_MAX_CONCURRENT_SOLVES', os.cpu_count() or 1)),
+    max_queue=int(os.environ.get('FCH_MAX_QUEUED_SOLVES', 16)),
+    max_per_client=int(os.environ.get('FCH_MAX_REQUESTS_PER_CLIENT', 4)),
+    short_slots=int(os.environ.get('FCH_SHORT_JOB_SLOTS', 1)),
+)
+
+# Mesh resolution of fast-estimate requests, which run in the short-job lane
+ESTIMATE_MESH_RESOLUTION = 12
+
+# Wall-clock budget of one model solve in seconds; a solve running out of time
+# returns its partial, unconverged result
+SOLVE_TIME_BUDGET = float(os.environ.get('FCH_SOLVE_TIME_BUDGET', 60))
+
+# Seconds between checks whether the client is still connected
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# Status of a request abandoned by the client (nginx convention)
+CLIENT_CLOSED_REQUEST = 499
+
+# Largest pressure drop surface (products x sides x flow rates x layer counts) served per request
+MAX_PRESSURE_DROP_VALUES = 10 ** 6
 
 # Set up Jinja2 templates (adjusted path for Docker)
 templates = Jinja2Templates(directory="templates")
@@ -20,11 +130,147 @@ def read_root(request: Request):
     Returns:
     HTMLResponse: The HTML content for the root page.
     """
-    return templates.TemplateResponse("index.html", {"request": request})
+    return templates.TemplateResponse(request, "index.html")
+
+
+@app.get("/ready")
+def ready():
+    """
+    Report whether the startup warm-up has finished, for readiness probes.
+
+    Returns:
+    Response: 200 with the warm-up report once ready, otherwise 503.
+    """
+    if not readiness['ready']:
+        return JSONResponse(readiness, status_code=503)
+    return readiness
+
+
+@app.get("/metrics")
+def metrics():
+    """
+    Report the service metrics.
+
+    Returns:
+    dict: Request coalescing counters, see `SingleFlight.metrics`, the admission
+    scheduler state, see `AdmissionScheduler.metrics`, and the shared result store
+    counters, see `ResultStore.metrics`.
+    """
+    return {
+        'coalescing': single_flight.metrics(),
+        'scheduler': scheduler.metrics(),
+        'result_store': result_store.metrics() if result_store else None,
+    }
+
+
+async def wait_for_disconnect(request: Request):
+    """
+    Returns once the client of a request has disconnected.
+
+    Parameters:
+    request (Request): The request to watch.
+    """
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+
+def solve_model(point: dict, key: str, cancel_token: CancellationToken) -> tuple:
+    """
+    Solve one operating point within the solve time budget.
+
+    A solve stopped early by an earlier request resumes from the solver state in
+    the result store, and every outcome is stored for the other workers.
+
+    Parameters:
+    point (dict): Operating point with the FCHPerformanceModel arguments.
+    key (str): Result store key of the operating point.
+    cancel_token (CancellationToken): Token stopping the solve early.
+
+    Returns:
+    tuple: The compiled results and the solver information.
+    """
+    model = FCHPerformanceModel(
+        point['product_model'],
+        point['layer_count'],
+        point['life_cycle'],
+        point['mass_flow_rates'],
+        point['temperatures'],
+        point['relative_humidities'],
+        point['pressures'],
+        config_path=CONFIG_PATH,
+        config_overrides=point.get(CONFIG_OVERRIDES_KEY)
+    )
+    state = result_store.get_state(key) if result_store else None
+    if state is not None:
+        model.resume(state)
+
+    results = model.compile_results(SOLVE_TIME_BUDGET, cancel_token)
+    solver_info = model.solver_info
+
+    if result_store:
+        state = {
+            'fields': model.get_fields(),
+            'iteration': solver_info['iterations'],
+            'convergence_error': solver_info['convergence_error'],
+            'residual_history': solver_info['residual_history'],
+        }
+        result_store.put(key, results if solver_info['converged'] else None, solver_info, state)
+    return results, solver_info
+
+
+async def compute_results(request: Request, point: dict, priority: int, estimate: bool) -> tuple:
+    """
+    Solve an operating point through the shared result store, admission control and
+    request coalescing.
+
+    Parameters:
+    request (Request): The request asking for the results.
+    point (dict): Operating point with the FCHPerformanceModel arguments.
+    priority (int): Priority class, INTERACTIVE or BATCH.
+    estimate (bool): Solve a fast estimate on a coarse mesh in the short-job lane.
+
+    Returns:
+    tuple: The compiled results and the solver information.
+
+    Raises:
+    Rejected: If the client has too many requests or the service is saturated.
+    Abandoned: If the client disconnected before the results were ready.
+    """
+    if estimate:
+        point = with_mesh_resolution(point, ESTIMATE_MESH_RESOLUTION)
+    key = f'{config_fingerprint()}:{operating_point_key(point)}'
+    if result_store:
+        stored = await run_in_threadpool(result_store.get, key)
+        if stored is not None:
+            return stored
+
+    client_id = request.headers.get('X-Client-ID') or (request.client.host if request.client else '')
+    async with scheduler.client(client_id):
+        # Compile the results, or await those of an identical request in flight
+        return await single_flight.run(
+            key,
+            lambda cancel_token: scheduler.run(
+                lambda: run_in_threadpool(solve_model, point, key, cancel_token), priority, estimate),
+            wait_for_disconnect(request)
+        )
+
+
+def rejection_response(rejection: Rejected) -> Response:
+    """
+    Build the response to a request rejected by admission control.
+
+    Parameters:
+    rejection (Rejected): The rejection.
+
+    Returns:
+    Response: 429 or 503 response with a Retry-After header.
+    """
+    return Response(content=str(rejection), status_code=rejection.status_code,
+                    headers={'Retry-After': str(rejection.retry_after)})
 
 
 @app.post("/run_model/", response_class=HTMLResponse)
-def run_model(
+async def run_model(
     request: Request,
     product_model: str = Form(...),
     layer_count: int = Form(...),
@@ -36,10 +282,16 @@ def run_model(
     humidity_dry: int = Form(...),
     humidity_wet: int = Form(...),
     pressure_dry: int = Form(...),
-    pressure_wet: int = Form(...)
+    pressure_wet: int = Form(...),
+    estimate: bool = Form(False)
 ):
     """
     Run the FCH Performance Model with the provided inputs and return results.
+
+    The solve runs in a worker thread once admitted by the scheduler, with
+    interactive priority, and is shared by all identical requests in flight. It
+    stops early when every waiting client has disconnected or the solve time budget
+    expires; in the latter case the partial results are returned with a warning.
     
     Parameters:
     request (Request): The request object containing client request data.
@@ -54,37 +306,153 @@ def run_model(
     humidity_wet (int): Relative humidity on the wet side in percent.
     pressure_dry (int): Pressure on the dry side in kPa.
     pressure_wet (int): Pressure on the wet side in kPa.
+    estimate (bool): Return a fast estimate solved on a coarse mesh.
     
     Returns:
-    HTMLResponse: The HTML content with the model results included.
+    HTMLResponse: The HTML content with the model results included, or a 429/503
+    response with Retry-After when the request is not admitted.
     
     Raises:
     HTTPException: If an error occurs during model execution.
     """
+    # Prepare the input data
+    point = {
+        'product_model': product_model,
+        'layer_count': layer_count,
+        'life_cycle': life_cycle,
+        'mass_flow_rates': {'dry': mass_flow_dry, 'wet': mass_flow_wet},
+        'temperatures': {'dry': temp_dry, 'wet': temp_wet},
+        'relative_humidities': {'dry': humidity_dry, 'wet': humidity_wet},
+        'pressures': {'dry': pressure_dry, 'wet': pressure_wet},
+    }
+
     try:
-        # Prepare the input data
-        mass_flow_rates = {'dry': mass_flow_dry, 'wet': mass_flow_wet}
-        temperatures = {'dry': temp_dry, 'wet': temp_wet}
-        relative_humidities = {'dry': humidity_dry, 'wet': humidity_wet}
-        pressures = {'dry': pressure_dry, 'wet': pressure_wet}
-
-        # Instantiate the model with input data
-        model = FCHPerformanceModel(
-            product_model,
-            layer_count,
-            life_cycle,
-            mass_flow_rates,
-            temperatures,
-            relative_humidities,
-            pressures
-        )
+        results, solver_info = await compute_results(request, point, INTERACTIVE, estimate)
 
-        # Compile the results
-        results = model.compile_results()
+    except Rejected as rejection:
+        return rejection_response(rejection)
 
-        # Render the template with the results
-        return templates.TemplateResponse("index.html", {"request": request, "results": results})
+    except Abandoned:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
 
     except Exception as e:
         # Raise an HTTP exception with the error details
         raise HTTPException(status_code=500, detail=str(e))
+
+    # Render the template with the results
+    return templates.TemplateResponse(
+        request, "index.html", {"results": results, "solver_info": solver_info})
+
+
+@app.post("/api/run_model")
+async def run_model_api(request: Request, point: dict = Body(...)):
+    """
+    Run the FCH Performance Model for a batch client and return the results as JSON.
+
+    Batch requests are scheduled behind interactive ones.
+
+    Parameters:
+    request (Request): The request object containing client request data.
+    point (dict): Operating point with 'product_model', 'layer_count', 'life_cycle',
+    'mass_flow_rates', 'temperatures', 'relative_humidities' and 'pressures', and
+    optionally 'estimate' for a fast estimate on a coarse mesh.
+
+    Returns:
+    dict: The 'results' and the 'solver_info' ('converged', 'stop_reason',
+    'iterations', 'convergence_error').
+
+    Raises:
+    HTTPException: If the operating point is incomplete or the model fails.
+    """
+    missing = [key for key in OPERATING_POINT_KEYS if key not in point]
+    if missing:
+        raise HTTPException(status_code=422, detail=f"Missing operating point entries: {missing}")
+    estimate = bool(point.get('estimate', False))
+    point = {key: point[key] for key in OPERATING_POINT_KEYS}
+
+    try:
+        results, solver_info = await compute_results(request, point, BATCH, estimate)
+
+    except Rejected as rejection:
+        return rejection_response(rejection)
+
+    except Abandoned:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        'results': results.to_dict(),
+        'solver_info': {
+            key: solver_info.get(key)
+            for key in ('converged', 'stop_reason', 'iterations', 'convergence_error')
+        },
+    }
+
+
+def _positive_numbers(request: dict, key: str) -> list:
+    """
+    Read a request entry that must be a non-empty list of positive, finite numbers.
+
+    Raises:
+    HTTPException: If the entry is missing or not such a list.
+    """
+    values = request.get(key)
+    if (not isinstance(values, list) or not values or not all(
+            isinstance(value, (int, float)) and not isinstance(value, bool) and
+            math.isfinite(value) and value > 0 for value in values)):
+        raise HTTPException(status_code=422, detail=f"'{key}' must be a non-empty list of positive numbers")
+    return values
+
+
+@app.post("/api/pressure_drop")
+def pressure_drop_api(request: dict = Body(...)):
+    """
+    Evaluate the pressure drop over every combination of flow rate, layer count and product.
+
+    The surface is computed from the pressure drop model alone, without solving.
+
+    Parameters:
+    request (dict): 'flow_rates' (kg/s, applied to both sides) and 'layer_counts' lists,
+    optionally the 'product_models' (default: all configured) and 'rounded' to round
+    like the model results (default: exact values).
+
+    Returns:
+    dict: The 'product_models', 'flow_rates' and 'layer_counts' spanning the surface and
+    the 'pressure_drop' in kPa as {product: {side: [[value per layer count] per flow rate]}}.
+
+    Raises:
+    HTTPException: If the request is incomplete, too large or names an unknown product.
+    """
+    flow_rates = _positive_numbers(request, 'flow_rates')
+    layer_counts = _positive_numbers(request, 'layer_counts')
+    product_models = request.get('product_models')
+    if product_models is not None:
+        if (not isinstance(product_models, list) or not product_models or
+                not all(isinstance(product, str) for product in product_models)):
+            raise HTTPException(status_code=422, detail="'product_models' must be a non-empty list of names")
+        product_models = [normalize_product_model(product) for product in product_models]
+    pressure_drop_model = load_config(CONFIG_PATH)['pressure_drop_model']
+    size = len(product_models or pressure_drop_model) * 2 * len(flow_rates) * len(layer_counts)
+    if size > MAX_PRESSURE_DROP_VALUES:
+        raise HTTPException(
+            status_code=422, detail=f"Surface of {size} values exceeds {MAX_PRESSURE_DROP_VALUES}")
+
+    try:
+        surface = pressure_drop_surface(flow_rates, layer_counts, pressure_drop_model, product_models,
+                                        bool(request.get('rounded', False)))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not np.all(np.isfinite(surface['pressure_drop'])):
+        raise HTTPException(status_code=422, detail="Pressure drop out of range for the given inputs")
+
+    return {
+        'product_models': surface['product_models'],
+        'flow_rates': surface['flow_rates'].tolist(),
+        'layer_counts': surface['layer_counts'].tolist(),
+        'pressure_drop': {
+            product: {side: surface['pressure_drop'][p, s].tolist() for s, side in enumerate(surface['sides'])}
+            for p, product in enumerate(surface['product_models'])
+        },
+    }
@@ -1,4 +1,4 @@
-from fch_predictive_model.core.model import FCHPerformanceModel
+from fch_predictive_model.core.model import DEFAULT_CONFIG_PATH, FCHPerformanceModel
 
 # Define model parameters
 product_model = "Ax150"  # Model name/identifier
@@ -27,7 +27,7 @@ pressures = {
 model = FCHPerformanceModel(
     product_model, layer_count, life_cycle,
     mass_flow_rates, temperatures,
-    relative_humidities, pressures
+    relative_humidities, pressures, config_path=DEFAULT_CONFIG_PATH
 )
 
 # Compile the results